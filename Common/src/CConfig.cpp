@@ -2691,6 +2691,9 @@ void CConfig::SetConfig_Options() {
   /* DESCRIPTION: Number of zones of the problem */
   addPythonOption("NZONES");
 
+  /* DESCRIPTION: Handoff of time accurate solutions between the python evaluations (NO, FOLDER, PACK) */
+  addPythonOption("SERIES_HANDOFF");
+
   /* DESCRIPTION: ParMETIS load balancing tolerance */
   addDoubleOption("PARMETIS_TOLERANCE", ParMETIS_tolerance, 0.02);
 
@@ -583,6 +583,35 @@ public:
    */
   passivedouble SetVertexVarCoord(unsigned short iMarker, unsigned long iVertex);
 
+  /*!
+   * \brief Get the global indices of all the vertices (halo nodes included) of a specified marker.
+   * \param[in] iMarker - Marker identifier.
+   * \return Global index of each vertex.
+   */
+  vector<unsigned long> GetVertexGlobalIndices(unsigned short iMarker);
+
+  /*!
+   * \brief Get the coordinates of all the vertices (halo nodes included) of a specified marker.
+   * \param[in] iMarker - Marker identifier.
+   * \return Coordinates (x, y, z) of each vertex, one after the other, z is 0 in 2D.
+   */
+  vector<passivedouble> GetVertexCoords(unsigned short iMarker);
+
+  /*!
+   * \brief Compute the force (pressure and shear stress) at all the vertices of a specified marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] density - Get the force density instead of the force.
+   * \return Components (x, y, z) of the force at each vertex, one after the other, 0 at the halo nodes.
+   */
+  vector<passivedouble> GetVertexForces(unsigned short iMarker, bool density);
+
+  /*!
+   * \brief Set the new coordinates of all the vertices of a specified marker and their VarCoord.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] newCoords - New coordinates (x, y, z) of each vertex, one after the other.
+   */
+  void SetVertexVarCoords(unsigned short iMarker, const vector<passivedouble>& newCoords);
+
   /*!
    * \brief Get the temperature at a vertex on a specified marker.
    * \param[in] iMarker - Marker identifier.
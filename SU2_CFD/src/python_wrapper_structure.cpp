@@ -508,6 +508,80 @@ passivedouble CDriver::SetVertexVarCoord(unsigned short iMarker, unsigned long i
 
 }
 
+vector<unsigned long> CDriver::GetVertexGlobalIndices(unsigned short iMarker) {
+
+  unsigned long iVertex, iPoint;
+  CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  vector<unsigned long> GlobalIndices(geometry->nVertex[iMarker]);
+
+  for (iVertex = 0; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    GlobalIndices[iVertex] = geometry->nodes->GetGlobalIndex(iPoint);
+  }
+
+  return GlobalIndices;
+
+}
+
+vector<passivedouble> CDriver::GetVertexCoords(unsigned short iMarker) {
+
+  unsigned long iVertex, iPoint;
+  unsigned short iDim;
+  su2double *Coord;
+  CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  vector<passivedouble> Coords(3*geometry->nVertex[iMarker], 0.0);
+
+  for (iVertex = 0; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    Coord = geometry->nodes->GetCoord(iPoint);
+    for (iDim = 0; iDim < nDim; iDim++)
+      Coords[3*iVertex+iDim] = SU2_TYPE::GetValue(Coord[iDim]);
+  }
+
+  return Coords;
+
+}
+
+vector<passivedouble> CDriver::GetVertexForces(unsigned short iMarker, bool density) {
+
+  unsigned long iVertex;
+  unsigned short iDim;
+  bool halo;
+  unsigned long nVertex = geometry_container[ZONE_0][INST_0][MESH_0]->nVertex[iMarker];
+  vector<passivedouble> Forces(3*nVertex, 0.0);
+
+  for (iVertex = 0; iVertex < nVertex; iVertex++) {
+    /*--- Halo nodes introduce non physical forces, they are left to 0 ---*/
+    halo = ComputeVertexForces(iMarker, iVertex);
+    if (halo) continue;
+    for (iDim = 0; iDim < nDim; iDim++) {
+      if (density) Forces[3*iVertex+iDim] = SU2_TYPE::GetValue(PyWrapNodalForceDensity[iDim]);
+      else Forces[3*iVertex+iDim] = SU2_TYPE::GetValue(PyWrapNodalForce[iDim]);
+    }
+  }
+
+  return Forces;
+
+}
+
+void CDriver::SetVertexVarCoords(unsigned short iMarker, const vector<passivedouble>& newCoords) {
+
+  unsigned long iVertex, iPoint;
+  unsigned short iDim;
+  su2double *Coord;
+  CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+
+  for (iVertex = 0; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    Coord = geometry->nodes->GetCoord(iPoint);
+    PyWrapVarCoord[2] = 0.0;
+    for (iDim = 0; iDim < nDim; iDim++)
+      PyWrapVarCoord[iDim] = newCoords[3*iVertex+iDim] - Coord[iDim];
+    geometry->vertex[iMarker][iVertex]->SetVarCoord(PyWrapVarCoord);
+  }
+
+}
+
 passivedouble CDriver::GetVertexTemperature(unsigned short iMarker, unsigned long iVertex){
 
   unsigned long iPoint;
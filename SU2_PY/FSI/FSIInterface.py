@@ -30,12 +30,14 @@
 # ----------------------------------------------------------------------
 
 import os, sys, shutil, copy
+from itertools import chain
 import numpy as np
 import scipy as sp
 import scipy.spatial.distance as spdist
 from math import *
-from rtree import index
+from scipy.spatial import cKDTree
 from petsc4py import PETSc
+from .io import FSIHistoryWriter
 
 # ----------------------------------------------------------------------
 #  FSI Interface Class
@@ -82,10 +84,15 @@ class Interface:
         self.fluidGlobalIndexRange = {}			#contains the global FSI indexing of each fluid interface node for all partitions
         self.solidGlobalIndexRange = {}			#contains the global FSI indexing of each solid interface node for all partitions
 
-        self.FluidHaloNodeList = {}			#contains the the indices (fluid solver indexing) of the halo nodes for each partition
-        self.fluidIndexing = {}				#links between the fluid solver indexing and the FSI indexing for the interface nodes
-        self.SolidHaloNodeList = {}			#contains the the indices (solid solver indexing) of the halo nodes for each partition
-        self.solidIndexing = {}				#links between the solid solver indexing and the FSI indexing for the interface nodes
+        self.FluidHaloNodeList = []			#contains the the indices (fluid solver indexing) of the halo nodes for each partition, one array per partition
+        self.fluidIndexing = None			#links between the fluid solver indexing and the FSI indexing for the interface nodes, (2, nNodes) array sorted by fluid solver index
+        self.SolidHaloNodeList = []			#contains the the indices (solid solver indexing) of the halo nodes for each partition, one array per partition
+        self.solidIndexing = None			#links between the solid solver indexing and the FSI indexing for the interface nodes, (2, nNodes) array sorted by solid solver index
+
+        self.localFluidInterfaceHalo = None		#halo flag of each fluid interface node (halo nodes included), on each partition
+        self.localSolidInterfaceHalo = None		#halo flag of each solid interface node (halo nodes included), on each partition
+        self.localFluidInterfaceGlobalIndex = None	#FSI indexing of the physical fluid interface nodes, on each partition
+        self.localSolidInterfaceGlobalIndex = None	#FSI indexing of the physical solid interface nodes, on each partition
 
 	self.nLocalFluidInterfaceNodes = 0		#number of nodes (halo nodes included) on the fluid interface, on each partition
         self.nLocalFluidInterfaceHaloNode = 0		#number of halo nodes on the fluid intrface, on each partition
@@ -104,45 +111,45 @@ class Interface:
           self.MappingMatrixA_T = None
           self.MappingMatrixB = None
           self.MappingMatrixB_T = None
+          self.KSP_solver = None			#persistent linear solvers of the interpolation systems (matrix A and its transpose)
+          self.KSP_solver_T = None
           self.d_RBF = self.nDim+1
         else:
           self.MappingMatrix = None			#interpolation/mapping matrix for meshes interpolation/mapping
           self.MappingMatrix_T = None			#transposed interpolation/mapping matrix for meshes interpolation/mapping
           self.d_RBF = 0
 
-        self.localFluidInterface_array_X_init = None	#initial fluid interface position on each partition (used for the meshes mapping)
-        self.localFluidInterface_array_Y_init = None
-        self.localFluidInterface_array_Z_init = None
-
-        self.haloNodesPositionsInit = {}		#initial position of the halo nodes (fluid side only)
+        self.localFluidInterface_array_init = None	#initial fluid interface position on each partition, (nNodes, 3) array (used for the meshes mapping)
 
-        self.solidInterface_array_DispX = None		#solid interface displacement
-        self.solidInterface_array_DispY = None
-        self.solidInterface_array_DispZ = None
+        self.haloNodesPositionsInit = None		#initial position of the halo nodes (fluid side only), (nHaloNodes, 3) array
+        self.haloNodesDisplacements = None		#displacement of the halo nodes (fluid side only), (nHaloNodes, 3) array
 
-        self.solidInterfaceResidual_array_X = None	#solid interface position residual
-        self.solidInterfaceResidual_array_Y = None
-        self.solidInterfaceResidual_array_Z = None
+        self.solidSpatialTrees = {}			#spatial indexing of the solid interface nodes received from each partition (used for the meshes mapping)
+        self.mappingEntries = {}			#batches of (rows, columns, values) entries of the mapping matrices, inserted at assembly
 
-        self.solidInterfaceResidualnM1_array_X = None	#solid interface position residual at the previous BGS iteration
-        self.solidInterfaceResidualnM1_array_Y = None
-        self.solidInterfaceResidualnM1_array_Z = None
-       
-        self.fluidInterface_array_DispX = None		#fluid interface displacement
-        self.fluidInterface_array_DispY = None
-        self.fluidInterface_array_DispZ = None
+        # PETSc vectors of the interface quantities, with the X, Y and Z components interleaved (block size 3)
+        self.solidInterface_array_Disp = None		#solid interface displacement
+        self.solidInterfaceResidual_array = None	#solid interface position residual
+        self.solidInterfaceResidualnM1_array = None	#solid interface position residual at the previous BGS iteration
 
-        self.fluidLoads_array_X = None			#loads on the fluid side of the f/s interface
-        self.fluidLoads_array_Y = None
-        self.fluidLoads_array_Z = None
+        self.predDisp_array = None			#work vectors of the residual, Aitken and predictor steps (allocated once)
+        self.deltaRes_array = None
+        self.Vel_array = None
+        self.VelnM1_array = None
 
-        self.solidLoads_array_X = None			#loads on the solid side of the f/s interface
-        self.solidLoads_array_Y = None
-        self.solidLoads_array_Z = None
+        self.fluidInterface_array_Disp = None		#fluid interface displacement
+        self.fluidLoads_array = None			#loads on the fluid side of the f/s interface
+        self.solidLoads_array = None			#loads on the solid side of the f/s interface
 
 	self.aitkenParam = FSI_config['AITKEN_PARAM']			#relaxation parameter for the BGS method
 	self.FSIIter = 0				#current FSI iteration
+        self.IQN_V = []					#residual differences of the current time step (IQN-ILS)
+        self.IQN_W = []					#solid displacement differences of the current time step (IQN-ILS)
+        self.IQN_history = []				#(V, W) of the previous time steps reused by IQN-ILS
+        self.IQN_residual = None			#residual and solid displacement at the previous FSI iteration (IQN-ILS)
+        self.IQN_predDisp = None
         self.unsteady = False				#flag for steady or unsteady simulation (default is steady)
+        self.historyWriter = None			#buffered writer of the FSI history file (root process only)
 
 	# ---Some screen output ---
 	self.MPIPrint('Fluid solver : SU2_CFD')
@@ -154,6 +161,14 @@ class Interface:
 	else:
 	  self.MPIPrint('Steady coupled simulation')
 
+        if myid == self.rootProcess:
+          if self.unsteady:
+            historyColumns = ['TimeIter', 'Time', 'FSIRes', 'FSINbIter']
+          else:
+            historyColumns = ['FSI Iter', 'FSIRes']
+          historyFileName = 'FSIhistory.bin' if FSI_config['FSI_HISTORY_FORMAT'] == 'BINARY' else 'FSIhistory.dat'
+          self.historyWriter = FSIHistoryWriter(historyFileName, historyColumns, FSI_config['FSI_HISTORY_FORMAT'], FSI_config['FSI_HISTORY_FLUSH'])
+
 	if FSI_config['MATCHING_MESH'] == 'YES':
 	  self.MPIPrint('Matching fluid-solid interface')
 	else:
@@ -165,6 +180,11 @@ class Interface:
             self.MPIPrint('Radius value : {}'.format(self.RBF_rad))           
           else:
 	    self.MPIPrint('Non matching fluid-solid interface with Nearest Neighboor interpolation')
+          if FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS':
+            if FSI_config['MESH_INTERP_METHOD'] == 'TPS' and FSI_config['INTERP_LINEAR_SOLVER'] != 'LU':
+              self.MPIPrint('Interpolation linear solver : JACOBI (zero diagonal of the TPS matrix)')
+            else:
+              self.MPIPrint('Interpolation linear solver : {}'.format(FSI_config['INTERP_LINEAR_SOLVER']))
 
 	self.MPIPrint('Solid predictor : {}'.format(FSI_config['DISP_PRED']))
 
@@ -176,6 +196,8 @@ class Interface:
 	  self.MPIPrint('Static Aitken under-relaxation with constant parameter {}'.format(FSI_config['AITKEN_PARAM']))
 	elif FSI_config['AITKEN_RELAX'] == 'DYNAMIC':
 	  self.MPIPrint('Dynamic Aitken under-relaxation with initial parameter {}'.format(FSI_config['AITKEN_PARAM']))
+        elif FSI_config['AITKEN_RELAX'] == 'IQN_ILS':
+          self.MPIPrint('IQN-ILS quasi-Newton coupling with initial relaxation parameter {}, reusing {} previous time steps'.format(FSI_config['AITKEN_PARAM'], FSI_config['IQN_REUSE_STEPS']))
 	else:
 	  self.MPIPrint('No Aitken under-relaxation')
 
@@ -292,19 +314,19 @@ class Interface:
 	self.MPIBarrier()
 	
 	# --- Calculate the total number of nodes at the fluid interface (sum over all the partitions) ---
-        # Calculate the number of halo nodes on each partition
-        self.nLocalFluidInterfaceHaloNode = 0
+        # Flag the halo nodes on each partition and allgather their indices (fluid solver indexing)
+        self.localFluidInterfaceHalo = np.zeros(self.nLocalFluidInterfaceNodes, dtype=bool)
 	for iVertex in range(self.nLocalFluidInterfaceNodes):
-            if FluidSolver.IsAHaloNode(self.fluidInterfaceIdentifier, iVertex) == True:
-              GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-	      self.FluidHaloNodeList[GlobalIndex] = iVertex
-              self.nLocalFluidInterfaceHaloNode += 1
+            self.localFluidInterfaceHalo[iVertex] = FluidSolver.IsAHaloNode(self.fluidInterfaceIdentifier, iVertex)
+        if self.nLocalFluidInterfaceNodes != 0:
+          fluidGlobalIndex = np.array(FluidSolver.GetVertexGlobalIndices(self.fluidInterfaceIdentifier), dtype=int)
+        else:
+          fluidGlobalIndex = np.zeros(0, dtype=int)
+        self.nLocalFluidInterfaceHaloNode = int(np.count_nonzero(self.localFluidInterfaceHalo))
         # Calculate the number of physical (= not halo) nodes on each partition
         self.nLocalFluidInterfacePhysicalNodes = self.nLocalFluidInterfaceNodes - self.nLocalFluidInterfaceHaloNode
-        if self.have_MPI == True:
-          self.FluidHaloNodeList = self.comm.allgather(self.FluidHaloNodeList)
-        else:
-          self.FluidHaloNodeList = [{}]
+        self.FluidHaloNodeList = self.__allgatherIndices(fluidGlobalIndex[self.localFluidInterfaceHalo])
+        del fluidGlobalIndex
 
         # Same thing for the solid part
         self.nLocalSolidInterfaceHaloNode = 0
@@ -314,10 +336,7 @@ class Interface:
 	      #self.SolidHaloNodeList[GlobalIndex] = iVertex
               #self.nLocalSolidInterfaceHaloNode += 1
         self.nLocalSolidInterfacePhysicalNodes = self.nLocalSolidInterfaceNodes - self.nLocalSolidInterfaceHaloNode
-        if self.have_MPI == True:
-          self.SolidHaloNodeList = self.comm.allgather(self.SolidHaloNodeList)
-        else:
-          self.SolidHaloNodeList = [{}]
+        self.SolidHaloNodeList = self.__allgatherIndices(np.zeros(0, dtype=int))
 
 
         # --- Calculate the total number of nodes (with and without halo) at the fluid interface (sum over all the partitions) and broadcast the number accross all processors ---
@@ -414,126 +433,20 @@ class Interface:
 	self.MPIBarrier()
 
         # --- Create all the PETSc vectors required for parallel communication and parallel mesh mapping/interpolation (working for serial too) ---
-        if self.have_MPI == True:
-          self.solidInterface_array_DispX = PETSc.Vec().create(self.comm)
-          self.solidInterface_array_DispY = PETSc.Vec().create(self.comm)
-          self.solidInterface_array_DispZ = PETSc.Vec().create(self.comm)
-          self.solidInterface_array_DispX.setType('mpi')
-          self.solidInterface_array_DispY.setType('mpi')
-          self.solidInterface_array_DispZ.setType('mpi')
-        else:
-          self.solidInterface_array_DispX = PETSc.Vec().create()
-          self.solidInterface_array_DispY = PETSc.Vec().create()
-          self.solidInterface_array_DispZ = PETSc.Vec().create()
-          self.solidInterface_array_DispX.setType('seq')
-          self.solidInterface_array_DispY.setType('seq')
-          self.solidInterface_array_DispZ.setType('seq')
-        self.solidInterface_array_DispX.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterface_array_DispY.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterface_array_DispZ.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterface_array_DispX.set(0.0)
-	self.solidInterface_array_DispY.set(0.0)
-	self.solidInterface_array_DispZ.set(0.0)
-
-        if self.have_MPI == True:
-          self.fluidInterface_array_DispX = PETSc.Vec().create(self.comm)
-          self.fluidInterface_array_DispY = PETSc.Vec().create(self.comm)
-          self.fluidInterface_array_DispZ = PETSc.Vec().create(self.comm)
-          self.fluidInterface_array_DispX.setType('mpi')
-          self.fluidInterface_array_DispY.setType('mpi')
-          self.fluidInterface_array_DispZ.setType('mpi')
-        else:
-          self.fluidInterface_array_DispX = PETSc.Vec().create()
-          self.fluidInterface_array_DispY = PETSc.Vec().create()
-          self.fluidInterface_array_DispZ = PETSc.Vec().create()
-          self.fluidInterface_array_DispX.setType('seq')
-          self.fluidInterface_array_DispY.setType('seq')
-          self.fluidInterface_array_DispZ.setType('seq')
-        self.fluidInterface_array_DispX.setSizes(self.nFluidInterfacePhysicalNodes)
-        self.fluidInterface_array_DispY.setSizes(self.nFluidInterfacePhysicalNodes)
-        self.fluidInterface_array_DispZ.setSizes(self.nFluidInterfacePhysicalNodes)
-        self.fluidInterface_array_DispX.set(0.0)
-        self.fluidInterface_array_DispY.set(0.0)
-        self.fluidInterface_array_DispZ.set(0.0)
-
-        if self.have_MPI == True:
-          self.fluidLoads_array_X = PETSc.Vec().create(self.comm)
-          self.fluidLoads_array_Y = PETSc.Vec().create(self.comm)
-          self.fluidLoads_array_Z = PETSc.Vec().create(self.comm)
-          self.fluidLoads_array_X.setType('mpi')
-          self.fluidLoads_array_Y.setType('mpi')
-          self.fluidLoads_array_Z.setType('mpi')
-        else:
-          self.fluidLoads_array_X = PETSc.Vec().create()
-          self.fluidLoads_array_Y = PETSc.Vec().create()
-          self.fluidLoads_array_Z = PETSc.Vec().create()
-          self.fluidLoads_array_X.setType('seq')
-          self.fluidLoads_array_Y.setType('seq')
-          self.fluidLoads_array_Z.setType('seq')
-        self.fluidLoads_array_X.setSizes(self.nFluidInterfacePhysicalNodes)
-        self.fluidLoads_array_Y.setSizes(self.nFluidInterfacePhysicalNodes)
-        self.fluidLoads_array_Z.setSizes(self.nFluidInterfacePhysicalNodes)
-
-        if self.have_MPI == True:
-          self.solidLoads_array_X = PETSc.Vec().create(self.comm)
-          self.solidLoads_array_Y = PETSc.Vec().create(self.comm)
-          self.solidLoads_array_Z = PETSc.Vec().create(self.comm)
-          self.solidLoads_array_X.setType('mpi')
-          self.solidLoads_array_Y.setType('mpi')
-          self.solidLoads_array_Z.setType('mpi')
-        else:
-          self.solidLoads_array_X = PETSc.Vec().create()
-          self.solidLoads_array_Y = PETSc.Vec().create()
-          self.solidLoads_array_Z = PETSc.Vec().create()
-          self.solidLoads_array_X.setType('seq')
-          self.solidLoads_array_Y.setType('seq')
-          self.solidLoads_array_Z.setType('seq')
-        self.solidLoads_array_X.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidLoads_array_Y.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidLoads_array_Z.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidLoads_array_X.set(0.0)
-        self.solidLoads_array_Y.set(0.0)
-        self.solidLoads_array_Z.set(0.0)
+        self.solidInterface_array_Disp = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
+        self.fluidInterface_array_Disp = self.__createInterfaceVector(self.nFluidInterfacePhysicalNodes)
+        self.fluidLoads_array = self.__createInterfaceVector(self.nFluidInterfacePhysicalNodes)
+        self.solidLoads_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
 
         # --- Create the PETSc vectors required for parallel relaxed BGS algo (working for serial too) ---
-        if self.have_MPI == True:
-          self.solidInterfaceResidual_array_X = PETSc.Vec().create(self.comm)
-          self.solidInterfaceResidual_array_Y = PETSc.Vec().create(self.comm)
-          self.solidInterfaceResidual_array_Z = PETSc.Vec().create(self.comm)
-          self.solidInterfaceResidual_array_X.setType('mpi')
-          self.solidInterfaceResidual_array_Y.setType('mpi')
-          self.solidInterfaceResidual_array_Z.setType('mpi')
-        else:
-          self.solidInterfaceResidual_array_X = PETSc.Vec().create()
-          self.solidInterfaceResidual_array_Y = PETSc.Vec().create()
-          self.solidInterfaceResidual_array_Z = PETSc.Vec().create()
-          self.solidInterfaceResidual_array_X.setType('seq')
-          self.solidInterfaceResidual_array_Y.setType('seq')
-          self.solidInterfaceResidual_array_Z.setType('seq')
-        self.solidInterfaceResidual_array_X.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterfaceResidual_array_Y.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterfaceResidual_array_Z.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
+        self.solidInterfaceResidual_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
+        self.solidInterfaceResidualnM1_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
 
-        if self.have_MPI == True:
-          self.solidInterfaceResidualnM1_array_X = PETSc.Vec().create(self.comm)
-          self.solidInterfaceResidualnM1_array_Y = PETSc.Vec().create(self.comm)
-          self.solidInterfaceResidualnM1_array_Z = PETSc.Vec().create(self.comm)
-          self.solidInterfaceResidualnM1_array_X.setType('mpi')
-          self.solidInterfaceResidualnM1_array_Y.setType('mpi')
-          self.solidInterfaceResidualnM1_array_Z.setType('mpi')
-        else:
-          self.solidInterfaceResidualnM1_array_X = PETSc.Vec().create()
-          self.solidInterfaceResidualnM1_array_Y = PETSc.Vec().create()
-          self.solidInterfaceResidualnM1_array_Z = PETSc.Vec().create()
-          self.solidInterfaceResidualnM1_array_X.setType('seq')
-          self.solidInterfaceResidualnM1_array_Y.setType('seq')
-          self.solidInterfaceResidualnM1_array_Z.setType('seq')
-        self.solidInterfaceResidualnM1_array_X.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterfaceResidualnM1_array_Y.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterfaceResidualnM1_array_Z.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        self.solidInterfaceResidualnM1_array_X.set(0.0)
-        self.solidInterfaceResidualnM1_array_Y.set(0.0)
-        self.solidInterfaceResidualnM1_array_Z.set(0.0)
+        # --- Create the work vectors of the residual, Aitken and predictor steps, reused at each FSI iteration ---
+        self.predDisp_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
+        self.deltaRes_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
+        self.Vel_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
+        self.VelnM1_array = self.__createInterfaceVector(self.nSolidInterfacePhysicalNodes+self.d_RBF)
 
     def interfaceMapping(self,FluidSolver, SolidSolver, FSI_config):
 	""" 
@@ -548,61 +461,24 @@ class Interface:
           MPIsize = 1
 
 	# --- Get the fluid interface from fluid solver on each partition ---
-	GlobalIndex = int()
-        localIndex = 0
-        fluidIndexing_temp = {}
-        self.localFluidInterface_array_X_init = np.zeros((self.nLocalFluidInterfacePhysicalNodes))
-        self.localFluidInterface_array_Y_init = np.zeros((self.nLocalFluidInterfacePhysicalNodes))
-        self.localFluidInterface_array_Z_init = np.zeros((self.nLocalFluidInterfacePhysicalNodes))
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-	    GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-	    posx = FluidSolver.GetVertexCoordX(self.fluidInterfaceIdentifier, iVertex)
-	    posy = FluidSolver.GetVertexCoordY(self.fluidInterfaceIdentifier, iVertex)
-	    posz = FluidSolver.GetVertexCoordZ(self.fluidInterfaceIdentifier, iVertex)
-	    if GlobalIndex in self.FluidHaloNodeList[myid].keys():
-              self.haloNodesPositionsInit[GlobalIndex] = (posx, posy, posz)
-            else:
-              fluidIndexing_temp[GlobalIndex] = self.__getGlobalIndex('fluid', myid, localIndex)
-              self.localFluidInterface_array_X_init[localIndex] = posx
-              self.localFluidInterface_array_Y_init[localIndex] = posy
-              self.localFluidInterface_array_Z_init[localIndex] = posz
-              localIndex += 1
-        if self.have_MPI == True:
-          fluidIndexing_temp = self.comm.allgather(fluidIndexing_temp)
-          for ii in range(len(fluidIndexing_temp)):
-            for key, value in fluidIndexing_temp[ii].items():
-              self.fluidIndexing[key] = value
+        if self.nLocalFluidInterfaceNodes != 0:
+          fluidGlobalIndex = np.array(FluidSolver.GetVertexGlobalIndices(self.fluidInterfaceIdentifier), dtype=int)
+          fluidCoords = np.array(FluidSolver.GetVertexCoords(self.fluidInterfaceIdentifier)).reshape(-1,3)
         else:
-          self.fluidIndexing = fluidIndexing_temp.copy()
-        del fluidIndexing_temp
+          fluidGlobalIndex = np.zeros(0, dtype=int)
+          fluidCoords = np.zeros((0,3))
+        self.haloNodesPositionsInit = fluidCoords[self.localFluidInterfaceHalo]
+        self.localFluidInterface_array_init = fluidCoords[~self.localFluidInterfaceHalo]
+        self.localFluidInterfaceGlobalIndex = self.__getGlobalIndex('fluid', myid, np.arange(self.nLocalFluidInterfacePhysicalNodes))
+        self.fluidIndexing = self.__buildIndexing(fluidGlobalIndex[~self.localFluidInterfaceHalo], self.localFluidInterfaceGlobalIndex)
 
 	# --- Get the solid interface from solid solver on each partition ---
-        localIndex = 0
-        solidIndexing_temp = {}
-	self.localSolidInterface_array_X = np.zeros(self.nLocalSolidInterfaceNodes)
-        self.localSolidInterface_array_Y = np.zeros(self.nLocalSolidInterfaceNodes)
-        self.localSolidInterface_array_Z = np.zeros(self.nLocalSolidInterfaceNodes)
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-          GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
-	  posx = SolidSolver.getInterfaceNodePosX(self.solidInterfaceIdentifier, iVertex)
-	  posy = SolidSolver.getInterfaceNodePosY(self.solidInterfaceIdentifier, iVertex)
-	  posz = SolidSolver.getInterfaceNodePosZ(self.solidInterfaceIdentifier, iVertex)
-          if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-            pass
-          else:
-            solidIndexing_temp[GlobalIndex] = self.__getGlobalIndex('solid', myid, localIndex)
-            self.localSolidInterface_array_X[localIndex] = posx
-            self.localSolidInterface_array_Y[localIndex] = posy
-            self.localSolidInterface_array_Z[localIndex] = posz
-            localIndex += 1
-        if self.have_MPI == True:
-          solidIndexing_temp = self.comm.allgather(solidIndexing_temp)
-          for ii in range(len(solidIndexing_temp)):
-            for key, value in solidIndexing_temp[ii].items():
-              self.solidIndexing[key] = value
-        else:
-          self.solidIndexing = solidIndexing_temp.copy()
-        del solidIndexing_temp
+        solidGlobalIndex = self.__getSolidInterfaceGlobalIndices(SolidSolver)
+        self.localSolidInterfaceHalo = np.isin(solidGlobalIndex, self.SolidHaloNodeList[myid])
+        solidCoords = self.__getSolidInterfaceArray(SolidSolver, 'Pos')[~self.localSolidInterfaceHalo]
+        self.localSolidInterface_array = np.ascontiguousarray(solidCoords)
+        self.localSolidInterfaceGlobalIndex = self.__getGlobalIndex('solid', myid, np.arange(solidCoords.shape[0]))
+        self.solidIndexing = self.__buildIndexing(solidGlobalIndex[~self.localSolidInterfaceHalo], self.localSolidInterfaceGlobalIndex)
 
 
 	# --- Create the PETSc parallel interpolation matrix ---
@@ -638,17 +514,9 @@ class Interface:
               self.MappingMatrixA_T.setType('aij')
               self.MappingMatrixB_T.setType('aij')
 	  self.MappingMatrixA.setSizes((self.nSolidInterfacePhysicalNodes+self.d_RBF, self.nSolidInterfacePhysicalNodes+self.d_RBF))
-          self.MappingMatrixA.setUp()
-          self.MappingMatrixA.setOption(PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False)
 	  self.MappingMatrixB.setSizes((self.nFluidInterfacePhysicalNodes, self.nSolidInterfacePhysicalNodes+self.d_RBF))
-          self.MappingMatrixB.setUp()
-          self.MappingMatrixB.setOption(PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False)
 	  self.MappingMatrixA_T.setSizes((self.nSolidInterfacePhysicalNodes+self.d_RBF, self.nSolidInterfacePhysicalNodes+self.d_RBF))
-          self.MappingMatrixA_T.setUp()
-          self.MappingMatrixA_T.setOption(PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False)
 	  self.MappingMatrixB_T.setSizes((self.nSolidInterfacePhysicalNodes+self.d_RBF, self.nFluidInterfacePhysicalNodes))
-          self.MappingMatrixB_T.setUp()
-          self.MappingMatrixB_T.setOption(PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False)
         else:
           if self.have_MPI == True:
             self.MappingMatrix = PETSc.Mat().create(self.comm)
@@ -661,104 +529,189 @@ class Interface:
             self.MappingMatrix.setType('aij')
             self.MappingMatrix_T.setType('aij')
 	  self.MappingMatrix.setSizes((self.nFluidInterfacePhysicalNodes, self.nSolidInterfacePhysicalNodes))
-          self.MappingMatrix.setUp()
-          self.MappingMatrix.setOption(PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False)
 	  self.MappingMatrix_T.setSizes((self.nSolidInterfacePhysicalNodes, self.nFluidInterfacePhysicalNodes))
-          self.MappingMatrix_T.setUp()
-          self.MappingMatrix_T.setOption(PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False)
                   
 	
+        # --- Distribute the solid interface of each partition (one packed buffer per partition, nonblocking broadcasts) ---
+        # The mapping blocks of a partition are built as soon as its buffer is received, while the next ones are still in transit
+        solidInterfaceBuffRcv, solidInterfaceRequests = self.__broadcastSolidInterface()
+
         # --- Fill the interpolation matrix in parallel (working in serial too) ---
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
           self.MPIPrint('Building interpolation matrices...')
-          if self.have_MPI == True:
+          if myid in self.solidInterfaceProcessors:
             for iProc in self.solidInterfaceProcessors:
-              if myid == iProc:
-                for jProc in self.solidInterfaceProcessors:  
-                  self.comm.Send(self.localSolidInterface_array_X, dest=jProc, tag=1)
-                  self.comm.Send(self.localSolidInterface_array_Y, dest=jProc, tag=2)
-                  self.comm.Send(self.localSolidInterface_array_Z, dest=jProc, tag=3)
-              if myid in self.solidInterfaceProcessors:
-                sizeOfBuff = self.solidPhysicalInterfaceNodesDistribution[iProc]
-                solidInterfaceBuffRcv_X = np.zeros(sizeOfBuff)
-                solidInterfaceBuffRcv_Y = np.zeros(sizeOfBuff)
-                solidInterfaceBuffRcv_Z = np.zeros(sizeOfBuff)
-                self.comm.Recv(solidInterfaceBuffRcv_X, iProc, tag=1)
-                self.comm.Recv(solidInterfaceBuffRcv_Y, iProc, tag=2)
-                self.comm.Recv(solidInterfaceBuffRcv_Z, iProc, tag=3)
-                if FSI_config['MESH_INTERP_METHOD'] == 'RBF':
-                  self.RBFMeshMapping_A(solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc, self.RBF_rad)
-                else:
-                  self.TPSMeshMapping_A(solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc)
-          else:
-            if FSI_config['MESH_INTERP_METHOD'] == 'RBF':
-              self.RBFMeshMapping_A(self.localSolidInterface_array_X, self.localSolidInterface_array_Y, self.localSolidInterface_array_Z, 0, self.RBF_rad)
-            else:
-              self.TPSMeshMapping_A(self.localSolidInterface_array_X, self.localSolidInterface_array_Y, self.localSolidInterface_array_Z, 0)
-          self.MappingMatrixA.assemblyBegin()
-          self.MappingMatrixA.assemblyEnd()
-          self.MappingMatrixA_T.assemblyBegin()
-          self.MappingMatrixA_T.assemblyEnd()
+              if iProc in solidInterfaceRequests:
+                solidInterfaceRequests[iProc].Wait()
+              if FSI_config['MESH_INTERP_METHOD'] == 'RBF':
+                self.RBFMeshMapping_A(solidInterfaceBuffRcv[iProc], iProc, self.RBF_rad)
+              else:
+                self.TPSMeshMapping_A(solidInterfaceBuffRcv[iProc], iProc)
+          # Explicit zeros on the diagonal of the polynomial block keep it in the sparsity pattern of the factorization
+          if myid == self.solidInterfaceProcessors[0]:
+            polyIndex = self.nSolidInterfacePhysicalNodes + np.arange(self.d_RBF)
+            self.__addMappingEntries('MappingMatrixA', polyIndex, polyIndex, np.zeros(self.d_RBF))
+          self.__assembleMappingMatrix('MappingMatrixA', self.nSolidInterfacePhysicalNodes+self.d_RBF, self.nSolidInterfacePhysicalNodes+self.d_RBF)
           self.MPIPrint('Matrix A is built.')
         else:
           self.MPIPrint("Building interpolation matrix...")
-        self.MPIBarrier()
 
-        if self.have_MPI == True:
+        if myid in self.fluidInterfaceProcessors:
           for iProc in self.solidInterfaceProcessors:
-            if myid == iProc:
-              for jProc in self.fluidInterfaceProcessors:
-                self.comm.Send(self.localSolidInterface_array_X, dest=jProc, tag=1)
-                self.comm.Send(self.localSolidInterface_array_Y, dest=jProc, tag=2)
-                self.comm.Send(self.localSolidInterface_array_Z, dest=jProc, tag=3)
-            if myid in self.fluidInterfaceProcessors:
-              sizeOfBuff = self.solidPhysicalInterfaceNodesDistribution[iProc]
-              solidInterfaceBuffRcv_X = np.zeros(sizeOfBuff)
-              solidInterfaceBuffRcv_Y = np.zeros(sizeOfBuff)
-              solidInterfaceBuffRcv_Z = np.zeros(sizeOfBuff)
-              self.comm.Recv(solidInterfaceBuffRcv_X, iProc, tag=1)
-              self.comm.Recv(solidInterfaceBuffRcv_Y, iProc, tag=2)
-              self.comm.Recv(solidInterfaceBuffRcv_Z, iProc, tag=3)
-              if FSI_config['MATCHING_MESH'] == 'NO':
-                if FSI_config['MESH_INTERP_METHOD'] == 'RBF':
-                  self.RBFMeshMapping_B(solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc, self.RBF_rad)
-                elif FSI_config['MESH_INTERP_METHOD'] == 'TPS':
-                  self.TPSMeshMapping_B(solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc)
-                else:
-                  self.NearestNeighboorMeshMapping(solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc)
-	      else:
-                self.matchingMeshMapping(solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc)
-        else:
-          if FSI_config['MATCHING_MESH'] == 'NO':
-            if FSI_config['MESH_INTERP_METHOD'] == 'RBF':
-              self.RBFMeshMapping_B(self.localSolidInterface_array_X, self.localSolidInterface_array_Y, self.localSolidInterface_array_Z, 0, self.RBF_rad)
-            elif FSI_config['MESH_INTERP_METHOD'] == 'TPS' :
-              self.TPSMeshMapping_B(self.localSolidInterface_array_X, self.localSolidInterface_array_Y, self.localSolidInterface_array_Z, 0)
+            if iProc in solidInterfaceRequests:
+              solidInterfaceRequests[iProc].Wait()
+            if FSI_config['MATCHING_MESH'] == 'NO':
+              if FSI_config['MESH_INTERP_METHOD'] == 'RBF':
+                self.RBFMeshMapping_B(solidInterfaceBuffRcv[iProc], iProc, self.RBF_rad)
+              elif FSI_config['MESH_INTERP_METHOD'] == 'TPS':
+                self.TPSMeshMapping_B(solidInterfaceBuffRcv[iProc], iProc)
+              else:
+                self.NearestNeighboorMeshMapping(solidInterfaceBuffRcv[iProc], iProc)
             else:
-              self.NearestNeighboorMeshMapping(self.localSolidInterface_array_X, self.localSolidInterface_array_Y, self.localSolidInterface_array_Z, 0) 
-	  else:	    
-            self.matchingMeshMapping(self.localSolidInterface_array_X, self.localSolidInterface_array_Y, self.localSolidInterface_array_Z, 0)
+              self.matchingMeshMapping(solidInterfaceBuffRcv[iProc], iProc)
+        # The partitions that own no interface only take part in the broadcasts
+        if self.have_MPI == True:
+          self.MPI.Request.Waitall(list(solidInterfaceRequests.values()))
+        del solidInterfaceBuffRcv, solidInterfaceRequests
         
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
-          self.MappingMatrixB.assemblyBegin()
-          self.MappingMatrixB.assemblyEnd()
-          self.MappingMatrixB_T.assemblyBegin()
-          self.MappingMatrixB_T.assemblyEnd()
+          self.__assembleMappingMatrix('MappingMatrixB', self.nFluidInterfacePhysicalNodes, self.nSolidInterfacePhysicalNodes+self.d_RBF)
           self.MPIPrint('Matrix B is built.')
+          self.__setupInterpolationSolver(FSI_config)
         else:
-          self.MappingMatrix.assemblyBegin()
-          self.MappingMatrix.assemblyEnd()
-          self.MappingMatrix_T.assemblyBegin()
-          self.MappingMatrix_T.assemblyEnd()
+          self.__assembleMappingMatrix('MappingMatrix', self.nFluidInterfacePhysicalNodes, self.nSolidInterfacePhysicalNodes)
           self.MPIPrint("Interpolation matrix is built.")
+        self.__createMappingBlocks(FSI_config)
   
         self.MPIBarrier()
   
-        del self.localSolidInterface_array_X
-        del self.localSolidInterface_array_Y
-        del self.localSolidInterface_array_Z
+        del self.localSolidInterface_array
+        self.solidSpatialTrees.clear()
+
+    def __setupInterpolationSolver(self, FSI_config):
+        """
+        Create the persistent linear solvers of the RBF/TPS interpolation.
+        The solvers (and the factorization of matrix A) are set up once for the lifetime of the interface.
+        """
+        if self.have_MPI == True:
+          self.KSP_solver = PETSc.KSP().create(self.comm)
+          self.KSP_solver_T = PETSc.KSP().create(self.comm)
+        else:
+          self.KSP_solver = PETSc.KSP().create()
+          self.KSP_solver_T = PETSc.KSP().create()
+
+        # The TPS basis vanishes at zero distance, so the diagonal of matrix A is zero and a factorization needs pivoting
+        isTPS = FSI_config['MESH_INTERP_METHOD'] == 'TPS'
+        for KSP_solver, Matrix in ((self.KSP_solver, self.MappingMatrixA), (self.KSP_solver_T, self.MappingMatrixA_T)):
+          if FSI_config['INTERP_LINEAR_SOLVER'] == 'LU':
+            KSP_solver.setType('preonly')
+            KSP_solver.getPC().setType('lu')
+            if isTPS or self.have_MPI == True:
+              KSP_solver.getPC().setFactorSolverType('mumps')
+          elif isTPS:
+            # Jacobi replaces the zero diagonal entries by one
+            KSP_solver.setType('fgmres')
+            KSP_solver.getPC().setType('jacobi')
+            KSP_solver.setInitialGuessNonzero(True)
+          else:
+            KSP_solver.setType('fgmres')
+            KSP_solver.getPC().setType('asm')
+            KSP_solver.setInitialGuessNonzero(True)
+          KSP_solver.setOperators(Matrix)
+          KSP_solver.setFromOptions()
+          KSP_solver.setUp()
 
-    def matchingMeshMapping(self,solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc):
+    def __checkInterpolationSolve(self, KSP_solver):
+        """
+        Raise if the last solve of the interpolation system failed (PETSc does not raise on a preconditioner failure).
+        """
+        reason = KSP_solver.getConvergedReason()
+        if reason < 0:
+          raise Exception('The RBF/TPS interpolation solve failed (KSP converged reason {}).'.format(reason))
+
+    def __createMappingBlocks(self, FSI_config):
+        """
+        Create the dense (n x 3) blocks holding the X, Y and Z components as columns, so that the three components
+        are mapped (or interpolated) with a single matrix product or solve.
+        The blocks of the products are created at the first product and reused afterwards.
+        """
+        self.solidInterface_block_Disp = self.__createDenseBlock(self.solidInterface_array_Disp)
+        self.fluidInterface_block_Disp = None
+        self.fluidLoads_block = self.__createDenseBlock(self.fluidLoads_array)
+        if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
+          # Interpolation coefficients of the displacements and solid loads, kept as initial guess of the next solve
+          self.gamma_block_Disp = self.__createDenseBlock(self.solidInterface_array_Disp)
+          self.gamma_block_Load = None
+          self.solidLoads_block = self.__createDenseBlock(self.solidLoads_array)
+        else:
+          self.solidLoads_block = None
+
+    def __createDenseBlock(self, vec):
+        """
+        Create a dense (n x 3) matrix with the parallel layout of the nodes of the interleaved vector vec.
+        """
+        if self.have_MPI == True:
+          Block = PETSc.Mat().createDense(((vec.getLocalSize()//3, vec.getSize()//3), 3), comm=self.comm)
+        else:
+          Block = PETSc.Mat().createDense((vec.getSize()//3, 3))
+        Block.assemble()
+
+        return Block
+
+    def __matMult(self, Matrix, Block, Result):
+        """
+        Matrix-block product, into the block Result when it already exists.
+        """
+        if Result is None:
+          return Matrix.matMult(Block)
+        Matrix.matMult(Block, Result)
+
+        return Result
+
+    def __packColumns(self, Block, vec):
+        """
+        Copy the interleaved X, Y and Z components of the vector into the columns of the dense block (local copy).
+        """
+        Block.getDenseArray()[:] = vec.getArray().reshape(-1,3)
+        Block.assemble()
+
+    def __unpackColumns(self, Block, vec):
+        """
+        Copy the columns of the dense block into the interleaved X, Y and Z components of the vector (local copy).
+        """
+        vec.setArray(Block.getDenseArray().ravel())
+
+    def __broadcastSolidInterface(self):
+        """
+        Post one nonblocking broadcast of the (nNodes, 3) array of the physical solid interface positions of each partition.
+        Return the dictionaries of the receive buffers and of the pending requests (empty in serial), indexed by partition.
+        """
+        if self.have_MPI == False:
+          return {0: self.localSolidInterface_array}, {}
+
+        myid = self.comm.Get_rank()
+        solidInterfaceBuffRcv = {}
+        solidInterfaceRequests = {}
+        for iProc in self.solidInterfaceProcessors:
+          if myid == iProc:
+            solidInterfaceBuffRcv[iProc] = self.localSolidInterface_array
+          else:
+            solidInterfaceBuffRcv[iProc] = np.zeros((self.solidPhysicalInterfaceNodesDistribution[iProc], 3))
+          solidInterfaceRequests[iProc] = self.comm.Ibcast(solidInterfaceBuffRcv[iProc], root=iProc)
+
+        return solidInterfaceBuffRcv, solidInterfaceRequests
+
+    def __getSolidSpatialTree(self, solidInterfaceBuffRcv, iProc):
+        """
+        Return the spatial indexing (kd-tree) of the solid interface nodes received from partition iProc.
+        The tree is bulk-loaded once per partition and shared by all the mapping stages.
+        """
+        if iProc not in self.solidSpatialTrees:
+          self.solidSpatialTrees[iProc] = cKDTree(solidInterfaceBuffRcv[:,:self.nDim])
+
+        return self.solidSpatialTrees[iProc]
+
+    def matchingMeshMapping(self, solidInterfaceBuffRcv, iProc):
         """
         Fill the mapping matrix in case of matching meshes at the f/s interface.
         """
@@ -767,53 +720,30 @@ class Interface:
         else:
           myid = 0
 
-        # --- Instantiate the spatial indexing ---
-	prop_index = index.Property()
-	prop_index.dimension = self.nDim
-	SolidSpatialTree = index.Index(properties=prop_index)
-        
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-          posX = solidInterfaceBuffRcv_X[jVertex]
-          posY = solidInterfaceBuffRcv_Y[jVertex]
-          posZ = solidInterfaceBuffRcv_Z[jVertex]
-	  if self.nDim == 2 :
-	    SolidSpatialTree.add(jVertex, (posX, posY))
-   	  else :
-	    SolidSpatialTree.add(jVertex, (posX, posY, posZ))
+        # --- Get the spatial indexing ---
+        SolidSpatialTree = self.__getSolidSpatialTree(solidInterfaceBuffRcv, iProc)
 
         if self.nFluidInterfacePhysicalNodes != self.nSolidInterfacePhysicalNodes:
           raise Exception("Fluid and solid interface must have the same number of nodes for matching meshes ! ")
 
-        # --- For each fluid interface node, find the nearest solid interface node and fill the boolean mapping matrix ---
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-          posX = self.localFluidInterface_array_X_init[iVertexFluid]
-          posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-          posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-          if self.nDim == 2:
-            neighboors = list(SolidSpatialTree.nearest((posX, posY),1))
-          elif self.nDim == 3:
-            neighboors = list(SolidSpatialTree.nearest((posX, posY, posZ),1))
-          jVertexSolid = neighboors[0]
-          # Check if the distance is small enough to ensure coincidence
-          NodeA = np.array([posX, posY, posZ])
-          NodeB = np.array([solidInterfaceBuffRcv_X[jVertexSolid], solidInterfaceBuffRcv_Y[jVertexSolid], solidInterfaceBuffRcv_Z[jVertexSolid]])
-          distance = spdist.euclidean(NodeA, NodeB)
-          iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, iVertexFluid)
-          jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
-          if distance > 1e-6:
-            print("WARNING : Tolerance for matching meshes is not matched between node F{} and S{} : ({}, {}, {})<-->({}, {}, {}) , DISTANCE : {} !".format(iGlobalVertexFluid,jGlobalVertexSolid,posX, posY, posZ,solidInterfaceBuffRcv_X[jVertexSolid], solidInterfaceBuffRcv_Y[jVertexSolid], solidInterfaceBuffRcv_Z[jVertexSolid], distance))
-          self.MappingMatrix.setValue(iGlobalVertexFluid,jGlobalVertexSolid,1.0)
-          self.MappingMatrix_T.setValue(jGlobalVertexSolid, iGlobalVertexFluid,1.0)
-
-        del solidInterfaceBuffRcv_X
-        del solidInterfaceBuffRcv_Y
-        del solidInterfaceBuffRcv_Z
-
-    def NearestNeighboorMeshMapping(self, solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc):
-        """
-        Description
+        # --- Find the nearest solid interface node of all the fluid interface nodes at once ---
+        fluidPositions = self.localFluidInterface_array_init[:,:self.nDim]
+        distances, neighboors = SolidSpatialTree.query(fluidPositions, k=1)
+        iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, np.arange(self.nLocalFluidInterfacePhysicalNodes))
+        jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, neighboors)
+
+        # Check if the distance is small enough to ensure coincidence
+        for iVertexFluid in np.flatnonzero(distances > 1e-6):
+          jVertexSolid = neighboors[iVertexFluid]
+          posX, posY, posZ = self.localFluidInterface_array_init[iVertexFluid]
+          print("WARNING : Tolerance for matching meshes is not matched between node F{} and S{} : ({}, {}, {})<-->({}, {}, {}) , DISTANCE : {} !".format(iGlobalVertexFluid[iVertexFluid],jGlobalVertexSolid[iVertexFluid],posX, posY, posZ,solidInterfaceBuffRcv[jVertexSolid,0], solidInterfaceBuffRcv[jVertexSolid,1], solidInterfaceBuffRcv[jVertexSolid,2], distances[iVertexFluid]))
+
+        # --- Fill the boolean mapping matrix ---
+        self.__addMappingEntries('MappingMatrix', iGlobalVertexFluid, jGlobalVertexSolid, np.ones(self.nLocalFluidInterfacePhysicalNodes))
+
+    def NearestNeighboorMeshMapping(self, solidInterfaceBuffRcv, iProc):
+        """
+        Fill the mapping matrix with the nearest solid interface node of each fluid interface node.
         """
 
         if self.have_MPI == True:
@@ -821,40 +751,19 @@ class Interface:
         else:
           myid = 0
 
-        # --- Instantiate the spatial indexing ---
-	prop_index = index.Property()
-	prop_index.dimension = self.nDim
-	SolidSpatialTree = index.Index(properties=prop_index)
+        # --- Get the spatial indexing ---
+        SolidSpatialTree = self.__getSolidSpatialTree(solidInterfaceBuffRcv, iProc)
         
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-          posX = solidInterfaceBuffRcv_X[jVertex]
-          posY = solidInterfaceBuffRcv_Y[jVertex]
-          posZ = solidInterfaceBuffRcv_Z[jVertex]
-	  if self.nDim == 2 :
-	    SolidSpatialTree.add(jVertex, (posX, posY))
-   	  else :
-	    SolidSpatialTree.add(jVertex, (posX, posY, posZ))
-
-        # --- For each fluid interface node, find the nearest solid interface node and fill the boolean mapping matrix ---
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-          posX = self.localFluidInterface_array_X_init[iVertexFluid]
-          posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-          posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-          if self.nDim == 2:
-            neighboors = list(SolidSpatialTree.nearest((posX, posY),1))
-          elif self.nDim == 3:
-            neighboors = list(SolidSpatialTree.nearest((posX, posY, posZ),1))
-          jVertexSolid = neighboors[0]
-          iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, iVertexFluid)
-          jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
-          self.MappingMatrix.setValue(iGlobalVertexFluid,jGlobalVertexSolid,1.0)
-          self.MappingMatrix_T.setValue(jGlobalVertexSolid, iGlobalVertexFluid,1.0)
-
-    def RBFMeshMapping_A(self, solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc, rad):
-        """
-        Description
+        # --- Find the nearest solid interface node of all the fluid interface nodes at once and fill the boolean mapping matrix ---
+        fluidPositions = self.localFluidInterface_array_init[:,:self.nDim]
+        distances, neighboors = SolidSpatialTree.query(fluidPositions, k=1)
+        iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, np.arange(self.nLocalFluidInterfacePhysicalNodes))
+        jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, neighboors)
+        self.__addMappingEntries('MappingMatrix', iGlobalVertexFluid, jGlobalVertexSolid, np.ones(self.nLocalFluidInterfacePhysicalNodes))
+
+    def RBFMeshMapping_A(self, solidInterfaceBuffRcv, iProc, rad):
+        """
+        Fill the rows of the local solid interface nodes in the RBF interpolation matrix A (solid/solid).
         """
 
         if self.have_MPI == True:
@@ -862,51 +771,28 @@ class Interface:
         else:
           myid = 0
 
-        # --- Instantiate the spatial indexing ---
-	prop_index = index.Property()
-	prop_index.dimension = self.nDim
-	SolidSpatialTree = index.Index(properties=prop_index)
+        # --- Get the spatial indexing ---
+        SolidSpatialTree = self.__getSolidSpatialTree(solidInterfaceBuffRcv, iProc)
         
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-          posX = solidInterfaceBuffRcv_X[jVertex]
-          posY = solidInterfaceBuffRcv_Y[jVertex]
-          posZ = solidInterfaceBuffRcv_Z[jVertex]
-	  if self.nDim == 2 :
-	    SolidSpatialTree.add(jVertex, (posX, posY))
-   	  else :
-	    SolidSpatialTree.add(jVertex, (posX, posY, posZ))
-
-        for iVertexSolid in range(self.nLocalSolidInterfaceNodes):
-          posX = self.localSolidInterface_array_X[iVertexSolid]
-          posY = self.localSolidInterface_array_Y[iVertexSolid]
-          posZ = self.localSolidInterface_array_Z[iVertexSolid]
-          NodeA = np.array([posX, posY, posZ])
-          iGlobalVertexSolid = self.__getGlobalIndex('solid', myid, iVertexSolid)
-          if self.nDim == 2:
-            neighboors = list(SolidSpatialTree.intersection((posX-rad, posY-rad, posX+rad, posY+rad)))
-          elif self.nDim == 3:
-            neighboors = list(SolidSpatialTree.intersection((posX-rad, posY-rad, posZ-rad, posX+rad, posY+rad, posZ+rad)))
-          for jVertexSolid in neighboors:
-            NodeB = np.array([solidInterfaceBuffRcv_X[jVertexSolid], solidInterfaceBuffRcv_Y[jVertexSolid], solidInterfaceBuffRcv_Z[jVertexSolid]])
-            distance = spdist.euclidean(NodeA, NodeB)
-            phi = self.__CPC2(distance, rad)
-            jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, jGlobalVertexSolid, phi)
-            self.MappingMatrixA_T.setValue(jGlobalVertexSolid, iGlobalVertexSolid, phi)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes, 1.0)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes+1, posX)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes+2, posY)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes+3, posZ)
-          self.MappingMatrixA_T.setValue(nSolidNodes, iGlobalVertexSolid, 1.0)
-          self.MappingMatrixA_T.setValue(nSolidNodes+1, iGlobalVertexSolid, posX)
-          self.MappingMatrixA_T.setValue(nSolidNodes+2, iGlobalVertexSolid, posY)
-          self.MappingMatrixA_T.setValue(nSolidNodes+3, iGlobalVertexSolid, posZ)
-
-    def RBFMeshMapping_B(self, solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc, rad):
-        """
-        Description
+        # --- Find the solid interface nodes within the radius of all the local solid interface nodes at once ---
+        localSolidPositions = self.localSolidInterface_array[:,:self.nDim]
+        neighboorsList = SolidSpatialTree.query_ball_point(localSolidPositions, rad)
+        iVertexSolid, jVertexSolid = self.__flattenNeighboors(neighboorsList)
+
+        # --- Compute the basis values of all the pairs of nodes ---
+        NodesA = self.localSolidInterface_array
+        NodesB = solidInterfaceBuffRcv
+        distances = np.sqrt(((NodesA[iVertexSolid]-NodesB[jVertexSolid])**2).sum(axis=1))
+        phi = self.__CPC2(distances, rad)
+
+        iGlobalVertexSolid = self.__getGlobalIndex('solid', myid, iVertexSolid)
+        jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
+        self.__addMappingEntries('MappingMatrixA', iGlobalVertexSolid, jGlobalVertexSolid, phi)
+        self.__addPolynomialEntries('MappingMatrixA', self.__getGlobalIndex('solid', myid, np.arange(self.nLocalSolidInterfaceNodes)), NodesA)
+
+    def RBFMeshMapping_B(self, solidInterfaceBuffRcv, iProc, rad):
+        """
+        Fill the rows of the local fluid interface nodes in the RBF interpolation matrix B (fluid/solid).
         """
 
         if self.have_MPI == True:
@@ -914,51 +800,28 @@ class Interface:
         else:
           myid = 0
 
-        # --- Instantiate the spatial indexing ---
-	prop_index = index.Property()
-	prop_index.dimension = self.nDim
-	SolidSpatialTree = index.Index(properties=prop_index)
+        # --- Get the spatial indexing ---
+        SolidSpatialTree = self.__getSolidSpatialTree(solidInterfaceBuffRcv, iProc)
         
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-          posX = solidInterfaceBuffRcv_X[jVertex]
-          posY = solidInterfaceBuffRcv_Y[jVertex]
-          posZ = solidInterfaceBuffRcv_Z[jVertex]
-	  if self.nDim == 2 :
-	    SolidSpatialTree.add(jVertex, (posX, posY))
-   	  else :
-	    SolidSpatialTree.add(jVertex, (posX, posY, posZ))
-
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-          posX = self.localFluidInterface_array_X_init[iVertexFluid]
-          posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-          posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-          NodeA = np.array([posX, posY, posZ])
-          iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, iVertexFluid)
-          if self.nDim == 2:
-            neighboors = list(SolidSpatialTree.intersection((posX-rad, posY-rad, posX+rad, posY+rad)))
-          elif self.nDim == 3:
-            neighboors = list(SolidSpatialTree.intersection((posX-rad, posY-rad, posZ-rad, posX+rad, posY+rad, posZ+rad)))
-          for jVertexSolid in neighboors:
-            NodeB = np.array([solidInterfaceBuffRcv_X[jVertexSolid], solidInterfaceBuffRcv_Y[jVertexSolid], solidInterfaceBuffRcv_Z[jVertexSolid]])
-            distance = spdist.euclidean(NodeA, NodeB)
-            phi = self.__CPC2(distance, rad)
-            jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, jGlobalVertexSolid, phi)
-            self.MappingMatrixB_T.setValue(jGlobalVertexSolid, iGlobalVertexFluid, phi)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes, 1.0)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes+1, posX)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes+2, posY)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes+3, posZ)
-          self.MappingMatrixB_T.setValue(nSolidNodes, iGlobalVertexFluid, 1.0)
-          self.MappingMatrixB_T.setValue(nSolidNodes+1, iGlobalVertexFluid, posX)
-          self.MappingMatrixB_T.setValue(nSolidNodes+2, iGlobalVertexFluid, posY)
-          self.MappingMatrixB_T.setValue(nSolidNodes+3, iGlobalVertexFluid, posZ)
-
-    def TPSMeshMapping_A(self, solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc):
-        """
-        Description
+        # --- Find the solid interface nodes within the radius of all the fluid interface nodes at once ---
+        fluidPositions = self.localFluidInterface_array_init[:,:self.nDim]
+        neighboorsList = SolidSpatialTree.query_ball_point(fluidPositions, rad)
+        iVertexFluid, jVertexSolid = self.__flattenNeighboors(neighboorsList)
+
+        # --- Compute the basis values of all the pairs of nodes ---
+        NodesA = self.localFluidInterface_array_init
+        NodesB = solidInterfaceBuffRcv
+        distances = np.sqrt(((NodesA[iVertexFluid]-NodesB[jVertexSolid])**2).sum(axis=1))
+        phi = self.__CPC2(distances, rad)
+
+        iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, iVertexFluid)
+        jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
+        self.__addMappingEntries('MappingMatrixB', iGlobalVertexFluid, jGlobalVertexSolid, phi)
+        self.__addPolynomialEntries('MappingMatrixB', self.__getGlobalIndex('fluid', myid, np.arange(self.nLocalFluidInterfacePhysicalNodes)), NodesA)
+
+    def TPSMeshMapping_A(self, solidInterfaceBuffRcv, iProc):
+        """
+        Fill the rows of the local solid interface nodes in the TPS interpolation matrix A (solid/solid).
         """
 
         if self.have_MPI == True:
@@ -966,33 +829,19 @@ class Interface:
         else:
           myid = 0
         
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for iVertexSolid in range(self.nLocalSolidInterfaceNodes):
-          posX = self.localSolidInterface_array_X[iVertexSolid]
-          posY = self.localSolidInterface_array_Y[iVertexSolid]
-          posZ = self.localSolidInterface_array_Z[iVertexSolid]
-          NodeA = np.array([posX, posY, posZ])
-          iGlobalVertexSolid = self.__getGlobalIndex('solid', myid, iVertexSolid)
-          for jVertexSolid in range(nSolidNodes):
-            NodeB = np.array([solidInterfaceBuffRcv_X[jVertexSolid], solidInterfaceBuffRcv_Y[jVertexSolid], solidInterfaceBuffRcv_Z[jVertexSolid]])
-            distance = spdist.euclidean(NodeA, NodeB)
-            phi = self.__TPS(distance)
-            jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, jGlobalVertexSolid, phi)
-            self.MappingMatrixA_T.setValue(jGlobalVertexSolid, iGlobalVertexSolid, phi)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes, 1.0)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes+1, posX)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes+2, posY)
-          self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes+3, posZ)
-          self.MappingMatrixA_T.setValue(nSolidNodes, iGlobalVertexSolid, 1.0)
-          self.MappingMatrixA_T.setValue(nSolidNodes+1, iGlobalVertexSolid, posX)
-          self.MappingMatrixA_T.setValue(nSolidNodes+2, iGlobalVertexSolid, posY)
-          self.MappingMatrixA_T.setValue(nSolidNodes+3, iGlobalVertexSolid, posZ)
-
-    def TPSMeshMapping_B(self, solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc):
-        """
-        Description
+        # --- Compute the dense block of basis values between the local and the received solid interface nodes ---
+        NodesA = self.localSolidInterface_array
+        NodesB = solidInterfaceBuffRcv
+        phi = self.__TPS(spdist.cdist(NodesA, NodesB))
+
+        iGlobalVertexSolid = self.__getGlobalIndex('solid', myid, np.arange(NodesA.shape[0]))
+        jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, np.arange(NodesB.shape[0]))
+        self.__addMappingEntries('MappingMatrixA', np.repeat(iGlobalVertexSolid, NodesB.shape[0]), np.tile(jGlobalVertexSolid, NodesA.shape[0]), phi.ravel())
+        self.__addPolynomialEntries('MappingMatrixA', iGlobalVertexSolid, NodesA)
+
+    def TPSMeshMapping_B(self, solidInterfaceBuffRcv, iProc):
+        """
+        Fill the rows of the local fluid interface nodes in the TPS interpolation matrix B (fluid/solid).
         """
 
         if self.have_MPI == True:
@@ -1000,55 +849,123 @@ class Interface:
         else:
           myid = 0
         
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-          posX = self.localFluidInterface_array_X_init[iVertexFluid]
-          posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-          posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-          NodeA = np.array([posX, posY, posZ])
-          iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, iVertexFluid)
-          for jVertexSolid in range(nSolidNodes):
-            NodeB = np.array([solidInterfaceBuffRcv_X[jVertexSolid], solidInterfaceBuffRcv_Y[jVertexSolid], solidInterfaceBuffRcv_Z[jVertexSolid]])
-            distance = spdist.euclidean(NodeA, NodeB)
-            phi = self.__TPS(distance)
-            jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, jVertexSolid)
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, jGlobalVertexSolid, phi)
-            self.MappingMatrixB_T.setValue(jGlobalVertexSolid, iGlobalVertexFluid, phi)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes, 1.0)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes+1, posX)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes+2, posY)
-          self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes+3, posZ)
-          self.MappingMatrixB_T.setValue(nSolidNodes, iGlobalVertexFluid, 1.0)
-          self.MappingMatrixB_T.setValue(nSolidNodes+1, iGlobalVertexFluid, posX)
-          self.MappingMatrixB_T.setValue(nSolidNodes+2, iGlobalVertexFluid, posY)
-          self.MappingMatrixB_T.setValue(nSolidNodes+3, iGlobalVertexFluid, posZ)
+        # --- Compute the dense block of basis values between the local fluid and the received solid interface nodes ---
+        NodesA = self.localFluidInterface_array_init
+        NodesB = solidInterfaceBuffRcv
+        phi = self.__TPS(spdist.cdist(NodesA, NodesB))
+
+        iGlobalVertexFluid = self.__getGlobalIndex('fluid', myid, np.arange(NodesA.shape[0]))
+        jGlobalVertexSolid = self.__getGlobalIndex('solid', iProc, np.arange(NodesB.shape[0]))
+        self.__addMappingEntries('MappingMatrixB', np.repeat(iGlobalVertexFluid, NodesB.shape[0]), np.tile(jGlobalVertexSolid, NodesA.shape[0]), phi.ravel())
+        self.__addPolynomialEntries('MappingMatrixB', iGlobalVertexFluid, NodesA)
+
+    def __flattenNeighboors(self, neighboorsList):
+        """
+        Flatten the lists of neighboors returned by a ball query into the (iVertex, jVertex) arrays of all the pairs of nodes.
+        """
+        nNeighboors = np.array([len(neighboors) for neighboors in neighboorsList], dtype=int)
+        iVertex = np.repeat(np.arange(nNeighboors.shape[0]), nNeighboors)
+        jVertex = np.fromiter(chain.from_iterable(neighboorsList), dtype=int, count=nNeighboors.sum())
 
+        return iVertex, jVertex
+
+    def __addPolynomialEntries(self, name, iGlobalVertex, Nodes):
+        """
+        Store the polynomial terms (1, x, y[, z]) of the RBF/TPS interpolation for the rows iGlobalVertex (and columns for matrix A).
+        """
+        nVertex = iGlobalVertex.shape[0]
+        polyValues = np.column_stack((np.ones(nVertex), Nodes[:,:self.nDim]))
+        polyRows = np.repeat(iGlobalVertex, self.d_RBF)
+        polyCols = np.tile(self.nSolidInterfacePhysicalNodes + np.arange(self.d_RBF), nVertex)
+        self.__addMappingEntries(name, polyRows, polyCols, polyValues.ravel())
+        # The solid/solid system is symmetric, with the transposed polynomial terms as last rows
+        if name == 'MappingMatrixA':
+          self.__addMappingEntries(name, polyCols, polyRows, polyValues.ravel())
+
+    def __addMappingEntries(self, name, rows, cols, values):
+        """
+        Store a batch of (row, column, value) entries of the mapping matrix name.
+        The batches are inserted at once with the transposed entries by __assembleMappingMatrix.
+        """
+        if name not in self.mappingEntries:
+          self.mappingEntries[name] = []
+        self.mappingEntries[name].append((np.asarray(rows, dtype=int), np.asarray(cols, dtype=int), np.asarray(values, dtype=float)))
+
+    def __assembleMappingMatrix(self, name, nRows, nCols):
+        """
+        Preallocate, fill and assemble the mapping matrix name and its transpose from the stored batches of entries.
+        """
+        batches = self.mappingEntries.pop(name, [])
+        rows = np.concatenate([np.zeros(0, dtype=int)]+[batch[0] for batch in batches])
+        cols = np.concatenate([np.zeros(0, dtype=int)]+[batch[1] for batch in batches])
+        values = np.concatenate([np.zeros(0)]+[batch[2] for batch in batches])
+
+        # Keep the last value of the duplicated entries, as successive insertions would do
+        keys, last = np.unique((rows*nCols + cols)[::-1], return_index=True)
+        last = rows.shape[0] - 1 - last
+        rows, cols, values = rows[last], cols[last], values[last]
+
+        for Matrix, matRows, matCols, matSizes in ((getattr(self, name), rows, cols, (nRows, nCols)), (getattr(self, name+'_T'), cols, rows, (nCols, nRows))):
+          self.__preallocateMatrix(Matrix, matRows, matCols, matSizes[0], matSizes[1])
+          # Insert the entries row by row
+          order = np.argsort(matRows, kind='stable')
+          matRows, matCols, matValues = matRows[order], matCols[order], values[order]
+          uniqueRows, rowStart = np.unique(matRows, return_index=True)
+          rowStop = np.append(rowStart[1:], matRows.shape[0])
+          for iRow, start, stop in zip(uniqueRows, rowStart, rowStop):
+            Matrix.setValues(iRow, matCols[start:stop], matValues[start:stop])
+          Matrix.assemblyBegin()
+          Matrix.assemblyEnd()
+
+    def __preallocateMatrix(self, Matrix, rows, cols, nRows, nCols):
+        """
+        Set the exact number of nonzeros of the rows of Matrix owned by the current rank, from the entries (rows, cols) of all ranks.
+        """
+        if self.have_MPI == True:
+          myid = self.comm.Get_rank()
+          rowRanges = self.__getOwnershipRanges(nRows)
+          colRanges = self.__getOwnershipRanges(nCols)
+          # Diagonal block entries are in the columns owned by the rank that owns the row
+          owner = np.searchsorted(rowRanges, rows, side='right') - 1
+          diagonal = (cols >= colRanges[owner]) & (cols < colRanges[owner+1])
+          sendBuffNNZ = np.zeros((2, nRows), dtype=int)
+          sendBuffNNZ[0] = np.bincount(rows[diagonal], minlength=nRows)
+          sendBuffNNZ[1] = np.bincount(rows[~diagonal], minlength=nRows)
+          rcvBuffNNZ = np.zeros((2, nRows), dtype=int)
+          self.comm.Allreduce(sendBuffNNZ, rcvBuffNNZ, op=self.MPI.SUM)
+          start, stop = rowRanges[myid], rowRanges[myid+1]
+          Matrix.setPreallocationNNZ((rcvBuffNNZ[0,start:stop], rcvBuffNNZ[1,start:stop]))
+        else:
+          Matrix.setPreallocationNNZ(np.bincount(rows, minlength=nRows))
+
+    def __getOwnershipRanges(self, nGlobal):
+        """
+        Return the first index owned by each rank (and the total size) for the default PETSc layout of nGlobal entries.
+        """
+        nLocal = PETSc.Sys.splitOwnership(nGlobal, comm=self.comm)[0]
+        localSizes = self.comm.allgather(nLocal)
+
+        return np.concatenate(([0], np.cumsum(localSizes))).astype(int)
 
     def __CPC2(self, distance, rad):
         """
-        Description.
+        Compactly supported C2 radial basis function, evaluated for an array of distances.
         """
-        phi = 0.0
-        eps = distance/rad
+        eps = np.asarray(distance, dtype=float)/rad
  
-        if eps < 1:
-          phi = ((1.0-eps)**4)*(4.0*eps+1.0)
-        else:
-          phi = 0.0
+        phi = np.where(eps < 1.0, ((1.0-eps)**4)*(4.0*eps+1.0), 0.0)
 
         return phi
 
     def __TPS(self, distance):
         """
-        Description
+        Thin plate spline radial basis function, evaluated for an array of distances.
         """
-        phi = 0.0
+        distance = np.asarray(distance, dtype=float)
+        phi = np.zeros(distance.shape)
      
-        if distance > 0.0:
-          phi = (distance**2)*np.log10(distance)
-        else:
-          phi = 0.0
+        positive = distance > 0.0
+        phi[positive] = (distance[positive]**2)*np.log10(distance[positive])
 
         return phi            
 
@@ -1065,86 +982,35 @@ class Interface:
           MPIsize = 1
 
 
-        # --- Interpolate (or map) in parallel the solid interface displacement on the fluid interface ---
+        # --- Interpolate (or map) in parallel the solid interface displacement on the fluid interface (three components at once) ---
+        self.__packColumns(self.solidInterface_block_Disp, self.solidInterface_array_Disp)
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
-          if self.have_MPI == True:
-            gamma_array_DispX = PETSc.Vec().create(self.comm)
-            gamma_array_DispY = PETSc.Vec().create(self.comm)
-            gamma_array_DispZ = PETSc.Vec().create(self.comm)
-            gamma_array_DispX.setType('mpi')
-            gamma_array_DispY.setType('mpi')
-            gamma_array_DispZ.setType('mpi')
-            KSP_solver = PETSc.KSP().create(self.comm)
-          else:
-            gamma_array_DispX = PETSc.Vec().create()
-            gamma_array_DispY = PETSc.Vec().create()
-            gamma_array_DispZ = PETSc.Vec().create()
-            gamma_array_DispX.setType('seq')
-            gamma_array_DispY.setType('seq')
-            gamma_array_DispZ.setType('seq')
-            KSP_solver = PETSc.KSP().create()
-          gamma_array_DispX.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_DispY.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_DispZ.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_DispX.set(0.0)
-          gamma_array_DispY.set(0.0)
-          gamma_array_DispZ.set(0.0)
-          KSP_solver.setType('fgmres')
-          KSP_solver.getPC().setType('jacobi')
-          KSP_solver.setOperators(self.MappingMatrixA)
-          KSP_solver.setFromOptions()
-          #print(KSP_solver.getInitialGuessNonzero())
-          KSP_solver.setInitialGuessNonzero(True)
-          #print(KSP_solver.getInitialGuessNonzero())
-          KSP_solver.solve(self.solidInterface_array_DispX, gamma_array_DispX)
-          KSP_solver.solve(self.solidInterface_array_DispY, gamma_array_DispY)
-          KSP_solver.solve(self.solidInterface_array_DispZ, gamma_array_DispZ)
-          self.MappingMatrixB.mult(gamma_array_DispX, self.fluidInterface_array_DispX)
-          self.MappingMatrixB.mult(gamma_array_DispY, self.fluidInterface_array_DispY)
-          self.MappingMatrixB.mult(gamma_array_DispZ, self.fluidInterface_array_DispZ)
-          gamma_array_DispX.destroy()
-          gamma_array_DispY.destroy()
-          gamma_array_DispZ.destroy()
-          KSP_solver.destroy()
-          del gamma_array_DispX
-          del gamma_array_DispY
-          del gamma_array_DispZ
-          del KSP_solver
+          # Solve from the coefficients of the previous iteration
+          self.KSP_solver.matSolve(self.solidInterface_block_Disp, self.gamma_block_Disp)
+          self.__checkInterpolationSolve(self.KSP_solver)
+          self.fluidInterface_block_Disp = self.__matMult(self.MappingMatrixB, self.gamma_block_Disp, self.fluidInterface_block_Disp)
         else:  
-          self.MappingMatrix.mult(self.solidInterface_array_DispX, self.fluidInterface_array_DispX)
-          self.MappingMatrix.mult(self.solidInterface_array_DispY, self.fluidInterface_array_DispY)
-          self.MappingMatrix.mult(self.solidInterface_array_DispZ, self.fluidInterface_array_DispZ)
+          self.fluidInterface_block_Disp = self.__matMult(self.MappingMatrix, self.solidInterface_block_Disp, self.fluidInterface_block_Disp)
+        self.__unpackColumns(self.fluidInterface_block_Disp, self.fluidInterface_array_Disp)
 
-        # --- Checking conservation --- 
-        WSX = self.solidLoads_array_X.dot(self.solidInterface_array_DispX)
-        WSY = self.solidLoads_array_Y.dot(self.solidInterface_array_DispY)
-        WSZ = self.solidLoads_array_Z.dot(self.solidInterface_array_DispZ)
-
-        WFX = self.fluidLoads_array_X.dot(self.fluidInterface_array_DispX)
-        WFY = self.fluidLoads_array_Y.dot(self.fluidInterface_array_DispY)
-        WFZ = self.fluidLoads_array_Z.dot(self.fluidInterface_array_DispZ)
+        # --- Checking conservation (all the components with a single reduction) --- 
+        WS, WF = self.__reduceComponentProducts([(self.solidLoads_array, self.solidInterface_array_Disp), (self.fluidLoads_array, self.fluidInterface_array_Disp)])
 
 	self.MPIPrint("Checking f/s interface conservation...")
-	self.MPIPrint('Solid side (Wx, Wy, Wz) = ({}, {}, {})'.format(WSX, WSY, WSZ))        
-	self.MPIPrint('Fluid side (Wx, Wy, Wz) = ({}, {}, {})'.format(WFX, WFY, WFZ))
+	self.MPIPrint('Solid side (Wx, Wy, Wz) = ({}, {}, {})'.format(*WS))        
+	self.MPIPrint('Fluid side (Wx, Wy, Wz) = ({}, {}, {})'.format(*WF))
 
    
         # --- Redistribute the interpolated fluid interface according to the partitions that own the fluid interface ---
         # Gather the fluid interface on the master process
         if self.have_MPI == True:
-          sendBuff_X = None
-          sendBuff_Y = None
-          sendBuff_Z = None
-          self.fluidInterface_array_DispX_recon = None
-          self.fluidInterface_array_DispY_recon = None
-          self.fluidInterface_array_DispZ_recon = None
+          sendBuff = None
+          self.fluidInterface_array_Disp_recon = None
 
           if myid == self.rootProcess:
-            self.fluidInterface_array_DispX_recon = np.zeros(self.nFluidInterfacePhysicalNodes)
-            self.fluidInterface_array_DispY_recon = np.zeros(self.nFluidInterfacePhysicalNodes)
-            self.fluidInterface_array_DispZ_recon = np.zeros(self.nFluidInterfacePhysicalNodes)
+            self.fluidInterface_array_Disp_recon = np.zeros((self.nFluidInterfacePhysicalNodes, 3))
 
-          myNumberOfNodes = self.fluidInterface_array_DispX.getArray().shape[0]
+          myNumberOfNodes = self.fluidInterface_array_Disp.getArray().shape[0]
           sendBuffNumber = np.array([myNumberOfNodes], dtype=int)
           rcvBuffNumber = np.zeros(MPIsize, dtype=int)
           self.comm.Allgather(sendBuffNumber, rcvBuffNumber)
@@ -1157,60 +1023,32 @@ class Interface:
 
           del sendBuffNumber, rcvBuffNumber
               
-          #print("DEBUG MESSAGE From proc {}, counts = {}".format(myid, counts))
-          #print("DEBUG MESSAGE From proc {}, displ = {}".format(myid, displ))
-
-          self.comm.Gatherv(self.fluidInterface_array_DispX.getArray(), [self.fluidInterface_array_DispX_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
-          self.comm.Gatherv(self.fluidInterface_array_DispY.getArray(), [self.fluidInterface_array_DispY_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
-          self.comm.Gatherv(self.fluidInterface_array_DispZ.getArray(), [self.fluidInterface_array_DispZ_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
+          self.comm.Gatherv(self.fluidInterface_array_Disp.getArray(), [self.fluidInterface_array_Disp_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
 
-          # Send the partitioned interface to the right fluid partitions
+          # Send the partitioned interface to the right fluid partitions (one message with the three components)
           if myid == self.rootProcess:
             for iProc in self.fluidInterfaceProcessors:
-              sendBuff_X = np.zeros(self.fluidPhysicalInterfaceNodesDistribution[iProc])
-              sendBuff_Y = np.zeros(self.fluidPhysicalInterfaceNodesDistribution[iProc])
-              sendBuff_Z = np.zeros(self.fluidPhysicalInterfaceNodesDistribution[iProc])
               globalIndex = self.fluidGlobalIndexRange[iProc][iProc][0]
-              for iVertex in range(self.fluidPhysicalInterfaceNodesDistribution[iProc]):
-                sendBuff_X[iVertex] = self.fluidInterface_array_DispX_recon[globalIndex]
-                sendBuff_Y[iVertex] = self.fluidInterface_array_DispY_recon[globalIndex]
-                sendBuff_Z[iVertex] = self.fluidInterface_array_DispZ_recon[globalIndex]
-                globalIndex += 1
-              self.comm.Send(sendBuff_X, dest=iProc, tag = 1)
-              self.comm.Send(sendBuff_Y, dest=iProc, tag = 2)
-              self.comm.Send(sendBuff_Z, dest=iProc, tag = 3)
+              sendBuff = self.fluidInterface_array_Disp_recon[globalIndex:globalIndex+self.fluidPhysicalInterfaceNodesDistribution[iProc]].copy()
+              self.comm.Send(sendBuff, dest=iProc, tag = 1)
           if myid in self.fluidInterfaceProcessors:
-            self.localFluidInterface_array_DispX = np.zeros(self.nLocalFluidInterfacePhysicalNodes)
-            self.localFluidInterface_array_DispY = np.zeros(self.nLocalFluidInterfacePhysicalNodes)
-            self.localFluidInterface_array_DispZ = np.zeros(self.nLocalFluidInterfacePhysicalNodes)
-            self.comm.Recv(self.localFluidInterface_array_DispX, source=self.rootProcess, tag = 1)
-            self.comm.Recv(self.localFluidInterface_array_DispY, source=self.rootProcess, tag = 2)
-            self.comm.Recv(self.localFluidInterface_array_DispZ, source=self.rootProcess, tag = 3)
-          del sendBuff_X
-          del sendBuff_Y
-          del sendBuff_Z
+            self.localFluidInterface_array_Disp = np.zeros((self.nLocalFluidInterfacePhysicalNodes, 3))
+            self.comm.Recv(self.localFluidInterface_array_Disp, source=self.rootProcess, tag = 1)
+          del sendBuff
         else:
-          self.localFluidInterface_array_DispX = self.fluidInterface_array_DispX.getArray().copy()
-          self.localFluidInterface_array_DispY = self.fluidInterface_array_DispY.getArray().copy()
-          self.localFluidInterface_array_DispZ = self.fluidInterface_array_DispZ.getArray().copy()
+          self.localFluidInterface_array_Disp = self.fluidInterface_array_Disp.getArray().reshape(-1,3).copy()
 
-        # Special treatment for the halo nodes on the fluid interface
-        self.haloNodesDisplacements = {}
-        sendBuff = {}
+        # Special treatment for the halo nodes on the fluid interface (gathered from the FSI indexing of their owner)
         if self.have_MPI == True:
           if myid == self.rootProcess:
             for iProc in self.fluidInterfaceProcessors:
-              sendBuff = {}
-              for key in self.FluidHaloNodeList[iProc].keys():
-                globalIndex = self.fluidIndexing[key]
-                DispX = self.fluidInterface_array_DispX_recon[globalIndex]
-                DispY = self.fluidInterface_array_DispY_recon[globalIndex]
-                DispZ = self.fluidInterface_array_DispZ_recon[globalIndex]
-                sendBuff[key] = (DispX, DispY, DispZ)
-              self.comm.send(sendBuff, dest = iProc, tag=4)
+              sendBuff = self.fluidInterface_array_Disp_recon[self.__lookupIndexing(self.fluidIndexing, self.FluidHaloNodeList[iProc])]
+              self.comm.Send(sendBuff, dest = iProc, tag=4)
           if myid in self.fluidInterfaceProcessors:
-            self.haloNodesDisplacements = self.comm.recv(source = self.rootProcess, tag = 4)
-          del sendBuff
+            self.haloNodesDisplacements = np.zeros((self.nLocalFluidInterfaceHaloNode, 3))
+            self.comm.Recv(self.haloNodesDisplacements, source = self.rootProcess, tag = 4)
+        else:
+          self.haloNodesDisplacements = self.localFluidInterface_array_Disp[self.__lookupIndexing(self.fluidIndexing, self.FluidHaloNodeList[myid])]
 
     def interpolateFluidLoadsOnSolidMesh(self, FSI_config):
 	"""
@@ -1223,68 +1061,26 @@ class Interface:
           myid = 0
           MPIsize = 1
 	
-        # --- Interpolate (or map) in parallel the fluid interface loads on the solid interface ---
+        # --- Interpolate (or map) in parallel the fluid interface loads on the solid interface (three components at once) ---
 	#self.MappingMatrix.transpose()
+        self.__packColumns(self.fluidLoads_block, self.fluidLoads_array)
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
-          if self.have_MPI == True:
-            gamma_array_LoadX = PETSc.Vec().create(self.comm)
-            gamma_array_LoadY = PETSc.Vec().create(self.comm)
-            gamma_array_LoadZ = PETSc.Vec().create(self.comm)
-            gamma_array_LoadX.setType('mpi')
-            gamma_array_LoadY.setType('mpi')
-            gamma_array_LoadZ.setType('mpi')
-            KSP_solver = PETSc.KSP().create(self.comm)
-          else:
-            gamma_array_LoadX = PETSc.Vec().create()
-            gamma_array_LoadY = PETSc.Vec().create()
-            gamma_array_LoadZ = PETSc.Vec().create()
-            gamma_array_LoadX.setType('seq')
-            gamma_array_LoadY.setType('seq')
-            gamma_array_LoadZ.setType('seq')
-            KSP_solver = PETSc.KSP().create()
-          gamma_array_LoadX.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_LoadY.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_LoadZ.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_LoadX.set(0.0)
-          gamma_array_LoadY.set(0.0)
-          gamma_array_LoadZ.set(0.0)
-          KSP_solver.setType('fgmres')
-          KSP_solver.getPC().setType('jacobi')
-          KSP_solver.setOperators(self.MappingMatrixA_T)
-          KSP_solver.setFromOptions()
-          self.MappingMatrixB_T.mult(self.fluidLoads_array_X, gamma_array_LoadX)
-          self.MappingMatrixB_T.mult(self.fluidLoads_array_Y, gamma_array_LoadY)
-          self.MappingMatrixB_T.mult(self.fluidLoads_array_Z, gamma_array_LoadZ)
-          KSP_solver.solve(gamma_array_LoadX, self.solidLoads_array_X)
-          KSP_solver.solve(gamma_array_LoadY, self.solidLoads_array_Y)
-          KSP_solver.solve(gamma_array_LoadZ, self.solidLoads_array_Z)
-          gamma_array_LoadX.destroy()
-          gamma_array_LoadY.destroy()
-          gamma_array_LoadZ.destroy()
-          KSP_solver.destroy()
-          del gamma_array_LoadX
-          del gamma_array_LoadY
-          del gamma_array_LoadZ
-          del KSP_solver
+          # Solve from the solid loads of the previous iteration
+          self.gamma_block_Load = self.__matMult(self.MappingMatrixB_T, self.fluidLoads_block, self.gamma_block_Load)
+          self.KSP_solver_T.matSolve(self.gamma_block_Load, self.solidLoads_block)
+          self.__checkInterpolationSolve(self.KSP_solver_T)
         else:
-          self.MappingMatrix_T.mult(self.fluidLoads_array_X, self.solidLoads_array_X)
-          self.MappingMatrix_T.mult(self.fluidLoads_array_Y, self.solidLoads_array_Y)
-          self.MappingMatrix_T.mult(self.fluidLoads_array_Z, self.solidLoads_array_Z)
+          self.solidLoads_block = self.__matMult(self.MappingMatrix_T, self.fluidLoads_block, self.solidLoads_block)
+        self.__unpackColumns(self.solidLoads_block, self.solidLoads_array)
 
         # --- Redistribute the interpolated solid loads according to the partitions that own the solid interface ---
         # Gather the solid loads on the master process
         if self.have_MPI:
-          sendBuff_X = None
-          sendBuff_Y = None
-          sendBuff_Z = None
-          self.solidLoads_array_X_recon = None
-          self.solidLoads_array_Y_recon = None
-          self.solidLoads_array_Z_recon = None
+          sendBuff = None
+          self.solidLoads_array_recon = None
 	  if myid == self.rootProcess:
-	    self.solidLoads_array_X_recon = np.zeros(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-	    self.solidLoads_array_Y_recon = np.zeros(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-	    self.solidLoads_array_Z_recon = np.zeros(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          myNumberOfNodes =  self.solidLoads_array_X.getArray().shape[0]
+	    self.solidLoads_array_recon = np.zeros((self.nSolidInterfacePhysicalNodes+self.d_RBF, 3))
+          myNumberOfNodes =  self.solidLoads_array.getArray().shape[0]
           sendBuffNumber = np.array([myNumberOfNodes], dtype=int)
           rcvBuffNumber = np.zeros(MPIsize, dtype=int)
           self.comm.Allgather(sendBuffNumber, rcvBuffNumber)
@@ -1297,39 +1093,20 @@ class Interface:
 
           del sendBuffNumber, rcvBuffNumber   
 
-          self.comm.Gatherv(self.solidLoads_array_X.getArray(), [self.solidLoads_array_X_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
-          self.comm.Gatherv(self.solidLoads_array_Y.getArray(), [self.solidLoads_array_Y_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
-          self.comm.Gatherv(self.solidLoads_array_Z.getArray(), [self.solidLoads_array_Z_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
+          self.comm.Gatherv(self.solidLoads_array.getArray(), [self.solidLoads_array_recon, counts, displ, self.MPI.DOUBLE], root=self.rootProcess)
 
-          # Send the partitioned loads to the right solid partitions
+          # Send the partitioned loads to the right solid partitions (one message with the three components)
           if myid == self.rootProcess:
             for iProc in self.solidInterfaceProcessors:
-              sendBuff_X = np.zeros(self.solidPhysicalInterfaceNodesDistribution[iProc])
-              sendBuff_Y = np.zeros(self.solidPhysicalInterfaceNodesDistribution[iProc])
-              sendBuff_Z = np.zeros(self.solidPhysicalInterfaceNodesDistribution[iProc])
               globalIndex = self.solidGlobalIndexRange[iProc][iProc][0]
-              for iVertex in range(self.solidPhysicalInterfaceNodesDistribution[iProc]):
-                sendBuff_X[iVertex] = self.solidLoads_array_X_recon[globalIndex]
-                sendBuff_Y[iVertex] = self.solidLoads_array_Y_recon[globalIndex]
-                sendBuff_Z[iVertex] = self.solidLoads_array_Z_recon[globalIndex]
-                globalIndex += 1
-              self.comm.Send(sendBuff_X, dest=iProc, tag = 1)
-              self.comm.Send(sendBuff_Y, dest=iProc, tag = 2)
-              self.comm.Send(sendBuff_Z, dest=iProc, tag = 3)
+              sendBuff = self.solidLoads_array_recon[globalIndex:globalIndex+self.solidPhysicalInterfaceNodesDistribution[iProc]].copy()
+              self.comm.Send(sendBuff, dest=iProc, tag = 1)
           if myid in self.solidInterfaceProcessors:
-            self.localSolidLoads_array_X = np.zeros(self.nLocalSolidInterfaceNodes)
-            self.localSolidLoads_array_Y = np.zeros(self.nLocalSolidInterfaceNodes)
-            self.localSolidLoads_array_Z = np.zeros(self.nLocalSolidInterfaceNodes)
-            self.comm.Recv(self.localSolidLoads_array_X, source=self.rootProcess, tag = 1)
-            self.comm.Recv(self.localSolidLoads_array_Y, source=self.rootProcess, tag = 2)
-            self.comm.Recv(self.localSolidLoads_array_Z, source=self.rootProcess, tag = 3)
-          del sendBuff_X
-          del sendBuff_Y
-          del sendBuff_Z
+            self.localSolidLoads_array = np.zeros((self.nLocalSolidInterfaceNodes, 3))
+            self.comm.Recv(self.localSolidLoads_array, source=self.rootProcess, tag = 1)
+          del sendBuff
         else:
-          self.localSolidLoads_array_X = self.solidLoads_array_X.getArray().copy()
-          self.localSolidLoads_array_Y = self.solidLoads_array_Y.getArray().copy()
-          self.localSolidLoads_array_Z = self.solidLoads_array_Z.getArray().copy()
+          self.localSolidLoads_array = self.solidLoads_array.getArray().reshape(-1,3).copy()
 
         # Special treatment for the halo nodes on the fluid interface
         # TODO when we will use parallel solid solver !!
@@ -1383,29 +1160,13 @@ class Interface:
         else:
           myid = 0
 	
-        # --- Get the solid interface position from the solid solver and directly fill the corresponding PETSc vector ---
-        GlobalIndex = int()
-        localIndex = 0
-	for iVertex in range(self.nLocalSolidInterfaceNodes):
-          GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
-          if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-            pass
-          else:
-	    newDispx = SolidSolver.getInterfaceNodeDispX(self.solidInterfaceIdentifier, iVertex)
-	    newDispy = SolidSolver.getInterfaceNodeDispY(self.solidInterfaceIdentifier, iVertex)
-	    newDispz = SolidSolver.getInterfaceNodeDispZ(self.solidInterfaceIdentifier, iVertex)
-            iGlobalVertex = self.__getGlobalIndex('solid', myid, localIndex)
-            self.solidInterface_array_DispX.setValues([iGlobalVertex],newDispx)
-            self.solidInterface_array_DispY.setValues([iGlobalVertex],newDispy)
-            self.solidInterface_array_DispZ.setValues([iGlobalVertex],newDispz)
-            localIndex += 1
+        # --- Get the solid interface position from the solid solver and fill the corresponding PETSc vector ---
+        solidDisp = self.__getSolidInterfaceArray(SolidSolver, 'Disp')[~self.localSolidInterfaceHalo]
+        iGlobalVertex = self.localSolidInterfaceGlobalIndex
+        self.solidInterface_array_Disp.setValuesBlocked(iGlobalVertex, solidDisp.ravel())
 
-        self.solidInterface_array_DispX.assemblyBegin()
-        self.solidInterface_array_DispX.assemblyEnd()
-        self.solidInterface_array_DispY.assemblyBegin()
-        self.solidInterface_array_DispY.assemblyEnd()
-        self.solidInterface_array_DispZ.assemblyBegin()
-        self.solidInterface_array_DispZ.assemblyEnd()
+        self.solidInterface_array_Disp.assemblyBegin()
+        self.solidInterface_array_Disp.assemblyEnd()
 
     def getFluidInterfaceNodalForce(self, FSI_config, FluidSolver):
 	"""
@@ -1416,47 +1177,18 @@ class Interface:
         else:
           myid = 0
 
-        localIndex = 0
-        FX = 0.0
-        FY = 0.0
-        FZ = 0.0
-
-        # --- Get the fluid interface loads from the fluid solver and directly fill the corresponding PETSc vector ---
-	for iVertex in range(self.nLocalFluidInterfaceNodes):
-	    halo = FluidSolver.ComputeVertexForces(self.fluidInterfaceIdentifier, iVertex) # !!we have to ignore halo node coming from mesh partitioning because they introduice non-physical forces
-	    if halo==False:
-		if FSI_config['CSD_SOLVER'] == 'GETDP':
-		    newFx = FluidSolver.GetVertexForceDensityX(self.fluidInterfaceIdentifier, iVertex)
-	            newFy = FluidSolver.GetVertexForceDensityY(self.fluidInterfaceIdentifier, iVertex)
-	            newFz = FluidSolver.GetVertexForceDensityZ(self.fluidInterfaceIdentifier, iVertex)
-		else:
-	            newFx = FluidSolver.GetVertexForceX(self.fluidInterfaceIdentifier, iVertex)
-	            newFy = FluidSolver.GetVertexForceY(self.fluidInterfaceIdentifier, iVertex)
-	            newFz = FluidSolver.GetVertexForceZ(self.fluidInterfaceIdentifier, iVertex)
-                iGlobalVertex = self.__getGlobalIndex('fluid', myid, localIndex)
-                self.fluidLoads_array_X.setValues([iGlobalVertex], newFx)
-                self.fluidLoads_array_Y.setValues([iGlobalVertex], newFy)
-                self.fluidLoads_array_Z.setValues([iGlobalVertex], newFz)
-                FX += newFx
-                FY += newFy
-                FZ += newFz
-                localIndex += 1
+        # --- Get the fluid interface loads from the fluid solver and fill the corresponding PETSc vector ---
+        if self.nLocalFluidInterfaceNodes != 0:
+          # !!we have to ignore halo node coming from mesh partitioning because they introduice non-physical forces
+          fluidLoads = np.array(FluidSolver.GetVertexForces(self.fluidInterfaceIdentifier, FSI_config['CSD_SOLVER'] == 'GETDP')).reshape(-1,3)
+          fluidLoads = fluidLoads[~self.localFluidInterfaceHalo]
+        else:
+          fluidLoads = np.zeros((0,3))
+        iGlobalVertex = self.localFluidInterfaceGlobalIndex
+        self.fluidLoads_array.setValuesBlocked(iGlobalVertex, fluidLoads.ravel())
 
-        if self.have_MPI == True:
-          FX = self.comm.allreduce(FX)
-          FY = self.comm.allreduce(FY)
-          FZ = self.comm.allreduce(FZ)
-
-        self.fluidLoads_array_X.assemblyBegin()
-        self.fluidLoads_array_X.assemblyEnd()
-        self.fluidLoads_array_Y.assemblyBegin()
-        self.fluidLoads_array_Y.assemblyEnd()
-        self.fluidLoads_array_Z.assemblyBegin()
-        self.fluidLoads_array_Z.assemblyEnd()
-
-        FX_b = self.fluidLoads_array_X.sum()
-        FY_b = self.fluidLoads_array_Y.sum()
-        FZ_b = self.fluidLoads_array_Z.sum()
+        self.fluidLoads_array.assemblyBegin()
+        self.fluidLoads_array.assemblyEnd()
         
 
     def setFluidInterfaceVarCoord(self, FluidSolver):
@@ -1470,28 +1202,12 @@ class Interface:
           myid = 0
 	
         # --- Send the new fluid interface position to the fluid solver (on each partition, halo nodes included) ---
-        localIndex = 0
-	for iVertex in range(self.nLocalFluidInterfaceNodes):
-	    GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-            if GlobalIndex in self.FluidHaloNodeList[myid].keys():
-              posX0, posY0, posZ0 = self.haloNodesPositionsInit[GlobalIndex]
-              DispX, DispY, DispZ = self.haloNodesDisplacements[GlobalIndex]
-              posX = posX0 + DispX
-              posY = posY0 + DispY
-              posZ = posZ0 + DispZ
-              FluidSolver.SetVertexCoordX(self.fluidInterfaceIdentifier, iVertex, posX)
-              FluidSolver.SetVertexCoordY(self.fluidInterfaceIdentifier, iVertex, posY)
-              FluidSolver.SetVertexCoordZ(self.fluidInterfaceIdentifier, iVertex, posZ)
-            else:
-              posX = self.localFluidInterface_array_DispX[localIndex] + self.localFluidInterface_array_X_init[localIndex]
-              posY = self.localFluidInterface_array_DispY[localIndex] + self.localFluidInterface_array_Y_init[localIndex]
-              posZ = self.localFluidInterface_array_DispZ[localIndex] + self.localFluidInterface_array_Z_init[localIndex]
-              FluidSolver.SetVertexCoordX(self.fluidInterfaceIdentifier, iVertex, posX)
-              FluidSolver.SetVertexCoordY(self.fluidInterfaceIdentifier, iVertex, posY)
-              FluidSolver.SetVertexCoordZ(self.fluidInterfaceIdentifier, iVertex, posZ)
-              localIndex += 1
-            # Prepares the mesh deformation in the fluid solver
-	    nodalVarCoordNorm = FluidSolver.SetVertexVarCoord(self.fluidInterfaceIdentifier, iVertex)
+        if self.nLocalFluidInterfaceNodes != 0:
+          newCoords = np.zeros((self.nLocalFluidInterfaceNodes, 3))
+          newCoords[~self.localFluidInterfaceHalo] = self.localFluidInterface_array_Disp + self.localFluidInterface_array_init
+          newCoords[self.localFluidInterfaceHalo] = self.haloNodesDisplacements + self.haloNodesPositionsInit
+          # Prepares the mesh deformation in the fluid solver
+          FluidSolver.SetVertexVarCoords(self.fluidInterfaceIdentifier, newCoords.ravel().tolist())
 
 	    
     def setSolidInterfaceLoads(self, SolidSolver, FSI_config, time):
@@ -1504,47 +1220,22 @@ class Interface:
         else:
           myid = 0
 
-	FY = 0.0 # solid-side resultant forces
-        FX = 0.0
-        FZ = 0.0
-	FFX = 0.0 # fluid-side resultant forces
-	FFY = 0.0
-	FFZ = 0.0
-
-        # --- Check for total force conservation after interpolation
-        FFX = self.fluidLoads_array_X.sum()
-        FFY = self.fluidLoads_array_Y.sum()
-        FFZ = self.fluidLoads_array_Z.sum()
-
- 	
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-          FX += self.localSolidLoads_array_X[iVertex]
-          FY += self.localSolidLoads_array_Y[iVertex]
-          FZ += self.localSolidLoads_array_Z[iVertex]
-
+        # --- Check for total force conservation after interpolation (solid and fluid sides with a single reduction)
+        localForces = np.zeros((2,3))
+        if myid in self.solidInterfaceProcessors:
+          localForces[0] = self.localSolidLoads_array[:self.nLocalSolidInterfaceNodes].sum(axis=0)
+        localForces[1] = self.fluidLoads_array.getArray().reshape(-1,3).sum(axis=0)
         if self.have_MPI == True:
-          FX = self.comm.allreduce(FX)
-          FY = self.comm.allreduce(FY)
-          FZ = self.comm.allreduce(FZ)
+          localForces = self.comm.allreduce(localForces)
+        (FX, FY, FZ), (FFX, FFY, FFZ) = localForces
 
 	self.MPIPrint("Checking f/s interface total force...")
 	self.MPIPrint('Solid side (Fx, Fy, Fz) = ({}, {}, {})'.format(FX, FY, FZ))        
 	self.MPIPrint('Fluid side (Fx, Fy, Fz) = ({}, {}, {})'.format(FFX, FFY, FFZ))
 
-        # --- Send the new solid interface loads to the solid solver (on each partition, halo nodes included) ---
-        GlobalIndex = int()
-        localIndex = 0
+        # --- Send the new solid interface loads to the solid solver (on each partition, halo nodes excluded) ---
         if myid in self.solidInterfaceProcessors:
-          for iVertex in range(self.nLocalSolidInterfaceNodes):
-            GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
-            if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-              pass
-            else:
-              Fx = self.localSolidLoads_array_X[localIndex]
-	      Fy = self.localSolidLoads_array_Y[localIndex]
-	      Fz = self.localSolidLoads_array_Z[localIndex]
-              SolidSolver.applyload(iVertex, Fx, Fy, Fz, time)
-              localIndex += 1
+          self.__setSolidInterfaceLoadsArray(SolidSolver, self.localSolidLoads_array[:self.nLocalSolidInterfacePhysicalNodes], time)
           if FSI_config['CSD_SOLVER'] == 'NATIVE':  
             SolidSolver.setGeneralisedForce()
 	    SolidSolver.setGeneralisedMoment()
@@ -1559,61 +1250,17 @@ class Interface:
         else:
           myid = 0
 
-	normInterfaceResidualSquare = 0.0
+        # --- Fill the PETSc vector for the predicted solid interface position (predicted by the solid computation) ---
+        if myid in self.solidSolverProcessors:
+          predDisp = self.__getSolidInterfaceArray(SolidSolver, 'Disp')[~self.localSolidInterfaceHalo]
+          iGlobalVertex = self.localSolidInterfaceGlobalIndex
+          self.predDisp_array.setValuesBlocked(iGlobalVertex, predDisp.ravel())
+        self.predDisp_array.assemblyBegin()
+        self.predDisp_array.assemblyEnd()
 
-        # --- Create and fill the PETSc vector for the predicted solid interface position (predicted by the solid computation) ---
-        if self.have_MPI == True:
-          predDisp_array_X = PETSc.Vec().create(self.comm)
-          predDisp_array_X.setType('mpi')
-          predDisp_array_Y = PETSc.Vec().create(self.comm)
-          predDisp_array_Y.setType('mpi')
-          predDisp_array_Z = PETSc.Vec().create(self.comm)
-          predDisp_array_Z.setType('mpi')
-        else:
-          predDisp_array_X = PETSc.Vec().create()
-          predDisp_array_X.setType('seq')
-          predDisp_array_Y = PETSc.Vec().create()
-          predDisp_array_Y.setType('seq')
-          predDisp_array_Z = PETSc.Vec().create()
-          predDisp_array_Z.setType('seq') 
-        predDisp_array_X.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        predDisp_array_Y.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        predDisp_array_Z.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-	
-	if myid in self.solidSolverProcessors:
-	  for iVertex in range(self.nLocalSolidInterfaceNodes):
-	    predDispx = SolidSolver.getInterfaceNodeDispX(self.solidInterfaceIdentifier, iVertex)
-	    predDispy = SolidSolver.getInterfaceNodeDispY(self.solidInterfaceIdentifier, iVertex)
-	    predDispz = SolidSolver.getInterfaceNodeDispZ(self.solidInterfaceIdentifier, iVertex)
-            iGlobalVertex = self.__getGlobalIndex('solid', myid, iVertex)
-            predDisp_array_X.setValues([iGlobalVertex], predDispx)
-            predDisp_array_Y.setValues([iGlobalVertex], predDispy)
-            predDisp_array_Z.setValues([iGlobalVertex], predDispz)
-	
-	predDisp_array_X.assemblyBegin()
-	predDisp_array_X.assemblyEnd()
-	predDisp_array_Y.assemblyBegin()
-	predDisp_array_Y.assemblyEnd()
-	predDisp_array_Z.assemblyBegin()
-	predDisp_array_Z.assemblyEnd()
-
-        # --- Calculate the residual (vector and norm) ---
-        self.solidInterfaceResidual_array_X = predDisp_array_X - self.solidInterface_array_DispX
-        self.solidInterfaceResidual_array_Y = predDisp_array_Y - self.solidInterface_array_DispY
-        self.solidInterfaceResidual_array_Z = predDisp_array_Z - self.solidInterface_array_DispZ
-
-        normInterfaceResidual_X = self.solidInterfaceResidual_array_X.norm()
-        normInterfaceResidual_Y = self.solidInterfaceResidual_array_Y.norm()
-        normInterfaceResidual_Z = self.solidInterfaceResidual_array_Z.norm()
-
-        normInterfaceResidualSquare = normInterfaceResidual_X**2 + normInterfaceResidual_Y**2 + normInterfaceResidual_Z**2
-
-        predDisp_array_X.destroy()
-        predDisp_array_Y.destroy()
-        predDisp_array_Z.destroy()
-        del predDisp_array_X
-        del predDisp_array_Y
-        del predDisp_array_Z
+        # --- Calculate the residual (vector and norm) in place ---
+        self.solidInterfaceResidual_array.waxpy(-1.0, self.solidInterface_array_Disp, self.predDisp_array)
+        normInterfaceResidualSquare = self.solidInterfaceResidual_array.norm()**2
 
 	return sqrt(normInterfaceResidualSquare)
 
@@ -1626,6 +1273,10 @@ class Interface:
         else:
           myid = 0
 
+        if FSI_config['AITKEN_RELAX'] == 'IQN_ILS':
+          self.quasiNewtonSolidPosition(FSI_config)
+          return
+
         # --- Set the Aitken coefficient for the relaxation ---
 	if FSI_config['AITKEN_RELAX'] == 'STATIC':
 	    self.aitkenParam = FSI_config['AITKEN_PARAM']
@@ -1637,9 +1288,7 @@ class Interface:
 	self.MPIPrint('Aitken under-relaxation step with parameter {}'.format(self.aitkenParam))
 
         # --- Relax the solid interface position ---
-        self.solidInterface_array_DispX += self.aitkenParam*self.solidInterfaceResidual_array_X
-        self.solidInterface_array_DispY += self.aitkenParam*self.solidInterfaceResidual_array_Y
-        self.solidInterface_array_DispZ += self.aitkenParam*self.solidInterfaceResidual_array_Z
+        self.solidInterface_array_Disp.axpy(self.aitkenParam, self.solidInterfaceResidual_array)
 	
 
     def setAitkenCoefficient(self, FSI_config):
@@ -1647,65 +1296,82 @@ class Interface:
 	Computes the Aitken coefficients for solid displacement under-relaxation.
 	"""
 
-	deltaResNormSquare = 0.0
-	prodScalRes = 0.0
-	
-        # --- Create the PETSc vector for the difference between the residuals (current and previous FSI iter) ---
 	if self.FSIIter == 0:
 	    self.aitkenParam = max(FSI_config['AITKEN_PARAM'], self.aitkenParam)
 	else:
-            if self.have_MPI:
-              deltaResx_array_X = PETSc.Vec().create(self.comm)
-              deltaResx_array_X.setType('mpi')
-              deltaResx_array_Y = PETSc.Vec().create(self.comm)
-              deltaResx_array_Y.setType('mpi')
-              deltaResx_array_Z = PETSc.Vec().create(self.comm)
-              deltaResx_array_Z.setType('mpi')
-            else:
-              deltaResx_array_X = PETSc.Vec().create()
-              deltaResx_array_X.setType('seq')
-              deltaResx_array_Y = PETSc.Vec().create()
-              deltaResx_array_Y.setType('seq')
-              deltaResx_array_Z = PETSc.Vec().create()
-              deltaResx_array_Z.setType('seq')
-            deltaResx_array_X.setSizes(self.nSolidInterfacePhysicalNodes)
-            deltaResx_array_X.set(0.0)
-            deltaResx_array_Y.setSizes(self.nSolidInterfacePhysicalNodes)
-            deltaResx_array_Y.set(0.0)
-            deltaResx_array_Z.setSizes(self.nSolidInterfacePhysicalNodes)
-            deltaResx_array_Z.set(0.0)
-
-            # --- Compute the dynamic Aitken coefficient ---
-            deltaResx_array_X = self.solidInterfaceResidual_array_X - self.solidInterfaceResidualnM1_array_X
-            deltaResx_array_Y = self.solidInterfaceResidual_array_Y - self.solidInterfaceResidualnM1_array_Y
-            deltaResx_array_Z = self.solidInterfaceResidual_array_Z - self.solidInterfaceResidualnM1_array_Z
-
-            prodScalRes_X = deltaResx_array_X.dot(self.solidInterfaceResidualnM1_array_X)
-            prodScalRes_Y = deltaResx_array_Y.dot(self.solidInterfaceResidualnM1_array_Y)
-            prodScalRes_Z = deltaResx_array_Z.dot(self.solidInterfaceResidualnM1_array_Z)
-            prodScalRes = prodScalRes_X + prodScalRes_Y + prodScalRes_Z
-
-            deltaResNormSquare_X = (deltaResx_array_X.norm())**2
-            deltaResNormSquare_Y = (deltaResx_array_Y.norm())**2
-            deltaResNormSquare_Z = (deltaResx_array_Z.norm())**2
-	    deltaResNormSquare = deltaResNormSquare_X + deltaResNormSquare_Y + deltaResNormSquare_Z
+            # --- Compute the dynamic Aitken coefficient (in place, with a single reduction for both scalar products) ---
+            self.deltaRes_array.waxpy(-1.0, self.solidInterfaceResidualnM1_array, self.solidInterfaceResidual_array)
+            prodScalRes, deltaResNormSquare = self.__reduceComponentProducts([(self.deltaRes_array, self.solidInterfaceResidualnM1_array), (self.deltaRes_array, self.deltaRes_array)]).sum(axis=1)
 
 	    self.aitkenParam *= -prodScalRes/deltaResNormSquare
 
-            deltaResx_array_X.destroy()
-            deltaResx_array_Y.destroy()
-            deltaResx_array_Z.destroy()
-            del deltaResx_array_X
-            del deltaResx_array_Y
-            del deltaResx_array_Z
-
         self.aitkenParam = min(self.aitkenParam, 1.0)
         self.aitkenParam = max(self.aitkenParam, 0.0)
 
         # --- Update the value of the residual for the next FSI iteration ---
-        self.solidInterfaceResidual_array_X.copy(self.solidInterfaceResidualnM1_array_X)
-        self.solidInterfaceResidual_array_Y.copy(self.solidInterfaceResidualnM1_array_Y)
-        self.solidInterfaceResidual_array_Z.copy(self.solidInterfaceResidualnM1_array_Z)
+        self.solidInterfaceResidual_array.copy(self.solidInterfaceResidualnM1_array)
+
+    def quasiNewtonSolidPosition(self, FSI_config):
+        """
+        Updates the solid interface displacement with the interface quasi-Newton method IQN-ILS.
+        The inverse Jacobian of the residual is modelled by least-squares from the residual and displacement
+        differences of the current time step and of the IQN_REUSE_STEPS previous ones.
+        """
+        residual = self.solidInterfaceResidual_array.getArray().copy()
+        predDisp = self.solidInterface_array_Disp.getArray() + residual
+
+        # --- Store the new secant pair, or archive those of the previous time step on the first FSI iteration ---
+        if self.FSIIter == 0:
+          if len(self.IQN_V) > 0 and FSI_config['IQN_REUSE_STEPS'] > 0:
+            self.IQN_history.insert(0, (self.IQN_V, self.IQN_W))
+            del self.IQN_history[FSI_config['IQN_REUSE_STEPS']:]
+          self.IQN_V = []
+          self.IQN_W = []
+        else:
+          self.IQN_V.insert(0, residual - self.IQN_residual)
+          self.IQN_W.insert(0, predDisp - self.IQN_predDisp)
+        self.IQN_residual = residual
+        self.IQN_predDisp = predDisp
+
+        V = self.IQN_V + [v for V_step, W_step in self.IQN_history for v in V_step]
+        W = self.IQN_W + [w for V_step, W_step in self.IQN_history for w in W_step]
+
+        if len(V) == 0:
+          self.MPIPrint('IQN-ILS relaxation step with parameter {}'.format(FSI_config['AITKEN_PARAM']))
+          newDisp = predDisp - (1.0-FSI_config['AITKEN_PARAM'])*residual
+        else:
+          coeffs, nUsed = self.__solveIQNLeastSquares(np.column_stack(V), residual)
+          self.MPIPrint('IQN-ILS quasi-Newton step with {} out of {} secant pairs'.format(nUsed, len(V)))
+          newDisp = predDisp + np.column_stack(W).dot(coeffs)
+
+        self.solidInterface_array_Disp.setArray(newDisp)
+
+    def __solveIQNLeastSquares(self, V, residual):
+        """
+        Solves min ||V.c + r|| through the normal equations, assembled with a single reduction.
+        The columns that are nearly linearly dependent on the more recent ones are filtered out.
+        """
+        nCols = V.shape[1]
+        system = np.column_stack((V.T.dot(V), V.T.dot(residual)))
+        if self.have_MPI == True:
+          system = self.comm.allreduce(system)
+        G = system[:,:nCols]
+        b = system[:,nCols]
+
+        # --- Keep the column i when its component orthogonal to the kept ones is not negligible (Schur complement of the Gram matrix) ---
+        keep = []
+        for i in range(nCols):
+          orthoNormSquare = G[i,i]
+          if len(keep) > 0:
+            orthoNormSquare -= G[i,keep].dot(np.linalg.solve(G[np.ix_(keep,keep)], G[keep,i]))
+          if orthoNormSquare > 1e-10*G[i,i]:
+            keep.append(i)
+
+        coeffs = np.zeros(nCols)
+        if len(keep) > 0:
+          coeffs[keep] = np.linalg.solve(G[np.ix_(keep,keep)], -b[keep])
+
+        return coeffs, len(keep)
 
     def displacementPredictor(self, FSI_config , SolidSolver, deltaT):
 	"""
@@ -1730,130 +1396,41 @@ class Interface:
 	    alpha_0 = 0.0
 	    alpha_1 = 0.0
 
-        # --- Create the PETSc vectors to store the solid interface velocity ---
-        if self.have_MPI == True:
-          Vel_array_X = PETSc.Vec().create(self.comm)
-          Vel_array_X.setType('mpi')
-          Vel_array_Y = PETSc.Vec().create(self.comm)
-          Vel_array_Y.setType('mpi')
-          Vel_array_Z = PETSc.Vec().create(self.comm)
-          Vel_array_Z.setType('mpi')
-          VelnM1_array_X = PETSc.Vec().create(self.comm)
-          VelnM1_array_X.setType('mpi')
-          VelnM1_array_Y = PETSc.Vec().create(self.comm)
-          VelnM1_array_Y.setType('mpi')
-          VelnM1_array_Z = PETSc.Vec().create(self.comm)
-          VelnM1_array_Z.setType('mpi')
-        else:
-          Vel_array_X = PETSc.Vec().create()
-          Vel_array_X.setType('seq')
-          Vel_array_Y = PETSc.Vec().create()
-          Vel_array_Y.setType('seq')
-          Vel_array_Z = PETSc.Vec().create()
-          Vel_array_Z.setType('seq')
-          VelnM1_array_X = PETSc.Vec().create()
-          VelnM1_array_X.setType('seq')
-          VelnM1_array_Y = PETSc.Vec().create()
-          VelnM1_array_Y.setType('seq')
-          VelnM1_array_Z = PETSc.Vec().create()
-          VelnM1_array_Z.setType('seq')
-        Vel_array_X.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        Vel_array_Y.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        Vel_array_Z.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        Vel_array_X.set(0.0)
-        Vel_array_Y.set(0.0)
-        Vel_array_Z.set(0.0)
-        VelnM1_array_X.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        VelnM1_array_Y.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        VelnM1_array_Z.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-        VelnM1_array_X.set(0.0)
-        VelnM1_array_Y.set(0.0)
-        VelnM1_array_Z.set(0.0)
-
-
-        # --- Fill the PETSc vectors ---
-        GlobalIndex = int()
-        localIndex = 0
-	for iVertex in range(self.nLocalSolidInterfaceNodes):
-	    GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
-            if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-              pass
-            else:
-              iGlobalVertex = self.__getGlobalIndex('solid', myid, localIndex)
-	      velx = SolidSolver.getInterfaceNodeVelX(self.solidInterfaceIdentifier, iVertex)
-	      vely = SolidSolver.getInterfaceNodeVelY(self.solidInterfaceIdentifier, iVertex)
-	      velz = SolidSolver.getInterfaceNodeVelZ(self.solidInterfaceIdentifier, iVertex)
-	      velxNm1 = SolidSolver.getInterfaceNodeVelXNm1(self.solidInterfaceIdentifier, iVertex)
-	      velyNm1 = SolidSolver.getInterfaceNodeVelYNm1(self.solidInterfaceIdentifier, iVertex)
-	      velzNm1 = SolidSolver.getInterfaceNodeVelZNm1(self.solidInterfaceIdentifier, iVertex)
-              Vel_array_X.setValues([iGlobalVertex],velx)
-              Vel_array_Y.setValues([iGlobalVertex],vely)
-              Vel_array_Z.setValues([iGlobalVertex],velz)
-              VelnM1_array_X.setValues([iGlobalVertex],velxNm1)
-              VelnM1_array_Y.setValues([iGlobalVertex],velyNm1)
-              VelnM1_array_Z.setValues([iGlobalVertex],velzNm1)
-              localIndex += 1
-
-        Vel_array_X.assemblyBegin()
-        Vel_array_X.assemblyEnd()
-        Vel_array_Y.assemblyBegin()
-        Vel_array_Y.assemblyEnd()
-        Vel_array_Z.assemblyBegin()
-        Vel_array_Z.assemblyEnd()
-        VelnM1_array_X.assemblyBegin()
-        VelnM1_array_X.assemblyEnd()
-        VelnM1_array_Y.assemblyBegin()
-        VelnM1_array_Y.assemblyEnd()
-        VelnM1_array_Z.assemblyBegin()
-        VelnM1_array_Z.assemblyEnd()
-
-        # --- Predict the solid position for the next time step ---
-        self.solidInterface_array_DispX += alpha_0*deltaT*Vel_array_X + alpha_1*deltaT*(Vel_array_X - VelnM1_array_X)
-        self.solidInterface_array_DispY += alpha_0*deltaT*Vel_array_Y + alpha_1*deltaT*(Vel_array_Y - VelnM1_array_Y)
-        self.solidInterface_array_DispZ += alpha_0*deltaT*Vel_array_Z + alpha_1*deltaT*(Vel_array_Z - VelnM1_array_Z)
-
-        Vel_array_X.destroy()
-        Vel_array_Y.destroy()
-        Vel_array_Z.destroy()
-        VelnM1_array_X.destroy()
-        VelnM1_array_Y.destroy()
-        VelnM1_array_Z.destroy()
-        del Vel_array_X, Vel_array_Y, Vel_array_Z
-        del VelnM1_array_X, VelnM1_array_Y, VelnM1_array_Z
+        # --- Fill the PETSc vectors of the solid interface velocity ---
+        Vel = self.__getSolidInterfaceArray(SolidSolver, 'Vel')[~self.localSolidInterfaceHalo]
+        VelnM1 = self.__getSolidInterfaceArray(SolidSolver, 'VelNm1')[~self.localSolidInterfaceHalo]
+        iGlobalVertex = self.localSolidInterfaceGlobalIndex
+        self.Vel_array.setValuesBlocked(iGlobalVertex, Vel.ravel())
+        self.VelnM1_array.setValuesBlocked(iGlobalVertex, VelnM1.ravel())
+        self.Vel_array.assemblyBegin()
+        self.Vel_array.assemblyEnd()
+        self.VelnM1_array.assemblyBegin()
+        self.VelnM1_array.assemblyEnd()
+
+        # --- Predict the solid position for the next time step (Disp += alpha_0*dt*Vel + alpha_1*dt*(Vel - VelnM1), in place) ---
+        self.solidInterface_array_Disp.maxpy([(alpha_0+alpha_1)*deltaT, -alpha_1*deltaT], [self.Vel_array, self.VelnM1_array])
 
     def writeFSIHistory(self, TimeIter, time, varCoordNorm, FSIConv):
 	"""
 	Write the FSI history file of the computaion.
+	The file is kept open by the root process and written through a buffer (see FSI.io.FSIHistoryWriter), no synchronization is needed.
 	"""
 
-        if self.have_MPI == True:
-          myid = self.comm.Get_rank()
-        else:
-          myid = 0
-        
-        if myid == self.rootProcess:
-          if self.unsteady:	
-	    if TimeIter == 0:
-	      histFile = open('FSIhistory.dat', "w")
-              histFile.write("TimeIter\tTime\tFSIRes\tFSINbIter\n")
-	    else:
-	      histFile = open('FSIhistory.dat', "a")
+        if self.historyWriter is not None:
+          if self.unsteady:
 	    if FSIConv:
-	      histFile.write(str(TimeIter) + '\t' + str(time) + '\t' + str(varCoordNorm) + '\t' + str(self.FSIIter+1) + '\n')
+	      self.historyWriter.write([TimeIter, time, varCoordNorm, self.FSIIter+1], append = TimeIter != 0)
 	    else:
-	      histFile.write(str(TimeIter) + '\t' + str(time) + '\t' + str(varCoordNorm) + '\t' + str(self.FSIIter) + '\n')
-	    histFile.close()
+	      self.historyWriter.write([TimeIter, time, varCoordNorm, self.FSIIter], append = TimeIter != 0)
           else:
-            if self.FSIIter == 0:
-              histFile = open('FSIhistory.dat', "w")
-              histFile.write("FSI Iter\tFSIRes\n")
-            else :
-              histFile = open('FSIhistory.dat', "a")
-            histFile.write(str(self.FSIIter) + '\t' + str(varCoordNorm) + '\n')
-            histFile.close()
-          
-
-        self.MPIBarrier()
+            self.historyWriter.write([self.FSIIter, varCoordNorm], append = self.FSIIter != 0)
+        
+    def closeFSIHistory(self):
+        """
+        Flush and close the FSI history file.
+        """
+        if self.historyWriter is not None:
+          self.historyWriter.close()
 
     def __getGlobalIndex(self, physics, iProc, iLocalVertex):
         """
@@ -1869,6 +1446,114 @@ class Interface:
 
         return globalIndex
 	    
+    def __allgatherIndices(self, localIndices):
+        """
+        Allgathers the 1D integer arrays of all the partitions (single Allgatherv).
+        Returns the list of the arrays of each partition.
+        """
+        localIndices = np.ascontiguousarray(localIndices, dtype=np.int64)
+        if self.have_MPI == True:
+          MPIsize = self.comm.Get_size()
+          counts = np.zeros(MPIsize, dtype=int)
+          self.comm.Allgather(np.array(localIndices.shape[0], dtype=int), counts)
+          displ = np.zeros(MPIsize, dtype=int)
+          displ[1:] = np.cumsum(counts)[:-1]
+          allIndices = np.zeros(counts.sum(), dtype=np.int64)
+          self.comm.Allgatherv(localIndices, [allIndices, tuple(counts), tuple(displ), self.MPI.INT64_T])
+          return np.split(allIndices, displ[1:])
+        else:
+          return [localIndices.copy()]
+
+    def __buildIndexing(self, solverIndices, FSIIndices):
+        """
+        Builds the links between the solver indexing and the FSI indexing of the physical interface nodes of all the partitions.
+        Returns a (2, nNodes) array, the solver indices (sorted) and the corresponding FSI indices.
+        """
+        allSolverIndices = np.concatenate(self.__allgatherIndices(solverIndices))
+        allFSIIndices = np.concatenate(self.__allgatherIndices(FSIIndices))
+        order = np.argsort(allSolverIndices, kind='mergesort')
+
+        return np.vstack((allSolverIndices[order], allFSIIndices[order]))
+
+    def __lookupIndexing(self, indexing, solverIndices):
+        """
+        Get the FSI indices of an array of solver indices from the links built by __buildIndexing.
+        """
+        return indexing[1][np.searchsorted(indexing[0], solverIndices)]
+
+    def __getSolidInterfaceGlobalIndices(self, SolidSolver):
+        """
+        Get the array of the global indices of the solid interface nodes (halo nodes included) on the current partition.
+        Use the bulk accessor of the solid solver when available, the nodal accessor otherwise.
+        """
+        if hasattr(SolidSolver, 'getInterfaceNodeGlobalIndices'):
+          return np.array(SolidSolver.getInterfaceNodeGlobalIndices(self.solidInterfaceIdentifier), dtype=int)
+
+        solidGlobalIndex = np.zeros(self.nLocalSolidInterfaceNodes, dtype=int)
+        for iVertex in range(self.nLocalSolidInterfaceNodes):
+          solidGlobalIndex[iVertex] = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
+
+        return solidGlobalIndex
+
+    def __getSolidInterfaceArray(self, SolidSolver, quantity):
+        """
+        Get the (nLocalSolidInterfaceNodes, 3) array of the positions (quantity = 'Pos'), displacements (quantity = 'Disp')
+        or velocities at the current and previous time steps (quantity = 'Vel' or 'VelNm1') of the solid interface nodes.
+        Use the bulk accessor of the solid solver when available, the nodal accessors otherwise.
+        """
+        bulkAccessor, nodalAccessor = {'Pos': ('getInterfaceNodePositions', 'getInterfaceNodePos{}'),
+                                       'Disp': ('getInterfaceNodeDisplacements', 'getInterfaceNodeDisp{}'),
+                                       'Vel': ('getInterfaceNodeVelocities', 'getInterfaceNodeVel{}'),
+                                       'VelNm1': ('getInterfaceNodeVelocitiesNm1', 'getInterfaceNodeVel{}Nm1')}[quantity]
+        if hasattr(SolidSolver, bulkAccessor):
+          return np.array(getattr(SolidSolver, bulkAccessor)(self.solidInterfaceIdentifier), dtype=float).reshape(-1,3)
+
+        solidArray = np.zeros((self.nLocalSolidInterfaceNodes, 3))
+        for iVertex in range(self.nLocalSolidInterfaceNodes):
+          for iDim, direction in enumerate(['X', 'Y', 'Z']):
+            solidArray[iVertex, iDim] = getattr(SolidSolver, nodalAccessor.format(direction))(self.solidInterfaceIdentifier, iVertex)
+
+        return solidArray
+
+    def __setSolidInterfaceLoadsArray(self, SolidSolver, loads, time):
+        """
+        Applies the (nLocalSolidInterfacePhysicalNodes, 3) array of loads to the physical solid interface nodes.
+        Use the bulk accessor of the solid solver when available, the nodal accessor otherwise.
+        """
+        physicalVertices = np.flatnonzero(~self.localSolidInterfaceHalo)
+        if hasattr(SolidSolver, 'applyloads'):
+          SolidSolver.applyloads(physicalVertices, loads, time)
+          return
+
+        for iVertex, (Fx, Fy, Fz) in zip(physicalVertices.tolist(), loads.tolist()):
+          SolidSolver.applyload(iVertex, Fx, Fy, Fz, time)
+
+    def __createInterfaceVector(self, nNodes):
+        """
+        Creates a PETSc vector of the X, Y and Z components of nNodes interface nodes, interleaved (block size 3) and set to zero.
+        """
+        if self.have_MPI == True:
+          vec = PETSc.Vec().create(self.comm)
+          vec.setType('mpi')
+        else:
+          vec = PETSc.Vec().create()
+          vec.setType('seq')
+        vec.setSizes(3*nNodes, bsize=3)
+        vec.set(0.0)
+
+        return vec
+
+    def __reduceComponentProducts(self, pairList):
+        """
+        Returns the (nPairs, 3) array of the global scalar products of the X, Y and Z components of the pairs of interleaved PETSc vectors.
+        All the products are computed with a single reduction.
+        """
+        localProducts = np.array([(u.getArray()*v.getArray()).reshape(-1,3).sum(axis=0) for u, v in pairList])
+        if self.have_MPI == True:
+          return self.comm.allreduce(localProducts)
+
+        return localProducts
+	    
 
     def UnsteadyFSI(self,FSI_config, FluidSolver, SolidSolver):
 	  """ 
@@ -2026,6 +1711,7 @@ class Interface:
 		time += deltaT
 	  #--- End of the temporal loop --- #
 
+          self.closeFSIHistory()
           self.MPIBarrier()
 
 	  self.MPIPrint('\n*************************')
@@ -2111,6 +1797,7 @@ class Interface:
 	    FluidSolver.StaticMeshUpdate()
 	    self.FSIIter += 1
 
+          self.closeFSIHistory()
           self.MPIBarrier()
 
 	  self.MPIPrint('\nBGS is converged (strong coupling)')
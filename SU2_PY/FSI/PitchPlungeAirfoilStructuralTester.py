@@ -36,6 +36,30 @@ import scipy.linalg as linalg
 from math import *
 from util import switch
 
+def loadMeshTools():
+  """ Loads the mesh reader SU2/mesh/tools.py as a standalone module,
+      importing the SU2 package would require the SU2_RUN variable. """
+  if 'SU2.mesh.tools' in sys.modules:
+    return sys.modules['SU2.mesh.tools']
+  paths = [os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)] + sys.path
+  for path in paths:
+    filename = os.path.join(path, 'SU2', 'mesh', 'tools.py')
+    if os.path.exists(filename):
+      break
+  else:
+    raise ImportError('Cannot find SU2/mesh/tools.py')
+  try:
+    from importlib.util import spec_from_file_location, module_from_spec
+  except ImportError:
+    import imp
+    return imp.load_source('su2mesh_tools', filename)
+  spec = spec_from_file_location('su2mesh_tools', filename)
+  module = module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+su2mesh = loadMeshTools()
+
 # ----------------------------------------------------------------------
 #  Config class
 # ----------------------------------------------------------------------
@@ -227,84 +251,38 @@ class Solver:
             break
 
   def __readSU2Mesh(self):
-    """ Description. """
+    """ Reads the markers and their points (see SU2.mesh.read_surface),
+        self.node holds the Point of each marker point number. """
     
-    with open(self.Mesh_file, 'r') as meshfile:
-      print('Opened mesh file ' + self.Mesh_file + '.')
-      while 1:
-        line = meshfile.readline()
-	if not line:
-	  break
+    mesh = su2mesh.read(self.Mesh_file, surface=True)
+    print('Opened mesh file ' + self.Mesh_file + '.')
         
-	pos = line.find('NDIM')
-	if pos != -1:
-	  line = line.strip('\r\n')
-          line = line.split("=",1)
-	  self.nDim = int(line[1])
-	  continue
+    self.nDim = mesh['NDIME']
+    self.nElem = mesh['NELEM']
+    self.nPoint = mesh['NPOIN']
+    self.nMarker = mesh['NMARK']
 	
-	pos = line.find('NELEM')
-	if pos != -1:
-	  line = line.strip('\r\n')
-          line = line.split("=",1)
-	  self.nElem = int(line[1])
-	  continue
-
-	pos = line.find('NPOIN')
-	if pos != -1:
-	  line = line.strip('\r\n')
-          line = line.split("=",1)
-	  self.nPoint = int(line[1])
-          for iPoint in range(self.nPoint):
-	    self.node.append(Point())
-	    line = meshfile.readline()
-	    line = line.strip('\r\n')
-	    line = line.split(' ',self.nDim)
-	    x = float(line[0])
-	    y = float(line[1])
-            z = 0.0
-	    if self.nDim == 3:
-	      z = float(line[2])
-	    self.node[iPoint].SetCoord((x,y,z))
-            self.node[iPoint].SetCoord0((x,y,z))
-	    self.node[iPoint].SetCoord_n((x,y,z))
-	  continue
-
-	pos = line.find('NMARK')
-	if pos != -1:
-	  line = line.strip('\r\n')
-          line = line.split("=",1)
-	  self.nMarker = int(line[1])
-	  continue
-
-	pos = line.find('MARKER_TAG')
-	if pos != -1:
-	  line = line.strip('\r\n')
-	  line = line.replace(" ", "")
-          line = line.split("=",1)
-	  markerTag = line[1]
-	  if markerTag == self.FSI_marker:
-	    self.markers[markerTag] = []
-	    line = meshfile.readline()
-	    line = line.strip('\r\n')
-	    line = line.split("=",1)
-	    nElem = int(line[1])
-	    for iElem in range(nElem):
-	      line = meshfile.readline()
-	      line = line.strip('\r\n')
-	      line = line.split(' ',1)
-	      elemType = int(line[0])
-	      if elemType == 3:
-	        nodes = line[1].split(' ', 1)
-		if not int(nodes[0]) in self.markers[markerTag]:
-		   self.markers[markerTag].append(int(nodes[0]))
-		if not int(nodes[1]) in self.markers[markerTag]:
-		   self.markers[markerTag].append(int(nodes[1]))
-	      else:
-		print("Element type {} is not recognized !!".format(elemType))
-	    continue
-	  else:
-	    continue
+    coords = np.zeros((len(mesh['POIN_INDEX']), 3))
+    coords[:,0:self.nDim] = mesh['POIN'][:,0:self.nDim]
+    self.node = {}
+    for iPoint, coord in zip(mesh['POIN_INDEX'].tolist(), coords):
+      self.node[iPoint] = Point()
+      self.node[iPoint].SetCoord(coord)
+      self.node[iPoint].SetCoord0(coord)
+      self.node[iPoint].SetCoord_n(coord)
+
+    if self.FSI_marker in mesh['MARKS']:
+      markerElems = mesh['MARKS'][self.FSI_marker]['ELEM']
+      for elemType in markerElems.keys():
+        if elemType != 3:
+          print("Element type {} is not recognized !!".format(elemType))
+      if 3 in markerElems:
+        # marker nodes in order of first appearance
+        nodes = markerElems[3].ravel()
+        _, first = np.unique(nodes, return_index=True)
+        self.markers[self.FSI_marker] = nodes[np.sort(first)].tolist()
+      else:
+        self.markers[self.FSI_marker] = []
 
     print("Number of dimensions: {}".format(self.nDim))
     print("Number of elements: {}".format(self.nElem))
@@ -593,6 +571,14 @@ class Solver:
     iPoint = self.getInterfaceNodeGlobalIndex(makerID, iVertex)
     self.node[iPoint].SetForce((fx,fy,fz))
 
+  def applyloads(self, vertices, loads, time):
+    """ Applies the (nVertex, 3) array of loads to the given vertices of the marker. """
+
+    makerID = self.markers.keys()[0]
+    nodeList = self.markers[makerID]
+    for iVertex, load in zip(vertices, loads):
+      self.node[nodeList[iVertex]].SetForce(tuple(load))
+
   def getFSIMarkerID(self):
     """ Description. """
     
@@ -654,6 +640,23 @@ class Solver:
     Coord0 = self.node[iPoint].GetCoord0()
     return float(Coord[2]-Coord0[2])
 
+  def getInterfaceNodeGlobalIndices(self, markerID):
+    """ Global indices of all the nodes of the marker. """
+
+    return np.array(self.markers[markerID], dtype=int)
+
+  def getInterfaceNodePositions(self, markerID):
+    """ (nVertex, 3) array of the positions of all the nodes of the marker. """
+
+    Coords = [self.node[iPoint].GetCoord() for iPoint in self.markers[markerID]]
+    return np.array(Coords, dtype=float).reshape(-1,3)
+
+  def getInterfaceNodeDisplacements(self, markerID):
+    """ (nVertex, 3) array of the displacements of all the nodes of the marker. """
+
+    Disps = [self.node[iPoint].GetCoord()-self.node[iPoint].GetCoord0() for iPoint in self.markers[markerID]]
+    return np.array(Disps, dtype=float).reshape(-1,3)
+
   def getInterfaceNodeVelX(self, markerID, iVertex):
     """ Description """
 
@@ -696,6 +699,18 @@ class Solver:
     Vel = self.node[iPoint].GetVel_n()
     return float(Vel[2])
 
+  def getInterfaceNodeVelocities(self, markerID):
+    """ (nVertex, 3) array of the velocities of all the nodes of the marker. """
+
+    Vels = [self.node[iPoint].GetVel() for iPoint in self.markers[markerID]]
+    return np.array(Vels, dtype=float).reshape(-1,3)
+
+  def getInterfaceNodeVelocitiesNm1(self, markerID):
+    """ (nVertex, 3) array of the velocities at the previous time step of all the nodes of the marker. """
+
+    Vels = [self.node[iPoint].GetVel_n() for iPoint in self.markers[markerID]]
+    return np.array(Vels, dtype=float).reshape(-1,3)
+
   def getRotationCenterPosX(self):
     """ Description. """
 
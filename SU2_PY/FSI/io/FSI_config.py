@@ -56,6 +56,7 @@ class FSIConfig:
         self.ConfigFileName = FileName
         self._ConfigContent = {}
         self.readConfig()
+        self.applyDefaults()
 
     def __str__(self):
 	tempString = str()
@@ -92,6 +93,8 @@ class FSIConfig:
 	        #if case("MESH_DEF_NONLIN_ITER")       : pass
 		if case("RESTART_ITER")		      : pass
 		if case("NB_EXT_ITER")		      : pass
+                if case("IQN_REUSE_STEPS")            : pass
+                if case("FSI_HISTORY_FLUSH")          : pass
 	        if case("NB_FSI_ITER")		      :
 		    self._ConfigContent[this_param] = int(this_value)
 		    break
@@ -115,6 +118,8 @@ class FSIConfig:
                 if case("MESH_INTERP_METHOD")         : pass
 		if case("DISP_PRED")		      : pass
 		if case("AITKEN_RELAX")               : pass
+                if case("INTERP_LINEAR_SOLVER")       : pass
+                if case("FSI_HISTORY_FORMAT")         : pass
 	        if case("TIME_MARCHING")	      : pass
 		if case("INTERNAL_FLOW")	      : 
 	        #if case("MESH_DEF_METHOD")	      : pass
@@ -128,4 +133,16 @@ class FSIConfig:
 	
 
 
+    def applyDefaults(self):
+        """
+        Set the default value of the optional parameters that are not in the configuration file.
+        """
+        defaults = {'INTERP_LINEAR_SOLVER': 'ASM',
+                    'IQN_REUSE_STEPS': 0,
+                    'FSI_HISTORY_FORMAT': 'ASCII',
+                    'FSI_HISTORY_FLUSH': 1}
+        for key, value in defaults.items():
+            if key not in self._ConfigContent:
+                self._ConfigContent[key] = value
+
     #def dump()
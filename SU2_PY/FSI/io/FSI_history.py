@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+## \file FSI_history.py
+#  \brief Python class for writing the history file of FSI computation.
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# The current SU2 release has been coordinated by the
+# SU2 International Developers Society <www.su2devsociety.org>
+# with selected contributions from the open-source community.
+#
+# The main research teams contributing to the current release are:
+#  - Prof. Juan J. Alonso's group at Stanford University.
+#  - Prof. Piero Colonna's group at Delft University of Technology.
+#  - Prof. Nicolas R. Gauger's group at Kaiserslautern University of Technology.
+#  - Prof. Alberto Guardone's group at Polytechnic University of Milan.
+#  - Prof. Rafael Palacios' group at Imperial College London.
+#  - Prof. Vincent Terrapon's group at the University of Liege.
+#  - Prof. Edwin van der Weide's group at the University of Twente.
+#  - Lab. of New Concepts in Aeronautics at Tech. Institute of Aeronautics.
+#
+# Copyright 2012-2020, Francisco D. Palacios, Thomas D. Economon,
+#                      Tim Albring, and the SU2 contributors.
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  FSI History Writer Class
+# ----------------------------------------------------------------------
+
+class FSIHistoryWriter:
+    """
+    Class that writes the FSI history file, meant to be owned by the root process.
+    The file is kept open for the whole computation, written through a buffer and flushed every FlushFrequency records and when it is closed.
+    With Format = 'ASCII', the records are written as tab-separated text columns.
+    With Format = 'BINARY', a text header line with the column names is followed by the records as rows of little-endian doubles,
+    which can be read with numpy.fromfile(f, '<f8').reshape(-1, nColumns) once the header line is read.
+    """
+
+    def __init__(self, FileName, Columns, Format='ASCII', FlushFrequency=1):
+        self.FileName = FileName
+        self.Columns = Columns
+        self.Format = Format
+        self.FlushFrequency = max(FlushFrequency, 1)
+        self.histFile = None
+        self.nUnflushedRecords = 0
+
+    def open(self, append):
+        """
+        Open the file, appending to the existing history (restart) or starting a new one.
+        The header is written if the file is new or empty.
+        """
+        newHistory = (not append) or (not os.path.isfile(self.FileName)) or os.path.getsize(self.FileName) == 0
+        mode = 'w' if newHistory else 'a'
+        if self.Format == 'BINARY':
+          self.histFile = open(self.FileName, mode+'b', 2**16)
+          if newHistory:
+            self.histFile.write(('\t'.join(self.Columns) + '\n').encode())
+        else:
+          self.histFile = open(self.FileName, mode, 2**16)
+          if newHistory:
+            self.histFile.write('\t'.join(self.Columns) + '\n')
+        self.nUnflushedRecords = 0
+
+    def write(self, record, append=True):
+        """
+        Write one record (one value per column). The file is opened at the first record.
+        """
+        if self.histFile is None:
+          self.open(append)
+        if self.Format == 'BINARY':
+          self.histFile.write(np.asarray(record, dtype='<f8').tobytes())
+        else:
+          self.histFile.write('\t'.join([str(value) for value in record]) + '\n')
+        self.nUnflushedRecords += 1
+        if self.nUnflushedRecords >= self.FlushFrequency:
+          self.flush()
+
+    def flush(self):
+        """
+        Flush the buffered records to the file.
+        """
+        if self.histFile is not None:
+          self.histFile.flush()
+        self.nUnflushedRecords = 0
+
+    def close(self):
+        """
+        Flush and close the file. Can be called several times.
+        """
+        if self.histFile is not None:
+          self.flush()
+          self.histFile.close()
+          self.histFile = None
@@ -1 +1,2 @@
 from FSI_config import FSIConfig
+from FSI_history import FSIHistoryWriter
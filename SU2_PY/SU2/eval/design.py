@@ -33,7 +33,7 @@ import os, copy
 from .. import io   as su2io
 from .  import func as su2func
 from .  import grad as su2grad
-from ..io import redirect_folder, save_data
+from ..io import redirect_folder, redirect_series, save_data
 
 # todo:
 # shouldnt be needed, but self.append_state() (ie after initialization)
@@ -139,16 +139,19 @@ class Design(object):
         # output redirection, don't re-pull files
         with redirect_folder(folder,pull,link,force=False) as push:
             
-            # get timestamp
-            timestamp = state.tic()
+            # unpack a time series pack once for all runs
+            with redirect_series():
             
-            # run 
-            inputs = args + (config,state)
-            vals = eval_func(*inputs)
-            
-            # save design
-            if state.toc(timestamp):
-                save_data(filename,self)
+                # get timestamp
+                timestamp = state.tic()
+                
+                # run 
+                inputs = args + (config,state)
+                vals = eval_func(*inputs)
+                
+                # save design
+                if state.toc(timestamp):
+                    save_data(filename,self)
             
         #: with redirect folder
         
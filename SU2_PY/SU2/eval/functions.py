@@ -33,7 +33,7 @@ import os, sys, shutil, copy, time, subprocess
 from .. import run  as su2run
 from .. import io   as su2io
 from .. import util as su2util
-from ..io import redirect_folder, redirect_output
+from ..io import redirect_folder, redirect_output, redirect_series
 
 
 # ----------------------------------------------------------------------
@@ -80,6 +80,13 @@ def function( func_name, config, state=None ):
     func_name_string = func_name
     if multi_objective:   func_name_string = func_name[0]  
 
+    # persistent evaluation cache
+    cache = su2io.active_cache()
+    if cache:
+        cache_key = cache.key(config)
+        if not func_name_string in state['FUNCTIONS']:
+            cache.restore(cache_key,state)
+
     # redundancy check
     if not func_name_string in state['FUNCTIONS']:
 
@@ -106,6 +113,8 @@ def function( func_name, config, state=None ):
         else:
             raise Exception('unknown function name, %s. Please check config_template.cfg for updated list of function names' % func_name)
         
+        if cache: cache.record(cache_key,state)
+        
     #: if not redundant
 
     # prepare output
@@ -240,8 +249,7 @@ def aerodynamics( config, state=None ):
     # files: direct solution
     if 'DIRECT' in files:
         name = files['DIRECT']
-        name = su2io.expand_zones(name, config)
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend( name )
         ##config['RESTART_SOL'] = 'YES' # don't override config file
     else:
@@ -268,8 +276,21 @@ def aerodynamics( config, state=None ):
     with redirect_folder( 'DIRECT', pull, link ) as push:
         with redirect_output(log_direct):     
             
+            # restart from a direct solution handed off as a time series
+            restart_series = None
+            solution_name  = config.get('SOLUTION_FILENAME')
+            if ( 'DIRECT' in files and su2io.is_series(files['DIRECT']) and
+                 config.get('RESTART_SOL','NO') == 'YES' ) :
+                restart_series = files['DIRECT']
+                config.SOLUTION_FILENAME = restart_series
+            
             # # RUN DIRECT SOLUTION # #
-            info = su2run.direct(config)
+            try:
+                with redirect_series(restart_series):
+                    info = su2run.direct(config)
+            finally:
+                if restart_series:
+                    config.SOLUTION_FILENAME = solution_name
 
 
 
@@ -288,8 +309,7 @@ def aerodynamics( config, state=None ):
             
             # direct files to push
             name = info.FILES['DIRECT']
-            name = su2io.expand_zones(name,konfig)
-            name = su2io.expand_time(name,konfig)
+            name = su2io.series_files(name,konfig)
             push.extend(name)
             
             # equivarea files to push
@@ -308,6 +328,18 @@ def aerodynamics( config, state=None ):
                 push.append(info.FILES['FLOW_META'])
                 
     #: with output redirection
+
+    # store direct solutions, the files of a series folder or its pack
+    store = su2io.active_store()
+    if store:
+        names = su2io.series_files(state.FILES['DIRECT'],konfig)
+        for name in names:
+            if os.path.isdir(name):
+                for member in su2io.read_manifest(name):
+                    store.add(os.path.join(name,member))
+            elif os.path.exists(name):
+                store.add(name)
+
     su2io.update_persurface(konfig,state)
     # return output 
     funcs = su2util.ordered_bunch()
@@ -377,7 +409,7 @@ def stability( config, state=None, step=1e-2 ):
     # files: direct solution
     if 'DIRECT' in files:
         name = files['DIRECT']
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend( name )
         ##config['RESTART_SOL'] = 'YES' # don't override config file
     else:
@@ -557,7 +589,7 @@ def multipoint( config, state=None, step=1e-2 ):
     # files: direct solution
     if 'DIRECT' in files:
         name = files['DIRECT']
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend( name )
     else:
         config['RESTART_SOL'] = 'NO'
@@ -638,7 +670,7 @@ def multipoint( config, state=None, step=1e-2 ):
         # files: direction solution
         if 'DIRECT' in files:
             name = files['DIRECT']
-            name = su2io.expand_time(name,konfig)
+            name = su2io.series_files(name,konfig)
             link.extend( name )
         else:
             konfig['RESTART_SOL'] = 'NO'
@@ -687,12 +719,15 @@ def multipoint( config, state=None, step=1e-2 ):
                     push.append(ztate.FILES['FLOW_META'])
                 
                 # direct files to push
-                dst_direct = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES['DIRECT']
                 name = ztate.FILES['DIRECT']
-                name = su2io.expand_zones(name,konfig)
-                name = su2io.expand_time(name,konfig)
+                name = su2io.series_files(name,konfig)
                 push.extend(name)
 
+                # a time series is linked as one folder or pack
+                link_direct = ztate.FILES['DIRECT']
+                if su2io.is_series(link_direct): link_direct = name[0]
+                dst_direct = os.path.abspath(dst).rstrip('/')+'/'+link_direct
+
                 if 'MULTIPOINT_MESH_FILENAME' in state.FILES:
                     # Mesh files to push
                     dst_mesh = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES['MESH']
@@ -703,7 +738,7 @@ def multipoint( config, state=None, step=1e-2 ):
 
         # Link direct solution to MULTIPOINT_# folder
         src = os.getcwd()
-        src_direct = os.path.abspath(src).rstrip('/')+'/'+ztate.FILES['DIRECT']
+        src_direct = os.path.abspath(src).rstrip('/')+'/'+link_direct
 
         # make unix link
         os.symlink(src_direct, dst_direct)
@@ -905,6 +940,35 @@ def update_mesh(config,state=None):
     deform_todo = not config['DV_VALUE_NEW'] == config['DV_VALUE_OLD']
     if deform_set and deform_todo:
     
+        # evaluation cache, keyed by the mesh the deformation starts from
+        cache = su2io.active_cache()
+        mesh_start = config['MESH_FILENAME']
+
+        # artifact store, deformations already stored are not repeated
+        store = su2io.active_store()
+        if store:
+            task = su2io.store.deform_task(config,store)
+            mesh_key = store.lookup(task)
+        else:
+            mesh_key = None
+
+        if mesh_key:
+            meshname = su2io.add_suffix(config['MESH_FILENAME'],'deform')
+            store.link(mesh_key,meshname)
+
+            config.update({ 'MESH_FILENAME' : meshname               ,
+                            'DV_VALUE_OLD'  : config['DV_VALUE_NEW'] })
+
+            info = su2io.State()
+            info.FILES.MESH = meshname
+            info.VARIABLES.DV_VALUE_NEW = config.DV_VALUE_NEW
+            state.update(info)
+
+            if cache:
+                cache.remember_deformation(mesh_start,meshname)
+
+            return
+
         # files to pull
         pull = []
         link = config['MESH_FILENAME']
@@ -925,6 +989,13 @@ def update_mesh(config,state=None):
         
         #: with redirect output
         
+        # store deformed mesh
+        if store:
+            store.remember( task, store.add(meshname) )
+
+        if cache:
+            cache.remember_deformation(mesh_start,meshname)
+
     elif deform_set and not deform_todo:
         state.VARIABLES.DV_VALUE_NEW = config.DV_VALUE_NEW
 
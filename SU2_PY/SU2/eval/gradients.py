@@ -34,7 +34,7 @@ from .. import run  as su2run
 from .. import io   as su2io
 from .. import util as su2util
 from .functions import function, update_mesh
-from ..io import redirect_folder, redirect_output
+from ..io import redirect_folder, redirect_output, redirect_series
 from SU2.eval import functions
 
 # ----------------------------------------------------------------------
@@ -84,6 +84,13 @@ def gradient( func_name, method, config, state=None ):
         config.OPT_COMBINE_OBJECTIVE="NO"
         config.OBJECTIVE_WEIGHT = "1.0"
 
+    # persistent evaluation cache
+    cache = su2io.active_cache()
+    if cache:
+        cache_key = cache.key(config)
+        if not func_output in state['GRADIENTS']:
+            cache.restore(cache_key,state)
+
     # redundancy check
     if not func_output in state['GRADIENTS']:
 
@@ -126,6 +133,7 @@ def gradient( func_name, method, config, state=None ):
         
         # store
         state['GRADIENTS'].update(grads)
+        if cache: cache.record(cache_key,state)
 
     # if not redundant
 
@@ -241,8 +249,7 @@ def adjoint( func_name, config, state=None ):
 
     # files: direct solution
     name = files['DIRECT']
-    name = su2io.expand_zones(name,konfig)
-    name = su2io.expand_time(name,konfig)
+    name = su2io.series_files(name,konfig)
     link.extend(name)
     # files restart
     if config.get('TIME_DOMAIN', 'NO') == 'YES' and config.get('RESTART_SOL', 'NO') == 'YES':
@@ -261,8 +268,7 @@ def adjoint( func_name, config, state=None ):
     # files: adjoint solution
     if ADJ_NAME in files:
         name = files[ADJ_NAME]
-        name = su2io.expand_zones(name,konfig)
-        name = su2io.expand_time(name,konfig)
+        name = su2io.series_files(name,konfig)
         link.extend(name)       
     else:
         config['RESTART_SOL'] = 'NO' #Can this be deleted?
@@ -312,7 +318,17 @@ def adjoint( func_name, config, state=None ):
                 konfig['TIME_ITER'] = konfig['TIME_ITER'] - int(konfig['RESTART_ITER'])
                 konfig.RESTART_SOL = 'NO'
 
-            info = su2run.adjoint(konfig)
+            # direct solution handed off as a time series
+            solution_name = konfig.get('SOLUTION_FILENAME')
+            if su2io.is_series(files['DIRECT']):
+                konfig.SOLUTION_FILENAME = files['DIRECT']
+
+            try:
+                with redirect_series(files['DIRECT']):
+                    info = su2run.adjoint(konfig)
+            finally:
+                if su2io.is_series(files['DIRECT']):
+                    konfig.SOLUTION_FILENAME = solution_name
             # Workaround, since expandTime relies on UNST_ADJOINT_ITER to determine number of solution files.
             if restart_sol_activated:
                 konfig['UNST_ADJOINT_ITER'] = original_time_iter - int(konfig['RESTART_ITER'])
@@ -326,8 +342,7 @@ def adjoint( func_name, config, state=None ):
 
             # solution files to push
             name = state.FILES[ADJ_NAME]
-            name = su2io.expand_zones(name,konfig)
-            name = su2io.expand_time(name,konfig)
+            name = su2io.series_files(name,konfig)
             push.extend(name)
 
     #: with output redirection
@@ -407,7 +422,7 @@ def stability( func_name, config, state=None, step=1e-2 ):
     # files: adjoint solution
     if ADJ_NAME in files:
         name = files[ADJ_NAME]
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend(name)       
     else:
         config['RESTART_SOL'] = 'NO'        
@@ -564,7 +579,7 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
     # files: adjoint solution
     if ADJ_NAME in files:
         name = files[ADJ_NAME]
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend(name)
         solution_adj_list[0] = files[ADJ_NAME]
     else:
@@ -630,13 +645,13 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
         # files: direct solution
         if 'DIRECT' in files:
             name = files['DIRECT']
-            name = su2io.expand_time(name,konfig)
+            name = su2io.series_files(name,konfig)
             link.extend( name )
 
         # files: adjoint solution
         if ADJ_NAME in files:
             name = files[ADJ_NAME]
-            name = su2io.expand_time(name,konfig)
+            name = su2io.series_files(name,konfig)
             link.extend(name)
         else:
             konfig['RESTART_SOL'] = 'NO'
@@ -674,17 +689,20 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
                     os.rename('flow.meta', flow_meta_list[i+1])
 
                 # adjoint files to push
-                dst = os.getcwd()
-                dst = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES[ADJ_NAME]
                 name = ztate.FILES[ADJ_NAME]
                 solution_adj_list[i+1] = name
-                name = su2io.expand_zones(name,konfig)
-                name = su2io.expand_time(name,konfig)
+                name = su2io.series_files(name,konfig)
                 push.extend(name)
 
+                # a time series is linked as one folder or pack
+                link_adj = ztate.FILES[ADJ_NAME]
+                if su2io.is_series(link_adj): link_adj = name[0]
+                dst = os.getcwd()
+                dst = os.path.abspath(dst).rstrip('/')+'/'+link_adj
+
         # Link adjoint solution to MULTIPOINT_# folder
         src = os.getcwd()
-        src = os.path.abspath(src).rstrip('/')+'/'+ztate.FILES[ADJ_NAME]
+        src = os.path.abspath(src).rstrip('/')+'/'+link_adj
       
         # make unix link
         string = "ln -s " + src + " " + dst
@@ -835,7 +853,7 @@ def findiff( config, state=None ):
     # files: direct solution
     if 'DIRECT' in files:
         name = files['DIRECT']
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend(name)
 
     # files: target equivarea distribution
@@ -851,9 +869,9 @@ def findiff( config, state=None ):
         pull.append(files['TARGET_HEATFLUX'])
 
        
-    # output redirection
+    # output redirection, a time series pack is unpacked once for all steps
     with redirect_folder('FINDIFF',pull,link) as push:
-        with redirect_output(log_findiff):
+        with redirect_output(log_findiff), redirect_series():
 
             # iterate each dv    
             for i_dv in range(n_dv):
@@ -1123,7 +1141,7 @@ def directdiff( config, state=None ):
     # files: direct solution
     if 'DIRECT' in files:
         name = files['DIRECT']
-        name = su2io.expand_time(name,config)
+        name = su2io.series_files(name,config)
         link.extend(name)
 
     # files: target equivarea distribution
@@ -1138,9 +1156,9 @@ def directdiff( config, state=None ):
     if 'INV_DESIGN_HEATFLUX' in special_cases and 'TARGET_HEATFLUX' in files:
         pull.append(files['TARGET_HEATFLUX'])
 
-    # output redirection
+    # output redirection, a time series pack is unpacked once for all steps
     with redirect_folder('DIRECTDIFF',pull,link) as push:
-        with redirect_output(log_directdiff):
+        with redirect_output(log_directdiff), redirect_series():
 
             # iterate each dv
             for i_dv in range(n_dv):
@@ -1,10 +1,15 @@
 # SU2/io/__init__.py
 
 from .tools    import *
+from .stage    import *
+from .series   import *
 from .redirect import output as redirect_output
 from .redirect import folder as redirect_folder
+from .redirect import series as redirect_series
 from .data     import load_data, save_data
 from .filelock import filelock
+from .store    import ArtifactStore, active_store
+from .cache    import EvalCache, active_cache
 
 from .config   import Config
 from .state    import State_Factory as State
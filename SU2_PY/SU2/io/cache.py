@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+## \file cache.py
+#  \brief persistent cache of design evaluations
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, copy, glob, hashlib
+from .data  import load_data, save_data
+from .store import file_digest
+
+#: the cache used by the tool chain, see activate()
+_active = []
+
+def active_cache():
+    """ cache = SU2.io.active_cache()
+        returns the evaluation cache in use, or None
+    """
+    if _active:
+        return _active[-1]
+    return None
+
+class activate(object):
+    """ with SU2.io.cache.activate(cache):
+
+        Makes cache the active evaluation cache when used in a
+        'with' contextmanager, does nothing if cache is None
+    """
+    def __init__(self, cache):
+        self.cache = cache
+
+    def __enter__(self):
+        if self.cache is not None:
+            _active.append(self.cache)
+        return self.cache
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.cache is not None:
+            _active.remove(self.cache)
+
+
+# ----------------------------------------------------------------------
+#  Config Fingerprint
+# ----------------------------------------------------------------------
+
+#: config parameters that do not change the evaluation results
+ignored_keys = [ 'DV_VALUE_OLD' , 'RESTART_SOL'  , 'HISTORY_OUTPUT' ,
+                 'CONSOLE'      , 'NUMBER_PART'  , 'OUTPUT_FILES'   ,
+                 'TABULAR_FORMAT' , 'OUTPUT_WRT_FREQ' , 'SCREEN_OUTPUT' ,
+                 'OPT_ITERATIONS' , 'OPT_ACCURACY'    ,
+                 'OPT_BOUND_UPPER', 'OPT_BOUND_LOWER' ]
+
+def solver_version():
+    """ version = SU2.io.cache.solver_version()
+        identifies the SU2_CFD binary in SU2_RUN by size and mtime
+    """
+    binary = os.path.join(os.environ.get('SU2_RUN',''),'SU2_CFD')
+    if not os.path.exists(binary):
+        return 'unknown'
+    info = os.stat(binary)
+    return '%i:%i' % (info.st_size,int(info.st_mtime))
+
+def config_fingerprint(config,digests=None,origins=None):
+    """ key = SU2.io.cache.config_fingerprint(config,digests=None,origins=None)
+
+        sha1 key of the parameters of a config that determine its
+        evaluation results, the design vector, the content of the
+        mesh the design starts from and the version of the solver.
+        Filenames are not part of the key.
+
+        A deformed mesh is traced back to the mesh it was deformed
+        from with origins, a dictionary of the content digests of
+        the deformed meshes and of their input meshes, see
+        EvalCache.remember_deformation().
+        Returns None if the mesh does not exist.
+    """
+
+    mesh_name = config['MESH_FILENAME']
+    if not os.path.exists(mesh_name):
+        return None
+    mesh_key = file_digest(mesh_name,digests)
+    if origins:
+        seen = set()
+        while mesh_key in origins and not mesh_key in seen:
+            seen.add(mesh_key)
+            mesh_key = origins[mesh_key]
+
+    items = []
+    for key in sorted(config.keys()):
+        if key in ignored_keys: continue
+        if key.endswith('_FILENAME'): continue
+        if key == 'DV_VALUE_NEW':
+            value = ','.join([ '%.12g' % float(v) for v in config[key] ])
+        else:
+            value = str(config[key])
+        items.append('%s=%s' % (key,value))
+
+    items.append('MESH=%s' % mesh_key)
+
+    items.append('SOLVER=%s' % solver_version())
+
+    return hashlib.sha1('\n'.join(items).encode()).hexdigest()
+
+#: def config_fingerprint()
+
+
+# ----------------------------------------------------------------------
+#  Evaluation Cache Class
+# ----------------------------------------------------------------------
+
+class EvalCache(object):
+    """ cache = SU2.io.EvalCache(folder,max_entries=1000,max_size=None)
+
+        Persistent cache of function and gradient values, keyed by
+        SU2.io.cache.config_fingerprint(). Each entry also points to
+        the solution files of the evaluation. The least recently
+        used entries are removed when there are more than
+        max_entries, or when they take more than max_size bytes.
+
+        Example:
+
+        cache = SU2.io.EvalCache('~/.su2_cache')
+        with cache:
+            # SU2.eval.func() and SU2.eval.grad() consult the
+            # active cache before launching a solver
+            ...
+
+        Methods:
+            key(config)       - cache key of a config, None if
+                                the config cannot be cached
+            restore(key,state)- updates state from an entry
+            record(key,state) - saves state into an entry
+            evict()           - applies the size limits
+            remember_deformation(mesh,deformed)
+                              - records the input mesh of a
+                                deformed mesh, for the keys
+    """
+
+    #: state.FILES entries pointed to by a cache entry
+    file_keys = ['DIRECT','FLOW_META','ADJOINT_','MULTIPOINT_']
+
+    #: digests of the deformed meshes and of their input meshes
+    origins_filename = 'origins.pkl'
+
+    def __init__(self, folder, max_entries=1000, max_size=None):
+
+        folder = os.path.abspath(os.path.expanduser(folder))
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        self.folder      = folder
+        self.max_entries = max_entries
+        self.max_size    = max_size
+        self._digests    = {}
+        self.origins     = {}
+        self._load_origins()
+
+    def __enter__(self):
+        return activate(self).__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        activate(self).__exit__(exc_type, exc_value, traceback)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_digests'] = {}
+        return state
+
+    def key(self,config):
+        """ key = EvalCache.key(config) """
+        return config_fingerprint(config,self._digests,self.origins)
+
+    def _load_origins(self):
+        """ merges the mesh origins on disk into self.origins """
+        filename = os.path.join(self.folder,self.origins_filename)
+        if os.path.exists(filename):
+            self.origins.update(load_data(filename))
+
+    def remember_deformation(self,mesh,deformed):
+        """ EvalCache.remember_deformation(mesh,deformed)
+            records that the mesh file deformed was deformed from
+            the mesh file mesh, so that both have the same key
+        """
+        mesh_key     = file_digest(mesh,self._digests)
+        deformed_key = file_digest(deformed,self._digests)
+        if mesh_key == deformed_key:
+            return
+        self._load_origins()
+        self.origins[deformed_key] = mesh_key
+        save_data(os.path.join(self.folder,self.origins_filename),self.origins)
+
+    def _entry_file(self,key):
+        return os.path.join(self.folder,key + '.pkl')
+
+    def load(self,key):
+        """ entry = EvalCache.load(key)
+            returns the entry dictionary of a key, or None
+        """
+        filename = self._entry_file(key)
+        if not os.path.exists(filename):
+            return None
+        try:
+            entry = load_data(filename)
+        except Exception:
+            return None
+        # mark as recently used
+        os.utime(filename,None)
+        return entry
+
+    def restore(self,key,state):
+        """ found = EvalCache.restore(key,state)
+            updates state FUNCTIONS, GRADIENTS, HISTORY and existing
+            solution FILES from the cache entry of key
+        """
+
+        if key is None:
+            return False
+        entry = self.load(key)
+        if entry is None:
+            return False
+
+        for field in ['FUNCTIONS','GRADIENTS','HISTORY']:
+            for name, value in entry[field].items():
+                if not name in state[field]:
+                    state[field][name] = copy.deepcopy(value)
+
+        for name, value in entry['FILES'].items():
+            if name in state.FILES: continue
+            names = value if isinstance(value,list) else [value]
+            if all([ os.path.exists(n) for n in names if n ]):
+                state.FILES[name] = copy.deepcopy(value)
+
+        return True
+
+    def record(self,key,state):
+        """ EvalCache.record(key,state)
+            saves state FUNCTIONS, GRADIENTS, HISTORY and the
+            solution FILES into the cache entry of key
+        """
+
+        if key is None:
+            return
+        entry = self.load(key)
+        if entry is None:
+            entry = { 'FUNCTIONS' : {} , 'GRADIENTS' : {} ,
+                      'HISTORY'   : {} , 'FILES'     : {} }
+
+        for field in ['FUNCTIONS','GRADIENTS','HISTORY']:
+            entry[field].update(copy.deepcopy(dict(state[field])))
+
+        # solution files by absolute path
+        for name, value in state.FILES.items():
+            if not any([ name.startswith(k) for k in self.file_keys ]):
+                continue
+            if isinstance(value,list):
+                value = [ os.path.realpath(v) if v else v for v in value ]
+            else:
+                value = os.path.realpath(value)
+            entry['FILES'][name] = value
+
+        save_data(self._entry_file(key),entry)
+        self.evict()
+
+    def evict(self):
+        """ EvalCache.evict()
+            removes the least recently used entries beyond
+            max_entries or max_size
+        """
+
+        entries = glob.glob(os.path.join(self.folder,'*.pkl'))
+        entries = [ e for e in entries if os.path.basename(e) != self.origins_filename ]
+        entries = [ (os.stat(e).st_mtime, os.stat(e).st_size, e) for e in entries ]
+        entries.sort(reverse=True)
+
+        total = 0
+        for i, (mtime,size,filename) in enumerate(entries):
+            total += size
+            if ( (self.max_entries and i >= self.max_entries) or
+                 (self.max_size and total > self.max_size) ):
+                os.remove(filename)
+
+    def __repr__(self):
+        return '<EvalCache> %s' % self.folder
+
+#: class EvalCache()
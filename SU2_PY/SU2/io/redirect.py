@@ -30,7 +30,10 @@
 # ----------------------------------------------------------------------
 
 import os, sys, shutil, copy, glob
-from .tools import add_suffix, make_link, expand_part
+from .tools  import add_suffix, make_link, expand_part, remove_path
+from .stage  import stage_file, stage_methods, file_class
+from .series import is_series, unpacked_series, unpack_series, \
+                    manifest_filename
 
 # -------------------------------------------------------------------
 #  Output Redirection 
@@ -125,22 +128,27 @@ class folder(object):
             pull   - list of files to pull (copy to working folder)
             link   - list of files to link (symbolic link in working folder)
             force  - True/False overwrite existing files in working folder
-        
+            stage  - optional dictionary of staging methods per file
+                     class, overrides SU2.io.stage_methods
+
         Targets:
             push   - list of files to push (copy to originating path)
         
         Notes:
             push must be appended or extended, not overwritten
             links in Windows not supported, will simply copy
+            pulled files are reflinked, hardlinked or symlinked
+            when their file class allows it, see SU2.io.stage_file()
     '''
     
-    def __init__(self, folder, pull=None, link=None, force=True ):
+    def __init__(self, folder, pull=None, link=None, force=True, stage=None ):
         ''' folder redirection initialization
             see help( folder ) for more info
         '''
         
         if pull is None: pull = []
         if link is None: link = []
+        if stage is None: stage = {}
         
         if not isinstance(pull,list) : pull = [pull]
         if not isinstance(link,list) : link = [link]
@@ -155,6 +163,7 @@ class folder(object):
         self.push   = []
         self.link   = copy.deepcopy(link)
         self.force  = force
+        self.stage  = stage
 
     def __enter__(self): 
         
@@ -164,6 +173,7 @@ class folder(object):
         push   = self.push
         link   = self.link
         force  = self.force
+        stage  = self.stage
         
         # check for no folder change
         if folder == origin:
@@ -176,16 +186,17 @@ class folder(object):
         if not os.path.exists(folder):
             os.makedirs(folder)
         
-        # copy pull files
+        # stage pull files
         for name in pull:
             old_name = os.path.abspath(name)
             new_name = os.path.split(name)[-1]
             new_name = os.path.join(folder,new_name)
             if old_name == new_name: continue
             if os.path.exists( new_name ): 
-                if force: os.remove( new_name )
+                if force: remove_path( new_name )
                 else: continue
-            shutil.copy(old_name,new_name)
+            kind = file_class(old_name)
+            stage_file(old_name,new_name,stage.get(kind,stage_methods[kind]))
 
         # make links
         for name in link:
@@ -194,7 +205,7 @@ class folder(object):
             new_name = os.path.join(folder,new_name)
             if old_name == new_name: continue
             if os.path.exists( new_name ): 
-                if force: os.remove( new_name )
+                if force: remove_path( new_name )
                 else: continue
             make_link(old_name,new_name)
             
@@ -227,7 +238,7 @@ class folder(object):
                 source = os.path.realpath(old_name)
                 if source == new_name: continue
                 if os.path.exists( new_name ):
-                    if force: os.remove( new_name )
+                    if force: remove_path( new_name )
                     else: continue
                 make_link(source,new_name)
             
@@ -235,7 +246,7 @@ class folder(object):
             else:
                 if old_name == new_name: continue
                 if os.path.exists( new_name ):
-                    if force: os.remove( new_name )
+                    if force: remove_path( new_name )
                     else: continue
                 shutil.move(old_name,new_name)
             
@@ -243,3 +254,81 @@ class folder(object):
         os.chdir(origin)
         
 #: class folder()
+
+
+# -------------------------------------------------------------------
+#  Series Redirection 
+# -------------------------------------------------------------------
+
+# unpacked series folders, removed when the outermost series 
+# redirection exits
+_series_depth    = [0]
+_series_unpacked = []
+
+class series(object):
+    ''' with SU2.io.redirect_series(name)
+    
+        Temporarily makes the time series folder of a solution 
+        name available in the working folder. A series pack is 
+        unpacked once, next to the real pack file, and linked in 
+        as the series folder. Unpacked series are removed when the 
+        outermost series redirection exits, so that redirections 
+        nested in it share them.
+        
+        Example:
+        
+        # one unpack for all the adjoints of a design
+        with SU2.io.redirect_series():
+            with SU2.io.redirect_series(state.FILES.DIRECT):
+                # code reading the series
+            #: with series redirection
+        #: with series redirection
+        
+        Inputs:
+            name - solution name, only series names are redirected, 
+                   None only holds the unpacked series
+    '''
+    
+    def __init__(self, name=None):
+        self.name = name
+        self.link = None
+
+    def __enter__(self):
+        
+        _series_depth[0] += 1
+        
+        name = self.name
+        if name is None or not is_series(name):
+            return
+        
+        # folder handoff, or already available
+        folder = os.path.abspath(os.path.dirname(name))
+        pack   = folder + '.pack'
+        if os.path.exists(folder) or not os.path.exists(pack):
+            return
+        
+        # unpack once per source pack
+        unpacked = unpacked_series(pack)
+        if not os.path.exists(os.path.join(unpacked,manifest_filename)):
+            if os.path.exists(unpacked): shutil.rmtree(unpacked)
+            unpack_series(pack,unpacked)
+        if not unpacked in _series_unpacked:
+            _series_unpacked.append(unpacked)
+        
+        make_link(unpacked,folder)
+        self.link = folder
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        
+        if self.link and os.path.islink(self.link):
+            os.remove(self.link)
+        
+        _series_depth[0] -= 1
+        if _series_depth[0] > 0:
+            return
+        
+        for unpacked in _series_unpacked:
+            if os.path.exists(unpacked): shutil.rmtree(unpacked)
+        del _series_unpacked[:]
+        
+#: class series()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+## \file series.py
+#  \brief handoff of time accurate solutions as one series
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import os, shutil
+from SU2.util import ordered_bunch
+from .tools import name_set, remove_path
+
+
+# -------------------------------------------------------------------
+#  Time Series Handoff
+# -------------------------------------------------------------------
+
+def series_handoff(config):
+    """ mode = series_handoff(config)
+        returns the time series handoff mode set by the config
+        option SERIES_HANDOFF= NO, FOLDER or PACK, '' if NO
+    """
+    mode = config.get('SERIES_HANDOFF','NO').upper()
+    assert mode in ['NO','FOLDER','PACK'] , 'unknown SERIES_HANDOFF= %s' % mode
+    if mode == 'NO': return ''
+    return mode
+
+manifest_filename = 'MANIFEST'
+_pack_magic = b'SU2SERIES1\n'
+
+def series_folder(name):
+    """ folder = series_folder(name)
+        folder of the time series of a solution name
+        example: solution_flow.dat -> solution_flow_series
+    """
+    name = os.path.basename(name)
+    return os.path.splitext(name)[0] + '_series'
+
+def series_name(name):
+    """ name = series_name(name)
+        solution name inside its time series folder, to be used 
+        as SOLUTION_FILENAME by the solvers
+    """
+    return os.path.join(series_folder(name),os.path.basename(name))
+
+def is_series(name):
+    """ check = is_series(name)
+        True if a solution name lives in a time series folder
+    """
+    folder = os.path.dirname(name)
+    return folder.endswith('_series')
+
+def series_files(name,config):
+    """ names = series_files(name,config)
+        the files to link or push for a solution name:
+        the series folder or its pack if the solution is a time 
+        series, otherwise its zone and time step files
+    """
+    if is_series(name):
+        folder = os.path.dirname(name)
+        if os.path.exists(folder) or not os.path.exists(folder + '.pack'):
+            return [folder]
+        return [folder + '.pack']
+    return list(name_set(name,config,zones=True,time=True))
+
+def unpacked_series(pack):
+    """ folder = unpacked_series(pack)
+        folder a series pack is unpacked to, next to the real
+        pack file so that all links to the pack share it
+    """
+    pack = os.path.realpath(pack)
+    return os.path.splitext(pack)[0] + '_unpacked'
+
+def write_manifest(folder,names):
+    """ write_manifest(folder,names)
+        writes the index file of a time series folder,
+        one line with name and size per file
+    """
+    with open(os.path.join(folder,manifest_filename),'w') as manifest:
+        for name in names:
+            size = os.path.getsize(os.path.join(folder,name))
+            manifest.write('%s %i\n' % (name,size))
+
+def read_manifest(folder):
+    """ names = read_manifest(folder)
+        reads the index file of a time series folder
+    """
+    names = []
+    with open(os.path.join(folder,manifest_filename)) as manifest:
+        for line in manifest:
+            line = line.split()
+            if line: names.append(line[0])
+    return names
+
+def pack_series(folder,pack=None):
+    """ pack = pack_series(folder,pack=None)
+        packs the files of a time series folder into one file
+        with an offset table, default pack name is folder.pack
+        
+        Format:
+            magic line, number of files (uint64), then per file the
+            name length (uint16), name, offset and size (uint64),
+            then the file contents at their offsets
+    """
+    
+    import struct
+    
+    folder = folder.rstrip('/')
+    if pack is None: pack = folder + '.pack'
+    names = read_manifest(folder)
+    
+    encoded = [ name.encode() for name in names ]
+    sizes   = [ os.path.getsize(os.path.join(folder,name)) for name in names ]
+    
+    offset = len(_pack_magic) + 8 + sum([ 2 + len(e) + 16 for e in encoded ])
+    
+    with open(pack,'wb') as output:
+        output.write(_pack_magic)
+        output.write(struct.pack('<Q',len(names)))
+        for e, size in zip(encoded,sizes):
+            output.write(struct.pack('<H',len(e)) + e + struct.pack('<QQ',offset,size))
+            offset += size
+        for name in names:
+            with open(os.path.join(folder,name),'rb') as data:
+                shutil.copyfileobj(data,output,2**22)
+    
+    return pack
+
+#: def pack_series()
+
+def read_pack_table(pack):
+    """ table = read_pack_table(pack)
+        ordered_bunch of name: (offset,size) of a series pack
+    """
+    
+    import struct
+    
+    table = ordered_bunch()
+    with open(pack,'rb') as data:
+        
+        def read(n_bytes):
+            text = data.read(n_bytes)
+            assert len(text) == n_bytes , 'truncated series pack: %s' % pack
+            return text
+        
+        assert data.read(len(_pack_magic)) == _pack_magic , 'not a series pack: %s' % pack
+        n_files = struct.unpack('<Q',read(8))[0]
+        for i in range(n_files):
+            n_char = struct.unpack('<H',read(2))[0]
+            name = read(n_char).decode()
+            table[name] = struct.unpack('<QQ',read(16))
+        
+        # the contents of the last files must be complete
+        data.seek(0,2)
+        end = data.tell()
+        for offset, size in table.values():
+            assert offset + size <= end , 'truncated series pack: %s' % pack
+    
+    return table
+
+def read_packed(pack,name):
+    """ data = read_packed(pack,name)
+        reads the bytes of one file of a series pack
+    """
+    offset, size = read_pack_table(pack)[name]
+    with open(pack,'rb') as data:
+        data.seek(offset)
+        return data.read(size)
+
+def unpack_series(pack,folder=None):
+    """ folder = unpack_series(pack,folder=None)
+        restores the time series folder of a series pack
+    """
+    
+    if folder is None: folder = os.path.splitext(pack)[0]
+    if not os.path.exists(folder): os.makedirs(folder)
+    
+    table = read_pack_table(pack)
+    with open(pack,'rb') as data:
+        for name, (offset, size) in table.items():
+            data.seek(offset)
+            with open(os.path.join(folder,name),'wb') as output:
+                output.write(data.read(size))
+    write_manifest(folder,table.keys())
+    
+    return folder
+
+#: def unpack_series()
+
+def restart2series(restarts,solutions,solution,pack=False):
+    """ name = restart2series(restarts,solutions,solution,pack=False)
+        moves the restart files of a time accurate solution into 
+        its series folder with a manifest, optionally packed,
+        returns the solution name in the series
+    """
+    
+    folder = series_folder(solution)
+    
+    # a previous series may be linked in, never write through it
+    for name in [folder,folder + '.pack']:
+        if os.path.lexists(name): remove_path(name)
+    os.makedirs(folder)
+    
+    names = []
+    for res,sol in zip(restarts,solutions):
+        if os.path.exists(res):
+            shutil.move( res , os.path.join(folder,sol) )
+            names.append(sol)
+    write_manifest(folder,names)
+    
+    if pack:
+        pack_series(folder)
+        shutil.rmtree(folder)
+    
+    return series_name(solution)
+
+#: def restart2series()
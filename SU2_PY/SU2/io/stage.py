@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+## \file stage.py
+#  \brief staging of files into working folders
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import os, shutil
+from .tools import make_link
+
+
+# -------------------------------------------------------------------
+#  File Staging
+# -------------------------------------------------------------------
+
+#: staging methods tried in order for each file class,
+#: files that are only read by the tool chain may share storage,
+#: files rewritten in place by the solver (META) may not be linked
+stage_methods = { 'MESH'     : ['reflink','hardlink','symlink','copy'] ,
+                  'SOLUTION' : ['reflink','hardlink','symlink','copy'] ,
+                  'META'     : ['reflink','copy']                      ,
+                  'TARGET'   : ['reflink','hardlink','symlink','copy'] ,
+                  'FFD'      : ['reflink','hardlink','symlink','copy'] ,
+                  'OTHER'    : ['reflink','copy']                      }
+
+#: copies made by stage_file(), keyed by (source, destination device),
+#: with the stats of the source and of the copy when it was made,
+#: cleared when it grows past 4096 entries
+_staged_copies = {}
+
+def file_class(name):
+    """ kind = file_class(name)
+        classifies a filename for stage_file()
+        returns one of the keys of SU2.io.stage_methods
+    """
+
+    base = os.path.split(name)[-1]
+    ext  = os.path.splitext(base)[1].lower()
+
+    if base.startswith('Target') or base.startswith('WeightNF'):
+        return 'TARGET'
+    if 'ffd' in base.lower():
+        return 'FFD'
+    if ext in ['.su2','.cgns']:
+        return 'MESH'
+    if ext in ['.dat','.csv']:
+        return 'SOLUTION'
+    if ext == '.meta':
+        return 'META'
+    return 'OTHER'
+
+#: def file_class()
+
+def reflink(src,dst):
+    """ reflink(src,dst)
+        makes a copy-on-write clone of src at dst
+        raises OSError if the filesystem does not support it
+    """
+
+    import fcntl
+    FICLONE = 0x40049409
+
+    with open(src,'rb') as src_file:
+        with open(dst,'wb') as dst_file:
+            try:
+                fcntl.ioctl(dst_file.fileno(),FICLONE,src_file.fileno())
+            except (IOError,OSError):
+                dst_file.close()
+                os.remove(dst)
+                raise
+
+#: def reflink()
+
+def same_filesystem(src,dst):
+    """ check = same_filesystem(src,dst)
+        True if src and the folder of dst share a device
+    """
+    dst_folder = os.path.split(os.path.abspath(dst))[0]
+    try:
+        return os.stat(src).st_dev == os.stat(dst_folder).st_dev
+    except OSError:
+        return False
+
+def stat_signature(name):
+    """ signature = stat_signature(name)
+        (inode, size, mtime) of a file or of an os.stat() result,
+        None if the file does not exist
+    """
+    if isinstance(name,str):
+        try:
+            name = os.stat(name)
+        except OSError:
+            return None
+    return ( name.st_ino , name.st_size , name.st_mtime_ns )
+
+def stage_file(src,dst,methods=None):
+    """ method = stage_file(src,dst,methods=None)
+        places src at dst with the cheapest available method
+
+        Inputs:
+            src     - source file
+            dst     - destination file
+            methods - list of methods to try in order, from
+                      'reflink', 'hardlink', 'symlink', 'copy'
+                      default is stage_methods[file_class(src)]
+
+        Outputs:
+            method  - the method that succeeded
+
+        Reflinks and hardlinks are only attempted within one
+        filesystem. If the file had to be copied before onto the
+        destination filesystem, that copy is reused as the source
+        as long as neither the source nor the copy changed.
+        Windows only supports copies.
+    """
+
+    if methods is None:
+        methods = stage_methods[file_class(src)]
+
+    src  = os.path.realpath(src)
+    stat = os.stat(src)
+    if os.path.lexists(dst): os.remove(dst)
+
+    dst_folder = os.path.split(os.path.abspath(dst))[0]
+    key = ( src , os.stat(dst_folder).st_dev )
+
+    # reuse an earlier copy on the destination filesystem
+    source = src
+    if key in _staged_copies:
+        copied, src_stat, copy_stat = _staged_copies[key]
+        if ( stat_signature(stat) == src_stat and
+             stat_signature(copied) == copy_stat ):
+            source = copied
+        else:
+            del _staged_copies[key]
+
+    for method in methods:
+
+        if os.name == 'nt' and method != 'copy':
+            continue
+
+        try:
+            if method == 'reflink':
+                if not same_filesystem(source,dst): continue
+                reflink(source,dst)
+            elif method == 'hardlink':
+                if not same_filesystem(source,dst): continue
+                os.link(source,dst)
+            elif method == 'symlink':
+                make_link(source,dst)
+            elif method == 'copy':
+                shutil.copy(source,dst)
+                if len(_staged_copies) > 4096: _staged_copies.clear()
+                if not key in _staged_copies:
+                    _staged_copies[key] = ( os.path.abspath(dst),
+                                            stat_signature(stat),
+                                            stat_signature(dst) )
+            else:
+                raise Exception('unknown staging method %s' % method)
+        except (IOError,OSError):
+            if os.path.lexists(dst): os.remove(dst)
+            continue
+
+        return method
+
+    #: for each method
+
+    raise IOError('could not stage file %s' % src)
+
+#: def stage_file()
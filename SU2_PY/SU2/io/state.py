@@ -31,7 +31,8 @@
 
 import os, sys, shutil, copy, time
 from ..io   import expand_part, expand_zones, expand_time, get_adjointSuffix, add_suffix, \
-                   get_specialCases, Config, expand_multipoint, optnames_multi
+                   get_specialCases, Config, expand_multipoint, optnames_multi, \
+                   snapshot_exists, name_set, series_files
 from ..util import bunch
 from ..util import ordered_bunch
 
@@ -188,21 +189,18 @@ class State(ordered_bunch):
                 value = expand_part(value,config)
                 link.extend(value)
             elif key == 'DIRECT':
-                # direct solution
-                value = expand_zones(value,config)
-                value = expand_time(value,config)
+                # direct solution, or its time series folder
+                value = series_files(value,config)
                 link.extend(value)
             elif 'ADJOINT_' in key and  (not 'MULTIPOINT' in key):
-                # adjoint solution
-                value = expand_zones(value,config)
-                value = expand_time(value,config)
+                # adjoint solution, or its time series folder
+                value = series_files(value,config)
                 link.extend(value)
             elif 'MULTIPOINT' in key:
                 # multipoint files
                 if key != 'MULTIPOINT_MESH_FILENAME':
                     # DIRECT and ADJOINT files
-                    value = expand_zones(value,config)
-                    value = expand_time(value,config)
+                    value = name_set(value,config,zones=True,time=True)
                 for elem in value:
                     if elem:
                         link.append(elem)
@@ -229,15 +227,21 @@ class State(ordered_bunch):
             vector.extend(value)
         return vector
     
-    def find_files(self,config):
-        """ SU2.io.State.find_files(config)
+    def find_files(self,config,snapshot=None):
+        """ SU2.io.State.find_files(config,snapshot=None)
             finds mesh and solution files for a given config.
             updates state.FILES with filenames.
             files already logged in state are not overridden.
             will ignore solutions if config.RESTART_SOL == 'NO'.
+            
+            each folder is scanned once, optionally a snapshot 
+            dictionary of folder entries can be passed in and 
+            reused, see SU2.io.snapshot_exists()
         """
         
         files = self.FILES
+        if snapshot is None: snapshot = {}
+        exists = lambda name: snapshot_exists(name,snapshot)
         
         mesh_name     = config.MESH_FILENAME
         if config.get('READ_BINARY_RESTART', 'YES') == 'NO':
@@ -273,10 +277,10 @@ class State(ordered_bunch):
         def register_file(label,filename):
             if not label in files:
                 if label.split('_')[0] in ['DIRECT', 'ADJOINT']:
-                    names = expand_zones(filename, config)
+                    names = name_set(filename,config,zones=True)
                     found = False
                     for name in names:
-                        if os.path.exists(name):
+                        if exists(name):
                             found = True
                         else:
                             found = False
@@ -290,7 +294,7 @@ class State(ordered_bunch):
                     # if multipoint, list of files needs to be added
                     file_list= [];
                     for name in filename:
-                        if os.path.exists(name):
+                        if exists(name):
                             file_list.append(name)
                             print('Found: %s' % name)
                         else:
@@ -300,20 +304,20 @@ class State(ordered_bunch):
                     if any(file for file in file_list):
                         files[label] = file_list
                 else:
-                    if os.path.exists(filename):
+                    if exists(filename):
                         files[label] = filename
                         print('Found: %s' % filename)
             else:
                 if label.split("_")[0] in ['DIRECT', 'ADJOINT']:
-                    for name in expand_zones(files[label], config):
-                        assert os.path.exists(name), 'state expected file: %s' % filename
+                    for name in name_set(files[label],config,zones=True):
+                        assert exists(name), 'state expected file: %s' % filename
                 elif label.split('_')[0] in ['MULTIPOINT']:
-                    for name in expand_zones(files[label], config):
+                    for name in name_set(files[label],config,zones=True):
                         if name:
-                            if not os.path.exists(name):
+                            if not exists(name):
                                 raise AssertionError('state expected file: %s' % name)
                 else:
-                    assert os.path.exists(files[label]) , 'state expected file: %s' % filename
+                    assert exists(files[label]) , 'state expected file: %s' % filename
         #: register_file()                
 
         # mesh
@@ -332,15 +336,14 @@ class State(ordered_bunch):
             if restart:
                 register_file('DIRECT',direct_name)
                 if multipoint:
-                    name_list = expand_multipoint(direct_name,config)
-                    name_list = expand_zones(name_list,config)
+                    name_list = name_set(direct_name,config,multipoint=True,zones=True)
                     register_file('MULTIPOINT_DIRECT',name_list)
 
             # flow meta data file
             if restart:
                 register_file('FLOW_META','flow.meta')
                 if multipoint:
-                    name_list = expand_multipoint('flow.meta',config)
+                    name_list = name_set('flow.meta',config,multipoint=True)
                     register_file('MULTIPOINT_FLOW_META',name_list)
 
             # adjoint solutions
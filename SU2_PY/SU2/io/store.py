@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+
+## \file store.py
+#  \brief content addressed storage of design artifacts
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, hashlib
+from .stage import stage_file
+from .data  import load_data, save_data
+
+#: the store used by the tool chain, see ArtifactStore.__enter__()
+_active = []
+
+def active_store():
+    """ store = SU2.io.active_store()
+        returns the artifact store in use, or None
+    """
+    if _active:
+        return _active[-1]
+    return None
+
+def file_digest(filename,digests=None):
+    """ key = SU2.io.store.file_digest(filename,digests=None)
+        sha1 hash of the file content with the file extension,
+        optionally cached in the dictionary digests by the inode,
+        mtime and size of the file
+    """
+
+    if digests is None: digests = {}
+
+    info = os.stat(filename)
+    signature = ( info.st_dev, info.st_ino, info.st_mtime, info.st_size )
+    if signature in digests:
+        return digests[signature]
+
+    sha = hashlib.sha1()
+    with open(filename,'rb') as data:
+        for chunk in iter(lambda: data.read(2**22), b''):
+            sha.update(chunk)
+    key = sha.hexdigest() + os.path.splitext(filename)[1]
+
+    digests[signature] = key
+    return key
+
+class activate(object):
+    """ with SU2.io.store.activate(store):
+
+        Makes store the active artifact store when used in a
+        'with' contextmanager, does nothing if store is None
+    """
+    def __init__(self, store):
+        self.store = store
+
+    def __enter__(self):
+        if self.store is not None:
+            _active.append(self.store)
+        return self.store
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.store is not None:
+            _active.remove(self.store)
+
+
+# ----------------------------------------------------------------------
+#  Artifact Store Class
+# ----------------------------------------------------------------------
+
+class ArtifactStore(object):
+    """ store = SU2.io.ArtifactStore(folder='ARTIFACTS')
+
+        Stores large files (meshes, restarts) once, keyed by the
+        sha1 hash of their content. Files added to the store are
+        replaced in their folder by a link to the stored artifact,
+        so identical files of many designs share storage.
+
+        Example:
+
+        store = SU2.io.ArtifactStore('ARTIFACTS')
+        with store:
+            # SU2.eval functions add their meshes and solutions
+            # to the active store
+            ...
+
+        Methods:
+            add(filename)       - stores a file, returns its key
+            path(key)           - path of a stored artifact
+            has(key)            - True if the artifact is stored
+            digest(filename)    - content hash of a file
+            link(key,filename)  - places an artifact at filename
+            lookup(task)        - artifact key produced by a task
+            remember(task,key)  - records the artifact of a task
+
+        Notes:
+            stored artifacts share their inode with the files
+            hardlinked to them, so they are not made read-only,
+            which would make the working files read-only as well.
+            tools must replace (not rewrite) a linked file
+    """
+
+    index_filename = 'index.pkl'
+
+    def __init__(self, folder='ARTIFACTS'):
+
+        folder = os.path.abspath(folder)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        self.folder = folder
+        self.index  = { 'TASKS' : {} , 'DIGESTS' : {} }
+        self._load()
+
+    def __enter__(self):
+        return activate(self).__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        activate(self).__exit__(exc_type, exc_value, traceback)
+
+    def _index_file(self):
+        return os.path.join(self.folder,self.index_filename)
+
+    def _load(self):
+        """ merges the index on disk into self.index """
+        filename = self._index_file()
+        if os.path.exists(filename):
+            index = load_data(filename)
+            for key in self.index.keys():
+                self.index[key].update(index.get(key,{}))
+
+    def _save(self):
+        self._load()
+        save_data(self._index_file(),self.index)
+
+    def digest(self,filename):
+        """ key = ArtifactStore.digest(filename)
+            sha1 hash of the file content, cached by inode and mtime
+        """
+        return file_digest(filename,self.index['DIGESTS'])
+
+    def path(self,key):
+        """ filename = ArtifactStore.path(key) """
+        return os.path.join(self.folder,key[:2],key)
+
+    def has(self,key):
+        """ check = ArtifactStore.has(key) """
+        return os.path.exists(self.path(key))
+
+    def link(self,key,filename):
+        """ ArtifactStore.link(key,filename)
+            places the stored artifact at filename
+        """
+        stage_file(self.path(key),filename,['hardlink','symlink','copy'])
+
+    def add(self,filename):
+        """ key = ArtifactStore.add(filename)
+            moves a file into the store, replacing it with a link
+            an artifact already stored is not duplicated
+        """
+
+        filename = os.path.abspath(filename)
+
+        # already an artifact
+        if os.path.realpath(filename).startswith(self.folder + os.sep):
+            key = os.path.split(os.path.realpath(filename))[-1]
+            if os.path.islink(filename) or os.stat(filename).st_nlink > 1:
+                return key
+
+        key    = self.digest(filename)
+        target = self.path(key)
+
+        if not os.path.exists(target):
+            if not os.path.exists(os.path.split(target)[0]):
+                os.makedirs(os.path.split(target)[0])
+            stage_file(filename,target,['reflink','hardlink','copy'])
+
+        os.remove(filename)
+        self.link(key,filename)
+        self._save()
+
+        return key
+
+    def lookup(self,task):
+        """ key = ArtifactStore.lookup(task)
+            returns the key of the artifact recorded for a task
+            description (a string), or None if it is not stored
+        """
+        self._load()
+        key = self.index['TASKS'].get(task)
+        if key and self.has(key):
+            return key
+        return None
+
+    def remember(self,task,key):
+        """ ArtifactStore.remember(task,key)
+            records the artifact produced by a task description
+        """
+        self.index['TASKS'][task] = key
+        self._save()
+
+    def __repr__(self):
+        return '<ArtifactStore> %s' % self.folder
+
+#: class ArtifactStore()
+
+
+# ----------------------------------------------------------------------
+#  Deformation Task Description
+# ----------------------------------------------------------------------
+
+def deform_task(config,store):
+    """ task = SU2.io.store.deform_task(config,store)
+        describes a mesh deformation by the content of the input
+        mesh and the deformation options of the config
+    """
+
+    prefixes = ['DV_','DEFORM_','FFD_','MARKER_','HOLD_GRID_FIXED']
+
+    mesh_key = store.digest(config['MESH_FILENAME'])
+    options  = [ '%s=%s' % (key,config[key]) for key in sorted(config.keys())
+                 if any(key.startswith(p) for p in prefixes) ]
+
+    return 'DEFORM:' + mesh_key + ':' + ';'.join(options)
+
+#: def deform_task()
@@ -883,78 +883,183 @@ def expand_part(name,config):
     return names
 
 def expand_time(name,config):
-    if 'TIME_MARCHING' in get_specialCases(config):
-        n_time = config['UNST_ADJOINT_ITER']
-        n_start_time = 0
-        if config.get('TIME_DOMAIN', 'NO') == 'YES' and config.get('RESTART_SOL','NO') == 'YES':
-            n_start_time = int(config['RESTART_ITER'])
-        if not isinstance(name, list):
-            name_pat = add_suffix(name,'%05d')
-            names = [name_pat%i for i in range(n_start_time, n_time)]
-        else:
-            for n in range(len(name)):
-                name_pat = add_suffix(name[n], '%05d')
-                names    = [name_pat%i for i in range(n_start_time, n_time)]
-    else:
-        if not isinstance(name, list):
-            names = [name]
-        else:
-            names = name
-    return names
+    """ names = expand_time(name,config)
+        list of the time step filenames of name, or of each name
+        in a list, for time marching problems
+    """
+    return list(name_set(name,config,time=True))
 
 def expand_zones(name, config):
-    names = []
-    if int(config.NZONES) > 1:
-        if not isinstance(name, list):
-            name_pat = add_suffix(name,'%d')
-            names = [name_pat%i for i in range(int(config.NZONES))]
-        else:
-            for n in range(len(name)):
-                name_pat = add_suffix(name[n], '%d')
-                names.extend([name_pat%i for i in range(int(config.NZONES))])
-
-    else:
-        if not isinstance(name, list):
-            names = [name]
-        else:
-            names = name
-    return names
+    """ names = expand_zones(name,config)
+        list of the zone filenames of name, or of each name
+        in a list, for multizone problems
+    """
+    return list(name_set(name,config,zones=True))
 
 def expand_multipoint(name,config):
-    def_objs = config['OPT_OBJECTIVE']
-    objectives = def_objs.keys()
-    names = []
-    n_multipoint = len(config['MULTIPOINT_WEIGHT'].split(','))
-
-    if any(elem in optnames_multi for elem in objectives):
-        if not isinstance(name, list):
-            if '_point0' not in name:
-                name_pat = add_suffix(name,'point%d')
-                names = [name_pat%i for i in range(n_multipoint)]
-            else: 
-                name_parts = name.split('_point0')
-                name_base = name_parts[0]
-                name_suff = name_parts[1]
-                name_pat = name_base + '_point%d' + name_suff
-                names = [name_pat%i for i in range(n_multipoint)]
+    """ names = expand_multipoint(name,config)
+        list of the point filenames of name, or of each name
+        in a list, for multipoint optimization
+    """
+    return list(name_set(name,config,multipoint=True))
+
+
+# -------------------------------------------------------------------
+#  Filename Sets
+# -------------------------------------------------------------------
+
+class NameSet(object):
+    """ names = SU2.io.NameSet(names,axes=())
+        
+        Immutable sequence of filenames, built from base names and
+        expansion axes. Each axis expands every name into a range
+        of suffixed names, in the order of the base names.
+        The names are only generated when first needed, 
+        membership tests use a set built once.
+        NameSets compare equal to lists and tuples of the same
+        names and hash like the tuple of their names, adding a
+        NameSet to a NameSet, list or tuple gives a NameSet.
+        
+        Inputs:
+            names - a filename or list of filenames
+            axes  - tuple of (kind,start,stop) with kind one of
+                    'POINT' (name_point%d), 'ZONE' (name_%d) or
+                    'TIME' (name_%05d)
+        
+        Methods:
+            expand(kind,start,stop) - a new NameSet with one more axis
+    """
+    
+    def __init__(self, names, axes=()):
+        if isinstance(names,NameSet):
+            axes  = names._axes + tuple(axes)
+            names = names._names
+        elif not isinstance(names,(list,tuple)):
+            names = [names]
+        self._names = tuple(names)
+        self._axes  = tuple(axes)
+        self._list  = None
+        self._set   = None
+    
+    def expand(self,kind,start,stop):
+        return NameSet(self._names, self._axes + ((kind,start,stop),))
+    
+    def key(self):
+        """ hashable description of the set """
+        return (self._names,self._axes)
+    
+    def _generate(self):
+        names = iter(self._names)
+        for kind, start, stop in self._axes:
+            names = _expand_names(names,kind,start,stop)
+        return names
+    
+    def __iter__(self):
+        if self._list is None:
+            self._list = list(self._generate())
+        return iter(self._list)
+    
+    def __len__(self):
+        n = len(self._names)
+        for kind, start, stop in self._axes:
+            n *= max(stop-start,0)
+        return n
+    
+    def __getitem__(self,i):
+        if self._list is None:
+            self._list = list(self._generate())
+        return self._list[i]
+    
+    def __contains__(self,name):
+        if self._set is None:
+            self._set = frozenset(self)
+        return name in self._set
+    
+    def __add__(self,other):
+        return NameSet(list(self) + list(other))
+    
+    def __radd__(self,other):
+        return NameSet(list(other) + list(self))
+    
+    def __eq__(self,other):
+        if not isinstance(other,(NameSet,list,tuple)):
+            return NotImplemented
+        return list(self) == list(other)
+    
+    def __ne__(self,other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+    
+    def __hash__(self):
+        return hash(tuple(self))
+    
+    def __repr__(self):
+        return '<NameSet> %s %s' % (list(self._names),list(self._axes))
+    
+#: class NameSet()
+
+def _expand_names(names,kind,start,stop):
+    """ generator of the names of one NameSet axis """
+    for name in names:
+        if kind == 'POINT' and '_point0' in name:
+            name_parts = name.split('_point0')
+            name_pat = name_parts[0] + '_point%d' + name_parts[1]
         else:
-            for n in range(len(name)):
-                if '_point0' not in name:
-                    name_pat = add_suffix(name[n], 'point%d')
-                    names.extend([name_pat%i for i in range(n_multipoint)])
-                else: 
-                    name_parts = name[n].split('_point0')
-                    name_base = name_parts[0]
-                    name_suff = name_parts[1]
-                    name_pat = name_base + '_point%d' + name_suff
-                    names.extend([name_pat%i for i in range(n_multipoint)])
+            name_pat = add_suffix(name,_name_formats[kind])
+        for i in range(start,stop):
+            yield name_pat % i
+
+_name_formats = { 'POINT' : 'point%d' ,
+                  'ZONE'  : '%d'      ,
+                  'TIME'  : '%05d'     }
+
+#: memoized sets by name and config subset
+_name_sets = {}
+
+def name_set(name,config,multipoint=False,zones=False,time=False):
+    """ names = SU2.io.name_set(name,config,multipoint=False,zones=False,time=False)
+        
+        memoized NameSet of the multipoint, zone and time step
+        filenames of name (a filename, list or NameSet), expanded 
+        in that order. Each expansion only applies if the config 
+        asks for it, same as expand_multipoint(), expand_zones() 
+        and expand_time().
+    """
+    
+    axes = []
+    
+    if multipoint:
+        objectives = config['OPT_OBJECTIVE'].keys()
+        if any(elem in optnames_multi for elem in objectives):
+            n_multipoint = len(config['MULTIPOINT_WEIGHT'].split(','))
+            axes.append( ('POINT',0,n_multipoint) )
+    
+    if zones and int(config.NZONES) > 1:
+        axes.append( ('ZONE',0,int(config.NZONES)) )
+    
+    if time and 'TIME_MARCHING' in get_specialCases(config):
+        n_time = int(config['UNST_ADJOINT_ITER'])
+        n_start_time = 0
+        if config.get('TIME_DOMAIN', 'NO') == 'YES' and config.get('RESTART_SOL','NO') == 'YES':
+            n_start_time = int(config['RESTART_ITER'])
+        axes.append( ('TIME',n_start_time,n_time) )
+    
+    if isinstance(name,NameSet):
+        key = name.key() + (tuple(axes),)
+    elif isinstance(name,list):
+        key = (tuple(name),(),tuple(axes))
     else:
-        if not isinstance(name, list):
-            names = [name]
-        else:
-            names = name
-    return names        
+        key = ((name,),(),tuple(axes))
+
+    if not key in _name_sets:
+        if len(_name_sets) > 4096: _name_sets.clear()
+        _name_sets[key] = NameSet(name,axes)
+
+    return _name_sets[key]
 
+#: def name_set()
 
 
 def make_link(src,dst):
@@ -995,6 +1100,63 @@ def make_link(src,dst):
             if os.path.exists(dst): os.remove(dst)
             os.symlink(src,dst)
 
+def remove_path(name):
+    """ remove_path(name)
+        removes a file, link or folder, links to folders 
+        are removed without their target
+    """
+    if os.path.isdir(name) and not os.path.islink(name):
+        shutil.rmtree(name)
+    else:
+        os.remove(name)
+
+
+# -------------------------------------------------------------------
+#  Folder Snapshots
+# -------------------------------------------------------------------
+
+def scan_folder(folder='.'):
+    """ names = scan_folder(folder='.')
+        returns the set of entries of a folder from one directory
+        scan, links are kept only if their target exists
+    """
+
+    names = set()
+    if not os.path.isdir(folder):
+        return names
+
+    if hasattr(os,'scandir'):
+        for entry in os.scandir(folder):
+            if entry.is_symlink() and not os.path.exists(entry.path):
+                continue
+            names.add(entry.name)
+    else:
+        for name in os.listdir(folder):
+            if os.path.exists(os.path.join(folder,name)):
+                names.add(name)
+
+    return names
+
+def snapshot_exists(name,snapshot):
+    """ check = snapshot_exists(name,snapshot)
+        os.path.exists() against a snapshot of folder contents
+
+        Inputs:
+            name     - filename, relative or absolute
+            snapshot - dictionary of absolute folder names and
+                       sets of their entries, folders not yet in
+                       the snapshot are scanned and added
+    """
+
+    folder, base = os.path.split(os.path.abspath(name))
+    if not folder in snapshot:
+        snapshot[folder] = scan_folder(folder)
+    return base in snapshot[folder]
+
+#: def snapshot_exists()
+
+
+
 def restart2solution(config,state={}):
     """ restart2solution(config,state={})
         moves restart file to solution file, 
@@ -1003,6 +1165,8 @@ def restart2solution(config,state={}):
         adjoint objective is read from config
     """
 
+    from .series import series_handoff, restart2series
+
     # direct solution
     if config.MATH_PROBLEM == 'DIRECT':
         restart  = config.RESTART_FILENAME
@@ -1017,12 +1181,15 @@ def restart2solution(config,state={}):
             restart += '.dat'
             solution += '.dat'
 
-        # expand zones
-        restarts  = expand_zones(restart,config)
-        solutions = expand_zones(solution,config)
-        # expand unsteady time
-        restarts  = expand_time(restarts,config)
-        solutions = expand_time(solutions,config)
+        # expand zones and unsteady time
+        restarts  = name_set(restart,config,zones=True,time=True)
+        solutions = name_set(solution,config,zones=True,time=True)
+
+        # time series handoff
+        handoff = series_handoff(config)
+        if handoff and 'TIME_MARCHING' in get_specialCases(config):
+            solution = restart2series(restarts,solutions,solution,handoff=='PACK')
+            restarts = solutions = []
 
         # move
         for res,sol in zip(restarts,solutions):
@@ -1052,12 +1219,15 @@ def restart2solution(config,state={}):
         suffix    = get_adjointSuffix(func_name)
         restart   = add_suffix(restart,suffix)
         solution  = add_suffix(solution,suffix)
-        # expand zones
-        restarts  = expand_zones(restart,config)
-        solutions = expand_zones(solution,config)
-        # expand unsteady time
-        restarts  = expand_time(restarts,config)
-        solutions = expand_time(solutions,config)
+        # expand zones and unsteady time
+        restarts  = name_set(restart,config,zones=True,time=True)
+        solutions = name_set(solution,config,zones=True,time=True)
+
+        # time series handoff
+        handoff = series_handoff(config)
+        if handoff and 'TIME_MARCHING' in get_specialCases(config):
+            solution = restart2series(restarts,solutions,solution,handoff=='PACK')
+            restarts = solutions = []
 
         # move
         for res,sol in zip(restarts,solutions):
@@ -1071,3 +1241,4 @@ def restart2solution(config,state={}):
     else:
         raise Exception('unknown math problem')
 
+#: def restart2solution()
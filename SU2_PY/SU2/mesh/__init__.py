@@ -5,3 +5,6 @@ __all__ = ['adapt']
 from SU2.mesh import adapt
 
 from SU2.mesh.tools import *
+from SU2.mesh.periodic import remove_periodic_halos
+from SU2.mesh.parallel import read_parallel
+from SU2.mesh.metrics import quality, quality_summary, has_negative_volume
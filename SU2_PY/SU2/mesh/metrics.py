@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+
+## \file metrics.py
+#  \brief element quality measures of SU2 meshes
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import numpy as np
+
+#: number of elements evaluated at once
+chunk_size = 2**18
+
+
+# -------------------------------------------------------------------
+#  Element Definitions
+# -------------------------------------------------------------------
+# VTK node ordering, oriented like SU2 (see CPhysicalGeometry::Check_IntElem_Orientation),
+# the elements of reference_elements have positive volume
+
+#: node coordinates of an element of each type with SU2 orientation
+reference_elements = {
+    5  : [ [0,0,0] , [1,0,0] , [0,1,0] ] ,
+    9  : [ [0,0,0] , [1,0,0] , [1,1,0] , [0,1,0] ] ,
+    10 : [ [0,0,0] , [1,0,0] , [0,1,0] , [0,0,1] ] ,
+    14 : [ [0,0,0] , [1,0,0] , [1,1,0] , [0,1,0] , [0.5,0.5,1] ] ,
+    13 : [ [0,0,0] , [0,1,0] , [1,0,0] , [0,0,1] , [0,1,1] , [1,0,1] ] ,
+    12 : [ [0,0,0] , [1,0,0] , [1,1,0] , [0,1,0] ,
+           [0,0,1] , [1,0,1] , [1,1,1] , [0,1,1] ] ,
+}
+
+#: faces of each element type, for 2D elements the element itself
+elem_faces = {
+    5  : [ [0,1,2] ] ,
+    9  : [ [0,1,2,3] ] ,
+    10 : [ [0,1,3] , [1,2,3] , [2,0,3] , [0,2,1] ] ,
+    14 : [ [0,3,2,1] , [0,1,4] , [1,2,4] , [2,3,4] , [3,0,4] ] ,
+    13 : [ [0,2,1] , [3,4,5] , [0,1,4,3] , [1,2,5,4] , [2,0,3,5] ] ,
+    12 : [ [0,3,2,1] , [4,5,6,7] , [0,1,5,4] , [1,2,6,5] ,
+           [2,3,7,6] , [3,0,4,7] ] ,
+}
+
+#: tetrahedra decomposing each 3D element type, for volumes
+elem_tetras = {
+    10 : [ [0,1,2,3] ] ,
+    14 : [ [0,1,2,4] , [0,2,3,4] ] ,
+    13 : [ [0,2,1,3] , [2,1,3,4] , [3,2,4,5] ] ,
+    12 : [ [0,1,2,6] , [0,2,3,6] , [0,3,7,6] ,
+           [0,7,4,6] , [0,4,5,6] , [0,5,1,6] ] ,
+}
+
+def elem_edges(elem_type):
+    ''' unique node pairs of the edges of an element type '''
+    edges = []
+    for face in elem_faces[elem_type]:
+        for i in range(len(face)):
+            edge = tuple(sorted( (face[i],face[(i+1)%len(face)]) ))
+            if not edge in edges:
+                edges.append(edge)
+    return edges
+
+
+# -------------------------------------------------------------------
+#  Element Measures
+# -------------------------------------------------------------------
+def _tetra_volumes(coords,tetras):
+    ''' signed volumes (n, n_tetras) of the tetrahedra of elements
+        with node coordinates coords (n, nodes, 3) '''
+    tetras = np.array(tetras)
+    a = coords[:,tetras[:,0]]
+    b = coords[:,tetras[:,1]] - a
+    c = coords[:,tetras[:,2]] - a
+    d = coords[:,tetras[:,3]] - a
+    return np.einsum('ijk,ijk->ij',np.cross(b,c),d) / 6.
+
+def volumes(coords,elem_type,minimum=False):
+    ''' signed volumes (areas in 2D) of elements of one type
+        input:  coords   node coordinates (n, nodes, ndime)
+                minimum  return the smallest sub-tetrahedron volume
+                         times their number instead, which is
+                         negative for partly inverted elements
+        output: float array (n,)
+    '''
+
+    if elem_type == 5:
+        a = coords[:,1,0:2] - coords[:,0,0:2]
+        b = coords[:,2,0:2] - coords[:,0,0:2]
+        return 0.5 * ( a[:,0]*b[:,1] - a[:,1]*b[:,0] )
+
+    if elem_type == 9:
+        a = coords[:,2,0:2] - coords[:,0,0:2]
+        b = coords[:,3,0:2] - coords[:,1,0:2]
+        return 0.5 * ( a[:,0]*b[:,1] - a[:,1]*b[:,0] )
+
+    tetras = _tetra_volumes(coords,elem_tetras[elem_type])
+    if minimum:
+        return tetras.min(axis=1) * tetras.shape[1]
+    return tetras.sum(axis=1)
+
+def aspect_ratios(coords,elem_type):
+    ''' longest over shortest edge length of elements of one type '''
+    edges  = np.array(elem_edges(elem_type))
+    length = np.linalg.norm( coords[:,edges[:,1]] - coords[:,edges[:,0]], axis=2 )
+    with np.errstate(divide='ignore'):
+        return length.max(axis=1) / length.min(axis=1)
+
+def skewness(coords,elem_type):
+    ''' equiangle skewness of elements of one type, the largest
+        normalized deviation of the corner angles of the element
+        faces from those of the equilateral face, 0 is ideal, 1 is
+        degenerate
+    '''
+    skew = np.zeros(coords.shape[0])
+    for face in elem_faces[elem_type]:
+        n_corner = len(face)
+        ideal    = 180. * (n_corner-2) / n_corner
+        nodes    = np.array(face)
+        corner   = coords[:,nodes]
+        to_prev  = np.roll(corner, 1,axis=1) - corner
+        to_next  = np.roll(corner,-1,axis=1) - corner
+        cosine   = np.einsum('ijk,ijk->ij',to_prev,to_next)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            cosine /= np.linalg.norm(to_prev,axis=2) * np.linalg.norm(to_next,axis=2)
+        angle = np.degrees(np.arccos(np.clip(cosine,-1.,1.)))
+        face_skew = np.maximum( (angle.max(axis=1) - ideal) / (180. - ideal) ,
+                                (ideal - angle.min(axis=1)) / ideal )
+        skew = np.fmax(skew,face_skew)
+    return skew
+
+
+# -------------------------------------------------------------------
+#  Mesh Quality
+# -------------------------------------------------------------------
+def _chunks(meshdata):
+    ''' (type, slice, coords) of the volume elements in chunks '''
+    points = np.asarray(meshdata['POIN'])[:,0:meshdata['NDIME']]
+    for elem_type, conn in meshdata['ELEM'].items():
+        if not elem_type in elem_faces:
+            continue
+        for start in range(0,conn.shape[0],chunk_size):
+            rows = slice(start,start+chunk_size)
+            yield elem_type, rows, points[conn[rows]]
+
+def quality(meshdata):
+    ''' metrics = SU2.mesh.quality(meshdata)
+
+        per element quality measures of the volume elements of
+        the arrays of SU2.mesh.read()
+
+        output: dictionary by element type of dictionaries
+            VOLUME        signed volume (area in 2D)
+            ASPECT_RATIO  longest over shortest edge
+            SKEWNESS      equiangle skewness, see skewness()
+    '''
+
+    metrics = {}
+    for elem_type, rows, coords in _chunks(meshdata):
+        if not elem_type in metrics:
+            n_elem = meshdata['ELEM'][elem_type].shape[0]
+            metrics[elem_type] = { 'VOLUME'       : np.zeros(n_elem) ,
+                                   'ASPECT_RATIO' : np.zeros(n_elem) ,
+                                   'SKEWNESS'     : np.zeros(n_elem) }
+        this_metrics = metrics[elem_type]
+        this_metrics['VOLUME'][rows]       = volumes(coords,elem_type)
+        this_metrics['ASPECT_RATIO'][rows] = aspect_ratios(coords,elem_type)
+        this_metrics['SKEWNESS'][rows]     = skewness(coords,elem_type)
+
+    return metrics
+
+#: def quality()
+
+def quality_summary(metrics,bins=10):
+    ''' summary = SU2.mesh.quality_summary(metrics,bins=10)
+
+        statistics of the output of quality() over all element
+        types, for each measure a dictionary of
+        MIN, MAX, MEAN, HISTOGRAM (counts) and BIN_EDGES,
+        VOLUME also has NEGATIVE, the number of negative volumes
+    '''
+
+    summary = {}
+    for measure in ['VOLUME','ASPECT_RATIO','SKEWNESS']:
+        values = [ m[measure] for m in metrics.values() ]
+        values = np.concatenate(values) if values else np.zeros(0)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            continue
+        counts, edges = np.histogram(values,bins)
+        summary[measure] = { 'MIN'       : values.min()  ,
+                             'MAX'       : values.max()  ,
+                             'MEAN'      : values.mean() ,
+                             'HISTOGRAM' : counts        ,
+                             'BIN_EDGES' : edges          }
+    if 'VOLUME' in summary:
+        summary['VOLUME']['NEGATIVE'] = sum([ int(np.sum(m['VOLUME'] < 0.))
+                                              for m in metrics.values() ])
+
+    return summary
+
+#: def quality_summary()
+
+def has_negative_volume(meshdata):
+    ''' check = SU2.mesh.has_negative_volume(meshdata)
+
+        True at the first chunk of elements with a negative
+        (sub-)volume, for rejecting a deformed mesh before
+        launching the flow solver
+    '''
+    for elem_type, rows, coords in _chunks(meshdata):
+        if np.any( volumes(coords,elem_type,minimum=True) < 0. ):
+            return True
+    return False
+
+#: def has_negative_volume()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+
+## \file parallel.py
+#  \brief parallel reading of SU2 native ascii mesh files
+#  \author SU2 Contributors
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import numpy as np
+import multiprocessing as mp
+from .tools import read_ascii, parse_elements, parse_points, merge_blocks
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+#: bytes of a piece of the element and point blocks parsed by one task
+piece_size = 2**22
+
+
+# -------------------------------------------------------------------
+#  Block Pieces
+# -------------------------------------------------------------------
+class PieceTable(object):
+    ''' block readers for SU2.mesh.read_ascii() which skip the volume
+        element and point blocks, recording them as pieces of
+        complete lines for parallel parsing
+
+        Attributes:
+            ELEM - list of (offset, nbytes, first line) of the elements
+            POIN - list of (offset, nbytes, first line) of the points
+    '''
+
+    def __init__(self):
+        self.ELEM = []
+        self.POIN = []
+
+    @staticmethod
+    def _scan(meshfile,n_lines):
+        pieces = []
+        first  = 0
+        for text in meshfile.read_lines(n_lines,piece_size):
+            pieces.append( ( meshfile.tell() - len(text), len(text), first ) )
+            first += text.count(b'\n')
+        return pieces
+
+    def element_block(self,meshfile,n_elem):
+        self.ELEM = self._scan(meshfile,n_elem)
+        return {}, {}
+
+    def point_block(self,meshfile,n_poin,n_dim):
+        self.POIN = self._scan(meshfile,n_poin)
+        return None
+
+#: class PieceTable
+
+
+# -------------------------------------------------------------------
+#  Piece Parsing Tasks
+# -------------------------------------------------------------------
+def _read_piece(filename,offset,nbytes):
+    with open(filename,'rb') as meshfile:
+        meshfile.seek(offset)
+        return meshfile.read(nbytes)
+
+def _parse_element_piece(task):
+    filename, (offset, nbytes, first) = task
+    return parse_elements(_read_piece(filename,offset,nbytes),first)
+
+def _parse_point_piece(task):
+    filename, (offset, nbytes, first), n_dim, shape, name = task
+    points = parse_points(_read_piece(filename,offset,nbytes),n_dim)
+    if name is None:
+        return points
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape,np.float64,buffer=shm.buf)
+    array[first:first+points.shape[0]] = points
+    del array
+    shm.close()
+    return None
+
+
+# -------------------------------------------------------------------
+#  Parallel Read
+# -------------------------------------------------------------------
+def read_parallel(filename,processes=None,comm=None):
+    ''' meshdata = SU2.mesh.read_parallel(filename,processes=None,comm=None)
+
+        reads an ASCII mesh like SU2.mesh.read(), parsing the volume
+        element and point blocks in pieces of complete lines
+
+        the headers and markers are read serially while the byte
+        ranges of the pieces are recorded, see PieceTable
+
+        inputs:
+            processes - size of the process pool, default all cores,
+                        the points are parsed into shared memory
+            comm      - mpi4py communicator, each rank parses its
+                        contiguous slice of the pieces instead
+
+        with comm, meshdata holds the rank slice: the elements of
+        its pieces (with global ELEM_INDEX) and the points
+        meshdata['POIN_RANGE'] = (first, last+1), markers are
+        complete on every rank
+    '''
+
+    if comm is not None:
+        return _read_mpi(filename,comm)
+
+    pieces = PieceTable()
+    data   = read_ascii(filename,pieces.element_block,pieces.point_block)
+
+    n_dim = data['NDIME']
+    shape = ( data['NPOIN'], n_dim )
+
+    shm = None
+    if shared_memory is not None and data['NPOIN']:
+        shm = shared_memory.SharedMemory(create=True,size=8*shape[0]*shape[1])
+
+    pool = mp.Pool(processes)
+    try:
+        elem_tasks  = [ (filename,piece) for piece in pieces.ELEM ]
+        point_tasks = [ (filename,piece,n_dim,shape,shm and shm.name) for piece in pieces.POIN ]
+        elem_async  = pool.map_async(_parse_element_piece,elem_tasks)
+        point_async = pool.map_async(_parse_point_piece,point_tasks)
+        element_blocks = elem_async.get()
+        point_blocks   = point_async.get()
+    finally:
+        pool.close()
+        pool.join()
+
+    data['ELEM'], data['ELEM_INDEX'] = merge_blocks(element_blocks)
+
+    if shm is not None:
+        data['POIN'] = np.ndarray(shape,np.float64,buffer=shm.buf).copy()
+        shm.close()
+        shm.unlink()
+    elif point_blocks:
+        data['POIN'] = np.concatenate(point_blocks)
+    else:
+        data['POIN'] = np.zeros(shape)
+
+    return data
+
+#: def read_parallel()
+
+def _read_mpi(filename,comm):
+    ''' rank slice of read_parallel() '''
+
+    rank = comm.Get_rank()
+    size = comm.Get_size()
+
+    # headers and markers on the root
+    if rank == 0:
+        pieces = PieceTable()
+        data   = read_ascii(filename,pieces.element_block,pieces.point_block)
+        data, elem_pieces, point_pieces = comm.bcast( (data,pieces.ELEM,pieces.POIN), root=0 )
+    else:
+        data, elem_pieces, point_pieces = comm.bcast( None, root=0 )
+
+    def my_slice(pieces):
+        if not pieces:
+            return []
+        return [ pieces[i] for i in np.array_split(np.arange(len(pieces)),size)[rank] ]
+
+    elem_pieces  = my_slice(elem_pieces)
+    point_pieces = my_slice(point_pieces)
+
+    data['ELEM'], data['ELEM_INDEX'] = merge_blocks(
+        [ _parse_element_piece((filename,piece)) for piece in elem_pieces ] )
+
+    n_dim  = data['NDIME']
+    points = [ _parse_point_piece((filename,piece,n_dim,None,None)) for piece in point_pieces ]
+    if points:
+        data['POIN'] = np.concatenate(points)
+        first = point_pieces[0][2]
+    else:
+        data['POIN'] = np.zeros((0,n_dim))
+        first = 0
+    data['POIN_RANGE'] = ( first, first + data['POIN'].shape[0] )
+
+    return data
+
+#: def _read_mpi()
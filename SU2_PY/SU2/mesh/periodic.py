@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+
+## \file periodic.py
+#  \brief remove halo layers from SU2 native ascii mesh files
+#         preprocessed by SU2_MSH for periodic calcs prior to v7
+#  \author T. Economon
+#  \version 7.0.7 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import shutil, tempfile
+import numpy as np
+from .tools import MeshFile, elem_nodes
+
+#: number of nodes by VTK type, for array lookups
+_nodes_of_type = np.zeros(max(elem_nodes.keys())+1,np.int64)
+for _type, _nodes in elem_nodes.items():
+    _nodes_of_type[_type] = _nodes
+
+#: bytes of a filtered element block kept in memory before spooling to disk
+spool_size = 2**26
+
+
+# -------------------------------------------------------------------
+#  Find Periodic Points
+# -------------------------------------------------------------------
+def find_periodic_points(filename):
+    ''' numbers, periodic, n_send_receive = find_periodic_points(filename)
+
+        first pass over the mesh file, finds the periodic halo
+        points, which are the even periodic index entries of the
+        receiving (SEND_TO= -1) SEND_RECEIVE markers
+
+        outputs:
+            numbers        dictionary of NDIME, NELEM, NPOIN, NMARK
+            periodic       sorted array of periodic point numbers
+            n_send_receive number of SEND_RECEIVE markers
+    '''
+
+    numbers  = {}
+    periodic = []
+    n_send_receive = 0
+
+    meshfile = MeshFile(filename)
+
+    while True:
+
+        line = meshfile.readline()
+        if not line:
+            break
+
+        if "NDIME=" in line:
+            numbers['NDIME'] = int( line.split("=")[1].strip() )
+
+        elif "NELEM=" in line:
+            numbers['NELEM'] = int( line.split("=")[1].strip() )
+            meshfile.skip_lines(numbers['NELEM'])
+
+        elif "NPOIN=" in line:
+            numbers['NPOIN'] = int( line.split("=")[1].split()[0] )
+            meshfile.skip_lines(numbers['NPOIN'])
+
+        elif "NMARK=" in line:
+            numbers['NMARK'] = int( line.split("=")[1].strip() )
+
+        elif "MARKER_TAG=" in line:
+            tag   = line.split("=")[1].strip()
+            line  = meshfile.readline()
+            nelem = int( line.split("=")[1].strip() )
+
+            if "SEND_RECEIVE" in tag:
+                n_send_receive += 1
+                line    = meshfile.readline()
+                send_to = int( line.split("=")[1].strip() )
+
+                # the periodic nodes are in the receive BC and will have an even index
+                if send_to == -1:
+                    for text in meshfile.read_lines(nelem):
+                        rows = np.fromstring(text,dtype=np.int64,sep=' ').reshape(-1,3)
+                        periodic.append( rows[ rows[:,2] % 2 == 0 , 1 ] )
+                    continue
+
+            meshfile.skip_lines(nelem)
+
+    meshfile.close()
+
+    if periodic:
+        periodic = np.unique(np.concatenate(periodic))
+    else:
+        periodic = np.zeros(0,np.int64)
+
+    return numbers, periodic, n_send_receive
+
+#: def find_periodic_points()
+
+
+# -------------------------------------------------------------------
+#  Filter Element Lines
+# -------------------------------------------------------------------
+def filter_halo_lines(text,halo):
+    ''' text, n_kept = filter_halo_lines(text,halo)
+
+        removes the element lines "type nodes... [index]" of a chunk
+        of complete lines which have a node marked in the boolean
+        array halo
+    '''
+
+    flat = np.fromstring(text.replace(b'\n',b' -1 '),dtype=np.int64,sep=' ')
+
+    ends   = np.flatnonzero(flat < 0)
+    starts = np.empty_like(ends)
+    starts[0:1] = 0
+    starts[1:]  = ends[:-1] + 1
+
+    # node entries follow the type, blank lines have no nodes
+    types   = np.where( ends > starts, flat[starts], 0 )
+    n_nodes = _nodes_of_type[types]
+    marks   = np.zeros(flat.shape[0]+1,np.int64)
+    np.add.at(marks,starts+1, 1)
+    np.add.at(marks,starts+1+n_nodes,-1)
+    is_node = np.cumsum(marks[:-1]) > 0
+
+    # halo nodes of each line
+    is_halo = np.zeros(flat.shape[0]+1,np.int64)
+    is_halo[1:][is_node] = halo[flat[is_node]]
+    is_halo = np.cumsum(is_halo)
+    keep = is_halo[ends] == is_halo[starts]
+
+    # bytes of the kept lines
+    data     = np.frombuffer(text,np.uint8)
+    newlines = np.flatnonzero(data == 10)
+    lengths  = np.diff(np.concatenate([[-1],newlines]))
+
+    return data[np.repeat(keep,lengths)].tobytes(), int(keep.sum())
+
+#: def filter_halo_lines()
+
+
+# -------------------------------------------------------------------
+#  Remove Periodic Halos
+# -------------------------------------------------------------------
+def remove_periodic_halos(filename,output='mesh_no_halo.su2'):
+    ''' remove_periodic_halos(filename,output='mesh_no_halo.su2')
+
+        writes the mesh without the periodic halo points, the
+        elements touching them and the SEND_RECEIVE markers
+
+        the mesh is streamed twice, first to find the periodic
+        points (see find_periodic_points), then to filter the
+        element blocks chunk by chunk, spooling each block until
+        its count is known
+
+        assumes the periodic points are the last points of the mesh
+    '''
+
+    numbers, periodic, n_send_receive = find_periodic_points(filename)
+
+    npoin    = numbers['NPOIN']
+    n_points = npoin - len(periodic)
+
+    if len(periodic) and periodic[0] < n_points:
+        raise Exception('Periodic points are not the last points of the mesh')
+
+    halo = np.zeros(npoin,bool)
+    halo[periodic] = True
+
+    meshfile   = MeshFile(filename)
+    outputfile = open(output,'wb',2**20)
+
+    def write(text):
+        outputfile.write(text.encode())
+
+    def write_filtered(keyword,nelem):
+        # the block is spooled until its count is known
+        n_kept = 0
+        with tempfile.SpooledTemporaryFile(spool_size) as block:
+            for text in meshfile.read_lines(nelem):
+                text, n_chunk = filter_halo_lines(text,halo)
+                block.write(text)
+                n_kept += n_chunk
+            write("%s= %i\n" % (keyword,n_kept))
+            block.seek(0)
+            shutil.copyfileobj(block,outputfile,2**20)
+
+    while True:
+
+        line = meshfile.readline()
+        if not line:
+            break
+
+        if "NDIME=" in line:
+            write("NDIME= %i\n" % numbers['NDIME'])
+
+        # element connectivity, excluding the periodic halos
+        elif "NELEM=" in line:
+            write_filtered("NELEM",numbers['NELEM'])
+
+        # points, excluding the periodic points at the end of the list
+        elif "NPOIN=" in line:
+            write("NPOIN= %i\n" % n_points)
+            n_keep = n_points
+            for text in meshfile.read_lines(npoin):
+                if n_keep <= 0:
+                    continue
+                newlines = np.flatnonzero(np.frombuffer(text,np.uint8) == 10)
+                if len(newlines) > n_keep:
+                    text = text[:newlines[n_keep-1]+1]
+                n_keep -= min(n_keep,len(newlines))
+                outputfile.write(text)
+
+        elif "NMARK=" in line:
+            write("NMARK= %i\n" % (numbers['NMARK'] - n_send_receive))
+
+        # markers, excluding halo elements and the SEND_RECEIVE BCs
+        elif "MARKER_TAG=" in line:
+            tag   = line.split("=")[1].strip()
+            line  = meshfile.readline()
+            nelem = int( line.split("=")[1].strip() )
+
+            if "SEND_RECEIVE" in tag:
+                meshfile.readline()
+                meshfile.skip_lines(nelem)
+                continue
+
+            write("MARKER_TAG= %s\n" % tag)
+            write_filtered("MARKER_ELEMS",nelem)
+
+    meshfile.close()
+    outputfile.close()
+
+    return
+
+#: def remove_periodic_halos()
@@ -25,36 +25,282 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with SU2. If not, see <http://www.gnu.org/licenses/>.
 
-import sys
-if sys.version_info[0] > 2:
-    # In PY3, 'long' and 'int' are unified in 'int' type
-    long = int
+''' SU2 mesh reading and writing
+
+    Since SU2 7.0.7 read() returns NumPy arrays instead of row lists:
+        meshdata['ELEM'] and the marker 'ELEM' are dictionaries of
+        { vtk_type : connectivity array (n, nodes) } and the element
+        indices are in meshdata['ELEM_INDEX'], meshdata['POIN'] is a
+        float array (npoin, ndime). Scripts that iterated the former
+        [ type, nodes..., index ] rows can rebuild them with
+        element_rows(), and the point rows with POIN.tolist().
+'''
 
 # -------------------------------------------------------------------
 #  Imports
 # -------------------------------------------------------------------
 
+# only the binary cache needs the SU2 package, the readers and 
+# writers can be loaded as a standalone module
+
+import os, json
 import numpy as np
 from itertools import islice
 
+# ---------------------------------------------------------------------- 
+#  SU2 Element Types
+# ---------------------------------------------------------------------- 
+
+#: number of nodes of each VTK element type used by SU2
+elem_nodes = { 1  : 1 ,  # vertex
+               3  : 2 ,  # line
+               5  : 3 ,  # triangle
+               9  : 4 ,  # quadrilateral
+               10 : 4 ,  # tetrahedron
+               12 : 8 ,  # hexahedron
+               13 : 6 ,  # prism
+               14 : 5 }  # pyramid
+
+
+# ---------------------------------------------------------------------- 
+#  Buffered Mesh File Reader
+# ---------------------------------------------------------------------- 
+class MeshFile(object):
+    ''' buffered binary reader of an ASCII SU2 mesh file
+        gives single lines for the headers and large chunks of 
+        complete lines for the data blocks
+    '''
+    
+    chunk_size = 2**24
+    
+    def __init__(self,filename):
+        self.file   = open(filename,'rb')
+        self.buffer = b''
+        self.offset = 0  # file position of the buffer start
+        self.pos    = 0  # read position in the buffer
+    
+    def _fill(self):
+        ''' appends the next chunk of the file to the buffer
+            returns False at the end of the file '''
+        data = self.file.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + data
+        self.offset += self.pos
+        self.pos = 0
+        return len(data) > 0
+    
+    def tell(self):
+        ''' file position of the next line '''
+        return self.offset + self.pos
+    
+    def seek(self,position):
+        ''' moves to a file position, which should start a line '''
+        self.file.seek(position)
+        self.buffer = b''
+        self.offset = position
+        self.pos    = 0
+    
+    def readline(self):
+        ''' next line as a string, empty at the end of the file '''
+        while True:
+            i = self.buffer.find(b'\n',self.pos)
+            if i >= 0:
+                line = self.buffer[self.pos:i+1]
+                self.pos = i+1
+                return line.decode()
+            if not self._fill():
+                line = self.buffer[self.pos:]
+                self.pos = len(self.buffer)
+                return line.decode()
+    
+    def read_lines(self,n_lines,max_bytes=None):
+        ''' generator of byte chunks holding the next n_lines lines 
+            chunks hold at most max_bytes bytes unless a single 
+            line is longer (optional)
+        '''
+        while n_lines > 0:
+            data = np.frombuffer(self.buffer,np.uint8)[self.pos:]
+            newlines = np.flatnonzero(data == 10)
+            if len(newlines) == 0:
+                if not self._fill():
+                    if self.pos < len(self.buffer):
+                        # last line without newline
+                        self.buffer += b'\n'
+                        continue
+                    raise Exception('Unexpected end of mesh file')
+                continue
+            count = min(n_lines,len(newlines))
+            if max_bytes:
+                count = min(count,max(1,np.searchsorted(newlines,max_bytes)))
+            end = self.pos + newlines[count-1] + 1
+            chunk = self.buffer[self.pos:end]
+            self.pos = end
+            n_lines -= count
+            yield chunk
+    
+    def skip_lines(self,n_lines):
+        ''' skips the next n_lines lines '''
+        for chunk in self.read_lines(n_lines):
+            pass
+    
+    def close(self):
+        self.file.close()
+    
+#: class MeshFile
+
+
+# ---------------------------------------------------------------------- 
+#  Parse Mesh Data Blocks
+# ---------------------------------------------------------------------- 
+def parse_elements(text,first=0):
+    ''' parses a chunk of element lines into typed arrays
+        input:  text   bytes of complete lines "type nodes... [index]"
+                first  element number of the first line, used if
+                       the lines have no index column
+        output: dictionary { type : (connectivity, index) } with
+                connectivity int32 (int64 if needed) of shape 
+                (n, nodes of type) and index int64 of shape (n,)
+    '''
+    
+    # end of line sentinel, valid entries are non-negative
+    flat = np.fromstring(text.replace(b'\n',b' -1 '),dtype=np.int64,sep=' ')
+    
+    ends   = np.flatnonzero(flat < 0)
+    starts = np.empty_like(ends)
+    starts[0:1] = 0
+    starts[1:]  = ends[:-1] + 1
+    
+    # skip blank lines
+    filled = ends > starts
+    starts = starts[filled]
+    ends   = ends[filled]
+    types  = flat[starts]
+    
+    blocks = {}
+    for elem_type in np.unique(types):
+        if not int(elem_type) in elem_nodes:
+            raise Exception('Unknown element type %i' % elem_type)
+        n_nodes = elem_nodes[int(elem_type)]
+        rows    = np.flatnonzero(types == elem_type)
+        begin   = starts[rows]
+        conn    = flat[ begin[:,None] + np.arange(1,n_nodes+1) ]
+        if np.all( ends[rows] - begin > n_nodes + 1 ):
+            index = flat[begin + n_nodes + 1]
+        else:
+            index = rows + first
+        if conn.size and conn.max() < 2**31:
+            conn = conn.astype(np.int32)
+        blocks[int(elem_type)] = (conn,index)
+    
+    return blocks
+
+#: def parse_elements()
+
+def parse_points(text,n_dim):
+    ''' parses a chunk of point lines "x y [z] [index]"
+        output: float64 array of shape (n, n_dim)
+    '''
+    line   = text[:text.find(b'\n')]
+    n_cols = len(line.split())
+    flat   = np.fromstring(text,dtype=np.float64,sep=' ')
+    if flat.size % n_cols:
+        raise Exception('Inconsistent number of point coordinates')
+    return flat.reshape(-1,n_cols)[:,0:n_dim]
+
+#: def parse_points()
+
+def merge_blocks(chunks):
+    ''' merges parse_elements() outputs of consecutive chunks
+        output: connectivity and index dictionaries by type
+    '''
+    conns   = {}
+    indices = {}
+    for blocks in chunks:
+        for elem_type, (conn,index) in blocks.items():
+            conns.setdefault(elem_type,[]).append(conn)
+            indices.setdefault(elem_type,[]).append(index)
+    for elem_type in conns.keys():
+        conns[elem_type]   = np.concatenate(conns[elem_type])
+        indices[elem_type] = np.concatenate(indices[elem_type])
+    return conns, indices
+
+#: def merge_blocks()
+
+def read_element_block(meshfile,n_elem):
+    ''' reads the next n_elem element lines of a MeshFile
+        output: connectivity and index dictionaries by type
+    '''
+    chunks = []
+    first  = 0
+    for text in meshfile.read_lines(n_elem):
+        blocks = parse_elements(text,first)
+        chunks.append(blocks)
+        first += sum([ len(index) for conn,index in blocks.values() ])
+    return merge_blocks(chunks)
+
+def read_point_block(meshfile,n_poin,n_dim):
+    ''' reads the next n_poin point lines of a MeshFile
+        output: float64 array of shape (n_poin, n_dim)
+    '''
+    chunks = [ parse_points(text,n_dim) for text in meshfile.read_lines(n_poin) ]
+    if not chunks:
+        return np.zeros((0,n_dim))
+    return np.concatenate(chunks)
+
+
 # ---------------------------------------------------------------------- 
 #  Read SU2 Mesh File
 # ---------------------------------------------------------------------- 
-def read(filename,scale=1.0):
+def read(filename,scale=1.0,cache=False,surface=False):
     ''' imports mesh and builds python dictionary structure 
+        of numpy arrays
         input: filename
                scale: apply scaling factor (optional)
+               cache: load the mesh from its binary cache next to
+                      the mesh file, see read_cached() (optional)
+               surface: only load the markers and their points,
+                        see read_surface() (optional)
         output:
-           meshdata            mesh data dictionary
-           meshdata['NDIME']   number of dimensions
-           meshdata['NELEM']   number of elements
-           meshdata['ELEM']    element array [ type, nodes, index ]
-           meshdata['NPOIN']   number of points
-           meshdata['NMARK']   number of markers
-           meshdata['MARKS']   marker data dictionary
+           meshdata                 mesh data dictionary
+           meshdata['NDIME']        number of dimensions
+           meshdata['NELEM']        number of elements
+           meshdata['ELEM']         element connectivity by VTK type
+                                    { type : int array (n, nodes) }
+           meshdata['ELEM_INDEX']   element index by VTK type
+                                    { type : int array (n,) }
+           meshdata['NPOIN']        number of points
+           meshdata['POIN']         float64 point array (npoin, ndime)
+           meshdata['NMARK']        number of markers
+           meshdata['MARKS']        marker data dictionary
            meshdata['MARKS']['tag_name']           marker data for 'tag_name'
            meshdata['MARKS']['tag_name']['NELEM']  number of elements
-           meshdata['MARKS']['tag_name']['ELEM']   element array [type,nodes]
+           meshdata['MARKS']['tag_name']['ELEM']   element connectivity by type
+           SEND_RECEIVE markers also have 'SEND_TO' and 'ELEM_INDEX'
+        see elem_nodes for the VTK types, and element_rows() for the
+        [ type, nodes..., index ] rows returned before 7.0.7
+    '''
+    
+    if cache:
+        data = read_cached(filename)
+        if surface:
+            data = surface_data(data)
+    elif surface:
+        data = read_surface(filename)
+    else:
+        data = read_ascii(filename)
+    
+    if scale != 1.0:
+        data['POIN'] = data['POIN'] * scale
+    
+    return data
+
+#: def read
+
+def read_ascii(filename,element_block=read_element_block,point_block=read_point_block):
+    ''' parses an ASCII mesh file into the meshdata structure,
+        see read()
+        the volume element and point blocks are handed to 
+        element_block(meshfile,nelem) and 
+        point_block(meshfile,npoin,ndime), which must consume them
     '''
 
     # initialize variables
@@ -62,32 +308,25 @@ def read(filename,scale=1.0):
     marks = {}
 
     # open meshfile
-    meshfile = open(filename,'r')
-    
-    # readline helper functin
-    def mesh_readlines(n_lines=1):
-        fileslice = islice(meshfile,n_lines)
-        return list(fileslice)
+    meshfile = MeshFile(filename)
 
     # scan file until end of file
-    keepon = True
-    while keepon:
+    while True:
 
         # read line
-        line = mesh_readlines()
+        line = meshfile.readline()
 
         # stop if line is empty
         if not line: 
-            keepon = False
             break
         
         # fix white space
-        line = line[0]
         line = line.replace('\t',' ')
+        line = line.replace('\r',' ')
         line = line.replace('\n',' ')
 
         # skip comments
-        if line[0] == "%":
+        if line.lstrip().startswith('%'):
             pass
 
         # number of dimensions
@@ -100,53 +339,25 @@ def read(filename,scale=1.0):
         elif "NELEM=" in line:
             
             # number of elements
-            nelem = long( line.split("=")[1].strip() )
+            nelem = int( line.split("=")[1].strip() )
             # save to SU2_MESH data
             data['NELEM'] = nelem
-            
-            # only read nelem lines
-            fileslice = islice(meshfile,nelem)
-            
-            # the data pattern
-            pattern = tuple( [int] + [long]*9 )
-            
-            # scan next lines for element data
-            elem = [ 
-                [ t(s) for t,s in zip(pattern,line.split()) ] 
-                for line in fileslice 
-            ]
-            
-            # save to SU2_MESH data
-            data['ELEM'] = elem
+            data['ELEM'], data['ELEM_INDEX'] = element_block(meshfile,nelem)
         #: if NELEM
 
         # points
         elif "NPOIN=" in line:
             
             # number of points
-            npoin = long( line.split("=")[1].strip().split(' ')[0] )
+            npoin = int( line.split("=")[1].split()[0] )
             # save to SU2_MESH data
             data['NPOIN'] = npoin
-            
-            # only read npoin lines
-            fileslice = islice(meshfile,npoin)
-            
-            # the data pattern
-            pattern = tuple( [float]*3 ) # + [long] )
-            
-            # scan next lines for element data
-            poin = [ 
-                [ t(s) for t,s in zip(pattern,line.split()) ] 
-                for line in fileslice 
-            ]            
-
-            # save to SU2_MESH data
-            data['POIN'] = poin
+            data['POIN']  = point_block(meshfile,npoin,data['NDIME'])
         #:if NPOIN
 
         # number of markers
         elif "NMARK=" in line:
-            nmark = long( line.split("=")[1].strip() )
+            nmark = int( line.split("=")[1].strip() )
             # save to SU2_MESH data
             data['NMARK'] = nmark
         #:if NMARK
@@ -161,54 +372,183 @@ def read(filename,scale=1.0):
             thismark['TAG'] = thistag
 
             # read number of marker elements
-            line = mesh_readlines()[0]
+            line = meshfile.readline()
             if not "MARKER_ELEMS=" in line:
                 raise Exception("Marker Specification Error")
             
-            # convert string to long int
-            thisnelem = long( line.split("=")[1].strip() )
+            # number of marker elements
+            thisnelem = int( line.split("=")[1].strip() )
             
             # save to SU2_MARK data
             thismark['NELEM'] = thisnelem
             
-            # only read thisnelem lines
-            fileslice = islice(meshfile,thisnelem)
-            
-            # the data pattern
-            pattern = tuple( [int] + [long]*9 )
-            
-            # scan next lines for element data
-            markelem = [ 
-                [ t(s) for t,s in zip(pattern,line.split()) ] 
-                for line in fileslice 
-            ]
-            
-            # save to SU2_MARK data
-            thismark['ELEM'] = markelem
+            # parallel and periodic communication markers
+            if "SEND_RECEIVE" in thistag:
+                line = meshfile.readline()
+                if not "SEND_TO=" in line:
+                    raise Exception("Marker Specification Error")
+                thismark['SEND_TO'] = int( line.split("=")[1].strip() )
+                # the index column holds the periodic transformation
+                thismark['ELEM'],thismark['ELEM_INDEX'] = read_element_block(meshfile,thisnelem)
+            else:
+                thismark['ELEM'],_ = read_element_block(meshfile,thisnelem)
             
             # add to marker list
             marks[thismark['TAG']] = thismark
         #:if MARKER_TAG
 
     #:while not end of file
+    
+    meshfile.close()
 
     # save to SU2_MESH data
     data['MARKS'] = marks
     
     return data
-#: def read
+#: def read_ascii
+
+def element_rows(elems,index=None):
+    ''' rows = element_rows(elems,index=None)
+        the element rows [ type, nodes..., index ] of read() before 
+        7.0.7, from the { type : connectivity } dictionary elems and 
+        optionally the matching { type : index } dictionary, in file 
+        order if index is given, else grouped by type
+    '''
+    rows = []
+    for elem_type, conn in elems.items():
+        columns = [ np.full((conn.shape[0],1),elem_type,np.int64), conn ]
+        if index is not None:
+            columns.append( index[elem_type][:,None] )
+        rows.extend( np.hstack(columns).tolist() )
+    if index is not None:
+        rows.sort(key=lambda row: row[-1])
+    return rows
+
+
+# ---------------------------------------------------------------------- 
+#  Read Surface Mesh
+# ---------------------------------------------------------------------- 
+def point_rows(meshdata,nodes):
+    ''' rows of meshdata['POIN'] holding mesh points nodes,
+        which differ for the surface meshdata of read_surface() '''
+    if 'POIN_INDEX' in meshdata:
+        return np.searchsorted(meshdata['POIN_INDEX'],nodes)
+    return nodes
+
+def marker_nodes(meshdata):
+    ''' sorted unique point numbers of all markers '''
+    nodes = [ conn.ravel() 
+              for this_mark in meshdata['MARKS'].values() 
+              for conn in this_mark['ELEM'].values() ]
+    if not nodes:
+        return np.zeros(0,np.int64)
+    return np.unique(np.concatenate(nodes))
+
+def surface_data(meshdata):
+    ''' reduces meshdata to its markers and their points,
+        see read_surface() '''
+    data = dict(meshdata)
+    data['ELEM']       = {}
+    data['ELEM_INDEX'] = {}
+    data['POIN_INDEX'] = marker_nodes(meshdata)
+    data['POIN']       = np.asarray(meshdata['POIN'])[data['POIN_INDEX']]
+    return data
+
+def read_surface(filename):
+    ''' reads only the markers of an ASCII mesh and the points they 
+        reference, the volume elements are skipped without parsing
+        output: meshdata of read() with empty ELEM, where 
+                meshdata['POIN']        holds the marker points 
+                meshdata['POIN_INDEX']  their sorted point numbers,
+                                        see point_rows()
+        the marker connectivity keeps the mesh point numbers
+    '''
+    
+    block = {}
+    
+    def skip_elements(meshfile,n_elem):
+        meshfile.skip_lines(n_elem)
+        return {}, {}
+    
+    def skip_points(meshfile,n_poin,n_dim):
+        block['POIN'] = ( meshfile.tell(), n_poin, n_dim )
+        meshfile.skip_lines(n_poin)
+        return None
+    
+    data  = read_ascii(filename,skip_elements,skip_points)
+    nodes = marker_nodes(data)
+    
+    # parse the marker point lines only
+    offset, n_poin, n_dim = block['POIN']
+    meshfile = MeshFile(filename)
+    meshfile.seek(offset)
+    first  = 0
+    chunks = []
+    for text in meshfile.read_lines(n_poin):
+        newlines = np.flatnonzero(np.frombuffer(text,np.uint8) == 10)
+        n_lines  = newlines.shape[0]
+        lines    = nodes[ (nodes >= first) & (nodes < first + n_lines) ] - first
+        if lines.shape[0] > n_lines // 8:
+            # dense selection, by a byte mask
+            keep    = np.zeros(n_lines,bool)
+            keep[lines] = True
+            lengths = np.diff(np.concatenate([[-1],newlines]))
+            data_bytes = np.frombuffer(text,np.uint8)[np.repeat(keep,lengths)]
+            chunks.append( parse_points( data_bytes.tobytes(), n_dim ) )
+        elif lines.shape[0]:
+            starts = np.concatenate([[0],newlines+1])[lines].tolist()
+            ends   = (newlines[lines]+1).tolist()
+            chunks.append( parse_points( b''.join([ text[i:j] for i,j in zip(starts,ends) ]), n_dim ) )
+        first += n_lines
+    meshfile.close()
+    
+    data['POIN_INDEX'] = nodes
+    data['POIN']       = np.concatenate(chunks) if chunks else np.zeros((0,n_dim))
+    
+    return data
+
+#: def read_surface()
 
 
 # ---------------------------------------------------------------------- 
 #  Write SU2 Mesh File
 # ---------------------------------------------------------------------- 
-def write(filename,meshdata,scale=1.0):
+
+#: number of rows formatted at once by write()
+write_chunk = 2**16
+
+def write_rows(outputfile,fmt,rows):
+    ''' writes the rows of a 2D array with a per-row format,
+        formatting write_chunk rows at a time into one buffer
+    '''
+    n_rows = rows.shape[0]
+    for start in range(0,n_rows,write_chunk):
+        chunk = rows[start:start+write_chunk]
+        outputfile.write( (fmt * chunk.shape[0]) % tuple(chunk.ravel().tolist()) )
+
+def write_elements(outputfile,elems,index=None):
+    ''' writes element lines "type nodes... [index]" of a 
+        dictionary { type : connectivity }
+    '''
+    for elem_type, conn in elems.items():
+        columns = [ np.full((conn.shape[0],1),elem_type,np.int64), conn ]
+        if index is not None:
+            columns.append( index[elem_type][:,None] )
+        rows = np.hstack(columns)
+        fmt  = ' '.join(['%i'] * rows.shape[1]) + '\n'
+        write_rows(outputfile,fmt,rows)
+
+def write(filename,meshdata,scale=1.0,binary=False):
     ''' writes meshdata to file
         inputs: filename, meshdata 
+                scale: apply scaling factor (optional)
+                binary: also write the binary side-car file
+                        (see write_binary, optional)
+        note: elements are written grouped by type
     '''
 
     # open file for writing
-    outputfile = open(filename,'w')
+    outputfile = open(filename,'w',buffering=2**20)
 
     # numbers
     ndime = meshdata['NDIME']
@@ -220,18 +560,15 @@ def write(filename,meshdata,scale=1.0):
     # write elements
     outputfile.write("% \n% Inner element connectivity \n% \n")
     outputfile.write("NELEM= %i\n" % meshdata['NELEM'])
-    for elem in meshdata['ELEM']:
-        for num in elem:
-            outputfile.write("%i " % num)
-        outputfile.write("\n")
+    write_elements(outputfile,meshdata['ELEM'],meshdata['ELEM_INDEX'])
 
     # write nodes
+    points = np.asarray(meshdata['POIN'])[:,0:ndime] * scale
+    npoin  = points.shape[0]
     outputfile.write("% \n% Node coordinates \n% \n")
     outputfile.write("NPOIN= %i\n" % meshdata['NPOIN'])
-    for poin in meshdata['POIN']:
-        for inum in range(ndime):
-            outputfile.write("%#18.10e " % (poin[inum]*scale))
-        outputfile.write( "%i\n" % (long(poin[inum+1])) )
+    fmt = "%#18.10e " * ndime + "%i\n"
+    write_rows(outputfile,fmt,np.hstack([points,np.arange(npoin)[:,None]]))
 
     # write markers 
     outputfile.write("% \n% Boundary elements \n% \n")
@@ -240,56 +577,251 @@ def write(filename,meshdata,scale=1.0):
         this_mark = meshdata['MARKS'][mark_tag]
         outputfile.write( "MARKER_TAG= %s\n" % this_mark['TAG'] )
         outputfile.write( "MARKER_ELEMS= %i\n" % this_mark['NELEM'] )
-        for elem in this_mark['ELEM']:
-            for num in elem:
-                outputfile.write("%i " % num)
-            outputfile.write("\n")
+        if 'SEND_TO' in this_mark:
+            outputfile.write( "SEND_TO= %i\n" % this_mark['SEND_TO'] )
+        write_elements(outputfile,this_mark['ELEM'],this_mark.get('ELEM_INDEX'))
 
     # close file
     outputfile.close()
 
+    # binary side-car
+    if binary:
+        write_binary(binary_filename(filename),meshdata,scale)
+
     return
 #: def write
 
 
+# ---------------------------------------------------------------------- 
+#  Binary SU2 Mesh File
+# ---------------------------------------------------------------------- 
+
+#: leading bytes of a binary mesh file
+binary_magic = b'SU2MESHB'
+
+#: byte alignment of the arrays in a binary mesh file
+binary_align = 64
+
+def binary_filename(filename):
+    ''' name of the binary side-car of an ASCII mesh file '''
+    return os.path.splitext(filename)[0] + '.su2bin'
+
+def write_binary(filename,meshdata,scale=1.0,source=None):
+    ''' writes meshdata to a binary mesh file
+        layout: magic, uint64 header length, json header,
+                raw little-endian arrays aligned to binary_align bytes
+        the header holds the numbers, marker tags and for each
+        array its [dtype, shape, offset], plus the optional 
+        source dictionary
+    '''
+    
+    arrays = []
+    
+    def entry(array):
+        array = np.ascontiguousarray(array)
+        array = array.astype(array.dtype.newbyteorder('<'))
+        arrays.append(array)
+        return [ array.dtype.str, list(array.shape), 0 ]
+    
+    header = {}
+    for key in ['NDIME','NELEM','NPOIN','NMARK']:
+        header[key] = int(meshdata[key])
+    header['ELEM'] = [ [ int(t), entry(conn), entry(meshdata['ELEM_INDEX'][t]) ]
+                       for t, conn in meshdata['ELEM'].items() ]
+    points = np.asarray(meshdata['POIN'],np.float64)[:,0:header['NDIME']]
+    header['POIN'] = entry(points * scale)
+    header['MARKS'] = []
+    for this_mark in meshdata['MARKS'].values():
+        index = this_mark.get('ELEM_INDEX')
+        elems = [ [ int(t), entry(conn) ] + ( [ entry(index[t]) ] if index else [] )
+                  for t, conn in this_mark['ELEM'].items() ]
+        header['MARKS'].append( [ this_mark['TAG'], int(this_mark['NELEM']), 
+                                  elems, this_mark.get('SEND_TO') ] )
+    header['SOURCE'] = source or {}
+    
+    # array offsets, header size converges after a few passes
+    entries = list(iter_entries(header))
+    while True:
+        text  = json.dumps(header).encode()
+        start = len(binary_magic) + 8 + len(text)
+        start += -start % binary_align
+        offset = start
+        for e, array in zip(entries,arrays):
+            e[2] = offset
+            offset += array.nbytes
+            offset += -offset % binary_align
+        update = json.dumps(header).encode()
+        if len(update) == len(text):
+            text = update
+            break
+    
+    outputfile = open(filename,'wb')
+    outputfile.write(binary_magic)
+    outputfile.write(np.uint64(len(text)).tobytes())
+    outputfile.write(text)
+    for e, array in zip(entries,arrays):
+        outputfile.write(b'\0' * (e[2] - outputfile.tell()))
+        outputfile.write(array.tobytes())
+    outputfile.close()
+    
+    return
+#: def write_binary
+
+def iter_entries(header):
+    ''' array entries of a binary mesh header in file order '''
+    for elem_type, conn, index in header['ELEM']:
+        yield conn
+        yield index
+    yield header['POIN']
+    for mark in header['MARKS']:
+        for elem in mark[2]:
+            for e in elem[1:]:
+                yield e
+
+def read_binary_header(filename):
+    ''' header dictionary of a binary mesh file, 
+        None if the file is not a binary mesh '''
+    with open(filename,'rb') as inputfile:
+        if inputfile.read(len(binary_magic)) != binary_magic:
+            return None
+        length = int(np.frombuffer(inputfile.read(8),np.uint64)[0])
+        return json.loads(inputfile.read(length).decode())
+
+def read_binary(filename,mmap=False):
+    ''' reads a binary mesh file into the meshdata structure of read()
+        input: mmap: memory map the arrays copy-on-write instead 
+                     of loading them, changes are not saved (optional)
+    '''
+    
+    header = read_binary_header(filename)
+    if header is None:
+        raise Exception('%s is not a binary SU2 mesh' % filename)
+    
+    def load(e):
+        dtype, shape, offset = e
+        count = int(np.prod(shape))
+        if mmap:
+            if count == 0:
+                return np.zeros(shape,dtype)
+            return np.memmap(filename,dtype,'c',offset,tuple(shape))
+        with open(filename,'rb') as inputfile:
+            inputfile.seek(offset)
+            return np.fromfile(inputfile,dtype,count).reshape(shape)
+    
+    data = {}
+    for key in ['NDIME','NELEM','NPOIN','NMARK']:
+        data[key] = header[key]
+    data['ELEM']       = {}
+    data['ELEM_INDEX'] = {}
+    for elem_type, conn, index in header['ELEM']:
+        data['ELEM'][elem_type]       = load(conn)
+        data['ELEM_INDEX'][elem_type] = load(index)
+    data['POIN'] = load(header['POIN'])
+    data['MARKS'] = {}
+    for mark in header['MARKS']:
+        tag, nelem, elems = mark[0:3]
+        this_mark = { 'TAG'   : tag   ,
+                      'NELEM' : nelem ,
+                      'ELEM'  : dict([ (elem[0], load(elem[1])) for elem in elems ]) }
+        if len(mark) > 3 and mark[3] is not None:
+            this_mark['SEND_TO']    = mark[3]
+            this_mark['ELEM_INDEX'] = dict([ (elem[0], load(elem[2])) for elem in elems ])
+        data['MARKS'][tag] = this_mark
+    
+    return data
+#: def read_binary
+
+
+# ---------------------------------------------------------------------- 
+#  Binary Mesh Cache
+# ---------------------------------------------------------------------- 
+
+def source_stamp(filename):
+    ''' size, mtime and sha1 hash of a mesh file, saved in the
+        header of its binary cache '''
+    from ..io.store import file_digest
+    info = os.stat(filename)
+    return { 'SIZE'  : info.st_size  ,
+             'MTIME' : info.st_mtime ,
+             'SHA1'  : file_digest(filename) }
+
+def cache_valid(filename,source):
+    ''' checks the source stamp of a binary cache against the 
+        mesh file, the hash is only computed if the mtime changed '''
+    from ..io.store import file_digest
+    info = os.stat(filename)
+    if source.get('SIZE') != info.st_size:
+        return False
+    if source.get('MTIME') == info.st_mtime:
+        return True
+    return source.get('SHA1') == file_digest(filename)
+
+def read_cached(filename):
+    ''' reads a mesh through its binary cache
+        the cache (see binary_filename) is memory mapped when it 
+        matches the mesh file, otherwise the mesh is parsed and 
+        the cache is rewritten
+    '''
+    
+    cache_name = binary_filename(filename)
+    
+    # cache hit
+    if os.path.exists(cache_name):
+        try:
+            header = read_binary_header(cache_name)
+        except Exception:
+            header = None
+        if header and cache_valid(filename,header['SOURCE']):
+            return read_binary(cache_name,mmap=True)
+    
+    # cache miss
+    source = source_stamp(filename)
+    data   = read_ascii(filename)
+    
+    # replace the cache at once for concurrent readers
+    temp_name = '%s.%i' % (cache_name,os.getpid())
+    try:
+        write_binary(temp_name,data,source=source)
+        os.rename(temp_name,cache_name)
+    except (IOError,OSError):
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+    
+    return data
+
+#: def read_cached()
+
+
 # ---------------------------------------------------------------------- 
 #  Get Marker Mesh Points
 # ---------------------------------------------------------------------- 
 def get_markerPoints(meshdata,mark_tags):
     ''' pulls all mesh nodes on markers 
-        checks for duplicates (from edges) '''
+        checks for duplicates (from edges) 
+        outputs: markerpoints  float array (n, ndime)
+                 markernodes   sorted int array (n,) of node numbers
+    '''
 
     # marker tags should be a list
     if not isinstance(mark_tags,list):
         mark_tags = [mark_tags]
 
     # some numbers
-    nmark = meshdata['NMARK']
     ndim  = meshdata['NDIME']
     
-    # list for marker node numbers
-    markernodes  = []
-
-    # scan each marker
-    for this_tag in mark_tags:
-        # current mark
-        this_mark = meshdata['MARKS'][this_tag]
-        # marker elements
-        markelems = this_mark['ELEM']
-        # list for marker nodes
-        marknodes = [ row[1:] for row in markelems ]
-        # add to mesh node list
-        markernodes  = markernodes + marknodes
-    #: for each marker
+    # connectivity of each marker element type
+    markernodes = [ conn.ravel() 
+                    for this_tag in mark_tags
+                    for conn in meshdata['MARKS'][this_tag]['ELEM'].values() ]
 
     # unique check
-    #markernodes = dict(map(lambda i:(i,1),markernodes)).keys()
-    markernodes = np.hstack(markernodes)
-    markernodes = np.unique(markernodes)
-    markernodes = list(markernodes)
+    if markernodes:
+        markernodes = np.unique(np.concatenate(markernodes))
+    else:
+        markernodes = np.zeros(0,np.int64)
 
-    # list for marker points
-    markerpoints = [ meshdata['POIN'][inode][0:ndim] for inode in markernodes ]
+    # marker points
+    markerpoints = np.asarray(meshdata['POIN'])[point_rows(meshdata,markernodes),0:ndim]
 
     return markerpoints, markernodes
 
@@ -306,14 +838,13 @@ def set_meshPoints(meshdata,meshnodes,meshpoints):
               before calling this function
     '''
 
-    n_nodes = len(meshnodes)
     n_dim   = meshdata['NDIME']
 
-    # for each given node, update meshdata['POIN']
-    for ipoint in range(n_nodes):
-        inode = meshnodes[ipoint]
-        for iDim in range(n_dim):
-            meshdata['POIN'][inode][iDim] = meshpoints[ipoint][iDim]
+    meshnodes  = np.asarray(meshnodes,np.int64)
+    meshpoints = np.asarray(meshpoints)
+    
+    # update meshdata['POIN'] of the given nodes
+    meshdata['POIN'][point_rows(meshdata,meshnodes),0:n_dim] = meshpoints[:,0:n_dim]
 
     return meshdata
 
@@ -322,55 +853,143 @@ def set_meshPoints(meshdata,meshnodes,meshpoints):
 # ---------------------------------------------------------------------- 
 #  Sort Airfoil
 # ---------------------------------------------------------------------- 
+def edge_loops(edges):
+    ''' splits line elements into connected loops in linear time
+        input:  edges   int array (m, 2) of point numbers
+        output: list of (points, elems, closed) for each loop
+                points  point numbers in walking order
+                elems   edge numbers in walking order, elems[k] 
+                        joins points[k] and points[k+1] (cyclic 
+                        if closed)
+                closed  False for an open loop, which starts at
+                        one of its ends
+        note: open loops are found first, points may belong to 
+              at most two edges
+    '''
+    
+    edges  = np.asarray(edges)
+    n_edge = edges.shape[0]
+    
+    # local point numbers
+    points, local = np.unique(edges,return_inverse=True)
+    local   = local.reshape(n_edge,2)
+    n_point = points.shape[0]
+    
+    degree = np.bincount(local.ravel(),minlength=n_point)
+    if np.any(degree > 2):
+        raise Exception('Branching edges, points may belong to at most two edges')
+    
+    # the (up to) two edges of each point, -1 if missing
+    ends     = local.T.ravel()
+    edge_id  = np.tile(np.arange(n_edge),2)
+    order    = np.argsort(ends,kind='stable')
+    ends     = ends[order]
+    position = np.arange(2*n_edge) - np.searchsorted(ends,ends)
+    adjacent = np.full((n_point,2),-1,np.int64)
+    adjacent[ends,position] = edge_id[order]
+    
+    adjacent = adjacent.tolist()
+    local    = local.tolist()
+    visited  = [False] * n_edge
+    
+    # walk from the ends of open loops first
+    starts = np.flatnonzero(degree == 1).tolist() + list(range(n_point))
+    
+    loops = []
+    for start in starts:
+        edge = -1
+        for this_edge in adjacent[start]:
+            if this_edge >= 0 and not visited[this_edge]:
+                edge = this_edge
+                break
+        if edge < 0:
+            continue
+        
+        walk_points = [start]
+        walk_edges  = []
+        point = start
+        while edge >= 0 and not visited[edge]:
+            visited[edge] = True
+            walk_edges.append(edge)
+            a, b  = local[edge]
+            point = b if a == point else a
+            walk_points.append(point)
+            first, second = adjacent[point]
+            edge = second if first == edge else first
+        
+        closed = walk_points[-1] == start
+        if closed:
+            walk_points.pop()
+        
+        loops.append( ( points[walk_points], np.array(walk_edges,np.int64), closed ) )
+    
+    return loops
+
+#: def edge_loops()
+
+def sort_loops(mesh_data,marker_name):
+    ''' sorts the xy points of the line elements of a marker into
+        loops, for example the elements of a multi-element airfoil
+        returns list of (points_sorted, loop_sorted, closed) 
+        by decreasing number of points
+          points_sorted  mesh point indeces
+          loop_sorted    marker element indeces, see edge_loops()
+          closed         False for open loops
+        closed loops start at their point of largest x, clockwise
+        open loops start at their end of largest x
+    '''
+    
+    marker_elems = mesh_data['MARKS'][marker_name]['ELEM'][3]
+    points       = mesh_data['POIN']
+    
+    loops = []
+    for loop_points, loop_elems, closed in edge_loops(marker_elems):
+        
+        PX = points[point_rows(mesh_data,loop_points),0:2]   # loop to coord
+        
+        if closed:
+            # start at trailing edge
+            i0 = np.argmax(PX[:,0])
+            loop_points = np.roll(loop_points,-i0)
+            loop_elems  = np.roll(loop_elems ,-i0)
+            PX          = np.roll(PX,-i0,axis=0)
+            
+            # check for clockwise, by signed area
+            area = np.sum( PX[:,0]*np.roll(PX[:,1],-1) - np.roll(PX[:,0],-1)*PX[:,1] )
+            if area > 0:
+                loop_points = np.roll(loop_points[::-1],1)
+                loop_elems  = loop_elems[::-1]
+        
+        else:
+            # start at the end of largest x
+            if PX[-1,0] > PX[0,0]:
+                loop_points = loop_points[::-1]
+                loop_elems  = loop_elems[::-1]
+        
+        loops.append( (loop_points, loop_elems, closed) )
+    
+    loops.sort( key=lambda loop: -len(loop[0]) )
+    
+    return loops
+
+#: def sort_loops()
+
 def sort_airfoil(mesh_data,marker_name):
     ''' sorts xy airfoil points in clockwise loop from trailing edge 
         returns list of mesh point indeces
         assumes:
           - airfoil oriented nearly parallel with x-axis
           - oriented from leading to trailing edge in the +x-direction
-          - one airfoil element with name 'marker_name' 
+          - one airfoil element with name 'marker_name', see
+            sort_loops() for multi-element airfoils
+        an open airfoil loop is sorted from its trailing edge end
     '''
     
-    # find airfoil elements and points
-    airfoil_elems  = mesh_data['MARKS'][marker_name]['ELEM']
-    airfoil_elems  = np.array(airfoil_elems)    
-    airfoil_points = mesh_data['POIN']
-    airfoil_points = np.array(airfoil_points)
-    airfoil_points = airfoil_points[airfoil_elems[:,1],:]
-    n_P,_ = airfoil_elems.shape
-    
-    # build transfer arrays
-    EP = airfoil_elems[:,1:3]    # edge to point
-    PX = airfoil_points[:,0:2]   # point to coord
-    IP = np.arange(0,n_P)        # loop index to point
-    
-    # sorted airfoil point indeces tobe
-    Psort = np.zeros(n_P,long)
-    Isort = np.arange(0,n_P)
-    
-    # find trailing edge
-    iP0 = np.argmax(PX[:,0])
-    P0  = EP[iP0,0]
-    I0  = IP[iP0]
-    Psort[0] = P0
-    
-    # build loop
-    for this_iP in range(1,n_P):
-        P0 = EP[EP[:,0]==P0,1]
-        I0 = IP[EP[:,0]==P0]
-        Psort[this_iP] = P0
-        Isort[this_iP] = I0
-    
-    
-    # check for clockwise
-    D1 = PX[Isort[1],1]  - PX[Isort[0],1]
-    D2 = PX[Isort[-1],1] - PX[Isort[0],1]
-    if D1>D2:   
-        Psort = Psort[-1::-1]
-    
-    # done
-    points_sorted = Psort
-    loop_sorted   = Isort
+    loops = sort_loops(mesh_data,marker_name)
+    if len(loops) != 1:
+        raise Exception('Marker %s has %i loops, see sort_loops()' % (marker_name,len(loops)))
+    
+    points_sorted, loop_sorted, closed = loops[0]
     
     return points_sorted,loop_sorted
 
@@ -67,6 +67,11 @@ class Project(object):
              designs - list of designs
              folder  - project working folder
              results - project design results
+             store   - artifact store of meshes and solutions,
+                       None if disabled with artifacts=False
+             cache   - optional persistent evaluation cache, an
+                       SU2.io.EvalCache or its folder, can be shared
+                       between projects
              
         Methods:
             Optimizer Interface
@@ -93,11 +98,13 @@ class Project(object):
     
     _design_folder = 'DESIGNS/DSN_*'
     _design_number = '%03d'
+    _store_folder  = 'ARTIFACTS'
     
     
     def __init__( self, config, state=None , 
                   designs=None, folder='.' ,
-                  warn = True                ):
+                  warn = True, artifacts = True ,
+                  cache = None                      ):
         
         folder = folder.rstrip('/')+'/'
         if '*' in folder: folder = su2io.next_folder(folder)        
@@ -130,6 +137,10 @@ class Project(object):
             if not group in config.HISTORY_OUTPUT:
                 config.HISTORY_OUTPUT.append(group)
 
+        # setup evaluation cache
+        if isinstance(cache,str):
+            cache = su2io.EvalCache(cache)
+
         # setup state
         if state is None:
             state = su2io.State()
@@ -147,6 +158,8 @@ class Project(object):
         self.designs = designs     # design list
         self.folder  = folder      # project folder
         self.results = su2util.ordered_bunch() # project design results
+        self.store   = None        # artifact store
+        self.cache   = cache       # evaluation cache
 
         # output filenames
         self.filename = 'project.pkl'
@@ -167,6 +180,10 @@ class Project(object):
                 for f in folders: shutil.rmtree(f)
             #: if existing designs
             
+            # start artifact store
+            if artifacts:
+                self.store = su2io.ArtifactStore(self._store_folder)
+            
             # save project
             su2io.save_data(self.filename,self)
             
@@ -188,8 +205,13 @@ class Project(object):
         # list project files to pull and link
         pull,link = state.pullnlink(config)
 
+        # artifacts of designs go to the project store
+        store = getattr(self,'store',None)
+        cache = getattr(self,'cache',None)
+
         # project folder redirection, don't overwrite files
-        with redirect_folder(folder,pull,link,force=False) as push:
+        with redirect_folder(folder,pull,link,force=False) as push, \
+             su2io.store.activate(store), su2io.cache.activate(cache):
 
             # start design
             design = self.new_design(konfig)
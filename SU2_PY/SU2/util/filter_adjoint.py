@@ -32,8 +32,8 @@ import math
 from numpy import pi
 from optparse import OptionParser
 import numpy as np
-import libSU2
-import libSU2_mesh
+from SU2 import io   as su2io
+from SU2 import mesh as su2mesh
 
 # plotting with matplotlib
 try:
@@ -92,7 +92,7 @@ def process_surface_adjoint( config_filename       ,
     lapl_len = 1e-4 # laplace smoothing parameter
     
     # read config file
-    config_data = libSU2.Get_ConfigParams(config_filename)
+    config_data = su2io.Config(config_filename)
     surface_filename = config_data['SURFACE_ADJ_FILENAME'] + '.csv'
     print(surface_filename)
     mesh_filename    = config_data['MESH_FILENAME']
@@ -109,38 +109,23 @@ def process_surface_adjoint( config_filename       ,
                               skip_header = 1      )
     
     # read mesh data
-    mesh_data = libSU2_mesh.Read_Mesh(mesh_filename)
+    mesh_data = su2mesh.read(mesh_filename,surface=True)
     
     # proces adjoint data
-    P      = map(int, adj_data[:,0] )
-    X      = adj_data[:,6].copy()
-    Y      = adj_data[:,7].copy()
-    Sens   = adj_data[:,1].copy()
-    PsiRho = adj_data[:,2].copy()
-    I      = range(0,len(P)) # important - for unsorting durring write
-
-    # store in dict by point index
-    adj_data_dict = dict( zip( P , zip(X,Y,Sens,PsiRho,I) ) )
+    P      = adj_data[:,0].astype(int)
     
     # sort airfoil points
-    iP_sorted,_ = libSU2_mesh.sort_Airfoil(mesh_data,marker_name)
+    iP_sorted,_ = su2mesh.sort_airfoil(mesh_data,marker_name)
     assert(len(iP_sorted) == len(P))
     
-    # rebuild airfoil loop
-    i = 0
-    for this_P in iP_sorted:
-        # the adjoint data entry
-        this_adj_data = adj_data_dict[this_P]
-        # re-sort
-        P[i]      = this_P
-        X[i]      = this_adj_data[0]
-        Y[i]      = this_adj_data[1]
-        Sens[i]   = this_adj_data[2]
-        PsiRho[i] = this_adj_data[3]
-        I[i]      = this_adj_data[4]
-        # next
-        i = i+1
-    #: for each point
+    # rebuild airfoil loop, I is important - for unsorting durring write
+    P_order = np.argsort(P)
+    I       = P_order[ np.searchsorted(P,iP_sorted,sorter=P_order) ]
+    P       = P[I]
+    X       = adj_data[I,6]
+    Y       = adj_data[I,7]
+    Sens    = adj_data[I,1]
+    PsiRho  = adj_data[I,2]
     
     # calculate arc length
     S = np.sqrt( np.diff(X)**2 + np.diff(Y)**2 ) / chord_length
@@ -254,7 +239,7 @@ def process_surface_adjoint( config_filename       ,
     surface_orig.close()
     
     # get list of prefix names
-    prefix_names = libSU2.get_AdjointPrefix(None)
+    prefix_names = su2io.get_adjointSuffix(None)
     prefix_names = prefix_names.values()    
     
     # add filter prefix, before adjoint prefix
@@ -183,7 +183,8 @@ def main():
   if have_MPI:
     comm.barrier()
 
-  # --- Exit cleanly the fluid and solid solvers --- #
+  # --- Exit cleanly the FSI history, the fluid and solid solvers --- #
+  FSIInterface.closeFSIHistory()
   FluidSolver.Postprocessing()
   if myid == rootProcess:
       SolidSolver.exit()
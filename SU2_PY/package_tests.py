@@ -68,6 +68,10 @@ def main():
     #level5()    # working
     
     mesh0()
+    mesh1()
+    io2()
+    io3()
+    mesh2()
     
     print('DONE!')
     
@@ -325,5 +329,277 @@ def mesh0():
         
         
 
+def mesh1():
+    
+    import numpy as np
+    from SU2.mesh import metrics
+    
+    # tetrahedra tested by CPhysicalGeometry::Check_IntElem_Orientation
+    su2_tetras = { 10 : [ [0,1,2,3] ] ,
+                   14 : [ [0,1,2,4] , [2,3,0,4] ] ,
+                   13 : [ [0,2,1,3] , [3,4,5,2] ] ,
+                   12 : [ [0,1,2,5] , [0,2,3,7] , [4,6,5,1] , [4,7,6,3] ] }
+    
+    for elem_type, nodes in metrics.reference_elements.items():
+        coords = np.array(nodes,float)[None]
+        if elem_type in su2_tetras:
+            assert np.all( metrics._tetra_volumes(coords,su2_tetras[elem_type]) > 0. )
+        assert metrics.volumes(coords,elem_type)[0] > 0.
+        assert metrics.volumes(coords,elem_type,minimum=True)[0] > 0.
+        # mirrored element
+        coords[:,:,0] *= -1.
+        assert metrics.volumes(coords,elem_type,minimum=True)[0] < 0.
+    
+    print('mesh1 passed')
+
+def mesh2():
+    
+    import tempfile, shutil
+    import numpy as np
+    
+    def compare(data,ztata):
+        for key in ['NDIME','NELEM','NPOIN','NMARK']:
+            assert data[key] == ztata[key]
+        assert np.array_equal(data['POIN'],ztata['POIN'])
+        for key in ['ELEM','ELEM_INDEX']:
+            assert sorted(data[key].keys()) == sorted(ztata[key].keys())
+            for elem_type in data[key]:
+                assert np.array_equal(data[key][elem_type],ztata[key][elem_type])
+        assert sorted(data['MARKS'].keys()) == sorted(ztata['MARKS'].keys())
+        for tag, this_mark in data['MARKS'].items():
+            that_mark = ztata['MARKS'][tag]
+            assert this_mark['NELEM'] == that_mark['NELEM']
+            assert this_mark.get('SEND_TO') == that_mark.get('SEND_TO')
+            for key in ['ELEM','ELEM_INDEX']:
+                if not key in this_mark: continue
+                for elem_type in this_mark[key]:
+                    assert np.array_equal(this_mark[key][elem_type],that_mark[key][elem_type])
+    
+    # a copy of the mesh, the binary files are written next to it
+    folder = tempfile.mkdtemp()
+    try:
+        
+        mesh_name = os.path.join(folder,'mesh.su2')
+        with open(mesh_name,'w') as output:
+            output.write( 'NDIME= 2\n'
+                          'NELEM= 3\n'
+                          '5 0 1 2 0\n'
+                          '9 1 3 4 2 1\n'
+                          '5 2 4 5 2\n'
+                          'NPOIN= 6\n'
+                          '0.0 0.0 0\n'
+                          '1.0 0.0 1\n'
+                          '0.0 1.0 2\n'
+                          '2.0 0.0 3\n'
+                          '2.0 1.0 4\n'
+                          '1.0 2.0 5\n'
+                          'NMARK= 2\n'
+                          'MARKER_TAG= wall\n'
+                          'MARKER_ELEMS= 3\n'
+                          '3 0 1\n'
+                          '3 1 3\n'
+                          '3 3 4\n'
+                          'MARKER_TAG= SEND_RECEIVE\n'
+                          'MARKER_ELEMS= 2\n'
+                          'SEND_TO= -1\n'
+                          '1 4 2\n'
+                          '1 5 4\n' )
+        
+        data = SU2.mesh.tools.read(mesh_name)
+        assert data['ELEM'][9].shape == (1,4)
+        
+        # round trip
+        binary_name = SU2.mesh.tools.binary_filename(mesh_name)
+        SU2.mesh.tools.write_binary(binary_name,data)
+        compare(data,SU2.mesh.tools.read_binary(binary_name))
+        compare(data,SU2.mesh.tools.read_binary(binary_name,mmap=True))
+        
+        # cache, first read writes it
+        os.remove(binary_name)
+        compare(data,SU2.mesh.tools.read(mesh_name,cache=True))
+        header = SU2.mesh.tools.read_binary_header(binary_name)
+        assert SU2.mesh.tools.cache_valid(mesh_name,header['SOURCE'])
+        compare(data,SU2.mesh.tools.read(mesh_name,cache=True))
+        
+        # a touched mesh is still valid by its hash
+        info = os.stat(mesh_name)
+        os.utime(mesh_name,(info.st_atime,info.st_mtime+10))
+        assert SU2.mesh.tools.cache_valid(mesh_name,header['SOURCE'])
+        
+        # a modified mesh of the same size is not
+        with open(mesh_name) as inputfile:
+            text = inputfile.read()
+        with open(mesh_name,'w') as output:
+            output.write(text.replace('1.0 2.0 5','1.0 3.0 5'))
+        os.utime(mesh_name,(info.st_atime,info.st_mtime+20))
+        assert os.path.getsize(mesh_name) == info.st_size
+        assert not SU2.mesh.tools.cache_valid(mesh_name,header['SOURCE'])
+        
+        ztata = SU2.mesh.tools.read(mesh_name,cache=True)
+        assert ztata['POIN'][5,1] == 3.0
+        compare(SU2.mesh.tools.read(mesh_name),ztata)
+        header = SU2.mesh.tools.read_binary_header(binary_name)
+        assert SU2.mesh.tools.cache_valid(mesh_name,header['SOURCE'])
+        compare(ztata,SU2.mesh.tools.read_binary(binary_name))
+        
+    finally:
+        shutil.rmtree(folder)
+    
+    print('mesh2 passed')
+
+def io2():
+    
+    import tempfile, shutil
+    
+    folder = tempfile.mkdtemp()
+    try:
+        
+        def write_file(name,text):
+            name = os.path.join(folder,name)
+            with open(name,'w') as output:
+                output.write(text)
+            return name
+        
+        mesh = write_file('mesh.su2','NDIME= 2\n')
+        
+        config = SU2.io.Config()
+        config.MESH_FILENAME = mesh
+        config.DV_VALUE_NEW  = [0.0, 0.0]
+        config.MACH_NUMBER   = 0.8
+        
+        cache = SU2.io.EvalCache(os.path.join(folder,'cache'),max_entries=2)
+        key = cache.key(config)
+        
+        # filenames and ignored keys do not change the fingerprint
+        konfig = copy.deepcopy(config)
+        konfig.SOLUTION_FILENAME = 'solution_other.dat'
+        konfig.CONSOLE     = 'QUIET'
+        konfig.NUMBER_PART = 8
+        konfig.MESH_FILENAME = os.path.join(folder,'mesh_copy.su2')
+        shutil.copy(mesh,konfig.MESH_FILENAME)
+        assert cache.key(konfig) == key
+        
+        # the design vector and the starting mesh content do
+        konfig = copy.deepcopy(config)
+        konfig.DV_VALUE_NEW = [0.0, 0.1]
+        assert cache.key(konfig) != key
+        
+        konfig = copy.deepcopy(config)
+        konfig.MESH_FILENAME = write_file('mesh_deform.su2','NDIME= 3\n')
+        assert cache.key(konfig) != key
+        
+        # a deformed mesh has the key of the mesh it starts from
+        cache.remember_deformation(mesh,konfig.MESH_FILENAME)
+        assert cache.key(konfig) == key
+        assert SU2.io.EvalCache(cache.folder).key(konfig) == key
+        
+        # no key without a mesh
+        konfig.MESH_FILENAME = os.path.join(folder,'missing.su2')
+        assert cache.key(konfig) is None
+        assert not cache.restore(None,SU2.io.State())
+        cache.record(None,SU2.io.State())
+        
+        # restore
+        state = SU2.io.State()
+        state.FUNCTIONS.DRAG = 0.01
+        state.FILES.DIRECT   = write_file('solution_flow.dat','0\n')
+        cache.record(key,state)
+        
+        ztate = SU2.io.State()
+        ztate.FUNCTIONS.LIFT = 0.3
+        assert cache.restore(key,ztate)
+        assert ztate.FUNCTIONS.DRAG == 0.01 and ztate.FUNCTIONS.LIFT == 0.3
+        assert ztate.FILES.DIRECT == os.path.realpath(state.FILES.DIRECT)
+        
+        # existing values are kept, missing solution files are not restored
+        os.remove(state.FILES.DIRECT)
+        ztate = SU2.io.State()
+        ztate.FUNCTIONS.DRAG = 0.02
+        assert cache.restore(key,ztate)
+        assert ztate.FUNCTIONS.DRAG == 0.02
+        assert not 'DIRECT' in ztate.FILES
+        assert not cache.restore('0'*40,ztate)
+        
+        # eviction of the least recently used entries
+        keys = [ key ]
+        for dv in [0.1, 0.2]:
+            konfig = copy.deepcopy(config)
+            konfig.DV_VALUE_NEW = [dv, 0.0]
+            keys.append(cache.key(konfig))
+        
+        cache.record(keys[1],state)
+        os.utime(cache._entry_file(keys[0]),(1000,1000))
+        os.utime(cache._entry_file(keys[1]),(1001,1001))
+        cache.record(keys[2],state)
+        assert cache.load(keys[0]) is None
+        
+        os.utime(cache._entry_file(keys[2]),(1002,1002))
+        assert cache.restore(keys[1],SU2.io.State())
+        cache.record(key,state)
+        assert cache.load(keys[2]) is None
+        assert cache.load(key) is not None and cache.load(keys[1]) is not None
+        assert os.path.exists(os.path.join(cache.folder,cache.origins_filename))
+        
+    finally:
+        shutil.rmtree(folder)
+    
+    print('io2 passed')
+
+def io3():
+    
+    import tempfile, shutil
+    
+    folder = tempfile.mkdtemp()
+    try:
+        
+        series = os.path.join(folder,'solution_flow_series')
+        os.makedirs(series)
+        
+        names = []
+        contents = {}
+        for i in range(4):
+            name = 'solution_flow_%05i.dat' % i
+            contents[name] = ( '%i\n' % i * (i*1000) ).encode() + bytes(bytearray(range(256)))
+            with open(os.path.join(series,name),'wb') as output:
+                output.write(contents[name])
+            names.append(name)
+        SU2.io.write_manifest(series,names)
+        assert SU2.io.read_manifest(series) == names
+        
+        pack = SU2.io.pack_series(series)
+        assert pack == series + '.pack'
+        assert list(SU2.io.read_pack_table(pack).keys()) == names
+        
+        # single members
+        for name in [names[2],names[0]]:
+            assert SU2.io.read_packed(pack,name) == contents[name]
+        
+        # the whole folder
+        unpacked = SU2.io.unpack_series(pack,os.path.join(folder,'unpacked'))
+        assert SU2.io.read_manifest(unpacked) == names
+        for name in names:
+            with open(os.path.join(unpacked,name),'rb') as data:
+                assert data.read() == contents[name]
+        
+        # truncated and foreign files are rejected
+        with open(pack,'rb') as data:
+            text = data.read()
+        for bad in [ text[:-1] , text[:len(SU2.io.series._pack_magic)+20] ,
+                     b'NOTSERIES\n' + text[10:] ]:
+            with open(pack,'wb') as output:
+                output.write(bad)
+            try:
+                SU2.io.read_packed(pack,names[-1])
+            except AssertionError:
+                pass
+            else:
+                raise Exception('bad series pack was read')
+        
+    finally:
+        shutil.rmtree(folder)
+    
+    print('io3 passed')
+        
+
 if __name__ == '__main__':
     main()
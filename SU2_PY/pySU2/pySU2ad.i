@@ -60,6 +60,7 @@ threads="1"
 
 namespace std {
    %template() vector<int>;
+   %template() vector<unsigned long>;
    %template() vector<double>;
    %template() vector<string>;
    %template() map<string, int>;